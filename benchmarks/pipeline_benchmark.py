@@ -0,0 +1,274 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the compile -> QIR -> submit -> decode pipeline of AzureBackend.
+
+Each circuit family is run through the stages of the pipeline against a local
+target, recording the wall-clock time and the peak Python memory allocated by
+each stage. Results can be saved as a baseline and later runs compared to it:
+
+    python benchmarks/pipeline_benchmark.py --save baseline.json
+    python benchmarks/pipeline_benchmark.py --compare baseline.json
+
+A comparison exits with status 1 if any stage is slower than the baseline by
+more than the tolerance. Use --quick for a fast smoke run with small circuits.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from pytket.circuit import Circuit, Qubit
+from pytket.circuit.clexpr import ClExpr, ClOp, ClRegVar, WiredClExpr
+from pytket.circuit.logic_exp import reg_eq, reg_gt
+
+from pytket.extensions.azure import (
+    AzureBackend,
+    LocalTarget,
+    LocalWorkspace,
+    QIRCache,
+)
+
+STAGES = ["compile", "qir", "submit", "decode"]
+
+
+def clifford_t(n_qubits: int, depth: int, rng: random.Random) -> Circuit:
+    """Random Clifford+T circuit with all qubits measured."""
+    c = Circuit(n_qubits, n_qubits)
+    for _ in range(depth):
+        qubits = list(range(n_qubits))
+        rng.shuffle(qubits)
+        for a, b in zip(qubits[::2], qubits[1::2], strict=False):
+            c.CX(a, b)
+        for q in range(n_qubits):
+            rng.choice([c.H, c.S, c.T, c.Sdg, c.Tdg])(q)
+    return c.measure_all()
+
+
+def qaoa(n_qubits: int, layers: int, rng: random.Random) -> Circuit:
+    """QAOA for MaxCut on a random graph of average degree three."""
+    edges = [
+        (a, b)
+        for a in range(n_qubits)
+        for b in range(a + 1, n_qubits)
+        if rng.random() < 3 / (n_qubits - 1)
+    ]
+    c = Circuit(n_qubits, n_qubits)
+    for q in range(n_qubits):
+        c.H(q)
+    for _ in range(layers):
+        gamma, beta = rng.random(), rng.random()
+        for a, b in edges:
+            c.ZZPhase(gamma, a, b)
+        for q in range(n_qubits):
+            c.Rx(beta, q)
+    return c.measure_all()
+
+
+def classical(n_qubits: int, rounds: int, rng: random.Random) -> Circuit:
+    """Circuit with wide classical registers, ClExpr arithmetic and
+    conditional gates."""
+    c = Circuit(n_qubits)
+    a = c.add_c_register("a", 32)
+    b = c.add_c_register("b", 32)
+    d = c.add_c_register("d", 32)
+    c.add_c_setreg(rng.randrange(1 << 16), b)
+    for _ in range(rounds):
+        for q in range(n_qubits):
+            c.H(q)
+            c.Measure(Qubit(q), a[q % 32])
+        c.add_clexpr(
+            expr=WiredClExpr(
+                expr=ClExpr(op=ClOp.RegAdd, args=[ClRegVar(0), ClRegVar(1)]),
+                reg_posn={0: list(range(32)), 1: list(range(32, 64))},
+                output_posn=list(range(64, 96)),
+            ),
+            args=a.to_list() + b.to_list() + d.to_list(),
+        )
+        c.add_clexpr(
+            expr=WiredClExpr(
+                expr=ClExpr(op=ClOp.RegXor, args=[ClRegVar(0), ClRegVar(1)]),
+                reg_posn={0: list(range(32)), 1: list(range(32, 64))},
+                output_posn=list(range(32, 64)),
+            ),
+            args=a.to_list() + b.to_list(),
+        )
+        q = rng.randrange(n_qubits)
+        c.X(q, condition=reg_eq(d, rng.randrange(1 << 8)))
+        c.X(q, condition=reg_gt(b, rng.randrange(1 << 8)))
+    return c
+
+
+@dataclass
+class Family:
+    name: str
+    device: str
+    make: Callable[[random.Random], Circuit]
+    n_circuits: int
+    n_shots: int
+
+
+def families(quick: bool) -> list[Family]:
+    scale = 1 if quick else 4
+    return [
+        Family(
+            "clifford_t",
+            "quantinuum.sim.h1-1sc",
+            lambda rng: clifford_t(4 * scale, 10 * scale, rng),
+            4 * scale,
+            100 * scale**2,
+        ),
+        Family(
+            "qaoa",
+            "ionq.simulator",
+            lambda rng: qaoa(4 * scale, scale, rng),
+            4 * scale,
+            100 * scale**2,
+        ),
+        Family(
+            "classical",
+            "quantinuum.sim.h1-1sc",
+            lambda rng: classical(2 * scale, scale, rng),
+            4 * scale,
+            100 * scale**2,
+        ),
+    ]
+
+
+@contextmanager
+def measure(stats: dict[str, dict[str, float]], stage: str) -> Iterator[None]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats[stage] = {"time_s": elapsed, "peak_mb": peak / 2**20}
+
+
+def run_family(family: Family, seed: int) -> dict[str, dict[str, float]]:
+    rng = random.Random(seed)
+    circuits = [family.make(rng) for _ in range(family.n_circuits)]
+    target = LocalTarget(family.device, seed=seed)
+    backend = AzureBackend(
+        family.device,
+        workspace=LocalWorkspace([target]),
+        qir_cache=QIRCache(maxsize=max(1, family.n_circuits)),
+    )
+    stats: dict[str, dict[str, float]] = {}
+    with measure(stats, "compile"):
+        compiled = backend.get_compiled_circuits(circuits)
+    # Modules are translated into the backend's cache, so that the submit stage
+    # below only encodes and uploads them.
+    with measure(stats, "qir"):
+        for c in compiled:
+            backend._circuit_to_qir(c)  # noqa: SLF001
+    with measure(stats, "submit"):
+        handles = backend.process_circuits(compiled, n_shots=family.n_shots)
+    # Histograms are sampled before the decode stage, which only decodes them.
+    for job in target.jobs.values():
+        job.get_results()
+    with measure(stats, "decode"):
+        for h in handles:
+            backend.get_result(h)
+    return stats
+
+
+def run(quick: bool, repeat: int, seed: int) -> dict[str, Any]:
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for family in families(quick):
+        runs = [run_family(family, seed) for _ in range(repeat)]
+        # The fastest of the repeats is the least disturbed by noise.
+        results[family.name] = {
+            stage: {
+                "time_s": min(r[stage]["time_s"] for r in runs),
+                "peak_mb": min(r[stage]["peak_mb"] for r in runs),
+            }
+            for stage in STAGES
+        }
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> bool:
+    """Print the ratio of each measurement to its baseline, and return whether
+    all times are within the tolerance."""
+    ok = True
+    print(f"{'family':<12}{'stage':<10}{'time':>10}{'ratio':>8}{'peak MB':>10}")
+    for name, stages in current["results"].items():
+        for stage, stats in stages.items():
+            base = baseline["results"].get(name, {}).get(stage)
+            if base is None:
+                ratio = math.nan
+            else:
+                ratio = stats["time_s"] / max(base["time_s"], 1e-9)
+            flag = ""
+            if ratio > 1 + tolerance:
+                ok = False
+                flag = "  SLOWER"
+            print(
+                f"{name:<12}{stage:<10}{stats['time_s']:>9.4f}s{ratio:>8.2f}"
+                f"{stats['peak_mb']:>10.2f}{flag}"
+            )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="small circuits")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per family")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="PATH", help="save results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare to a baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown when comparing, defaults to 0.2",
+    )
+    args = parser.parse_args()
+    current = run(args.quick, args.repeat, args.seed)
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(current, fp, indent=2)
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        if baseline.get("quick") != current["quick"]:
+            print("Baseline was recorded with a different --quick setting")
+            return 2
+        return 0 if compare(current, baseline, args.tolerance) else 1
+    print(json.dumps(current["results"], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,4 +16,62 @@
 
 # _metadata.py is copied to the folder after installation.
 from ._metadata import __extension_name__, __extension_version__
-from .backends import AzureBackend, AzureConfig, set_azure_config
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .backends import (
+        AzureBackend,
+        AzureBackendPool,
+        AzureConfig,
+        AzureSubmissionError,
+        CompilationCache,
+        JobRecord,
+        JobStore,
+        LocalTarget,
+        LocalWorkspace,
+        QIRCache,
+        ResultCache,
+        StageRecorder,
+        StageSpan,
+        TargetStatusSnapshot,
+        WorkspaceConfig,
+        clear_workspace_pool,
+        set_azure_config,
+        set_workspace_pool_ttl,
+        uniform_sampler,
+    )
+
+# The backends are imported on first access; see backends/__init__.py.
+__all__ = [
+    "AzureBackend",
+    "AzureBackendPool",
+    "AzureConfig",
+    "AzureSubmissionError",
+    "CompilationCache",
+    "JobRecord",
+    "JobStore",
+    "LocalTarget",
+    "LocalWorkspace",
+    "QIRCache",
+    "ResultCache",
+    "StageRecorder",
+    "StageSpan",
+    "TargetStatusSnapshot",
+    "WorkspaceConfig",
+    "clear_workspace_pool",
+    "set_azure_config",
+    "set_workspace_pool_ttl",
+    "uniform_sampler",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import backends  # noqa: PLC0415
+
+        return getattr(backends, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -14,5 +14,56 @@
 
 """Backends for processing pytket circuits with Azure devices"""
 
-from .azure import AzureBackend
-from .config import AzureConfig, set_azure_config
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .azure import (
+        AzureBackend,
+        AzureSubmissionError,
+        clear_workspace_pool,
+        set_workspace_pool_ttl,
+    )
+    from .cache import CompilationCache, QIRCache, ResultCache
+    from .config import AzureConfig, WorkspaceConfig, set_azure_config
+    from .job_store import JobRecord, JobStore
+    from .local import LocalTarget, LocalWorkspace, uniform_sampler
+    from .pool import AzureBackendPool
+    from .target_status import TargetStatusSnapshot
+    from .tracing import StageRecorder, StageSpan
+
+# Submodules are imported on first access to their names, so that importing the
+# package does not load pytket's backend machinery or the Azure Quantum SDK.
+_SUBMODULES = {
+    "AzureBackend": ".azure",
+    "AzureSubmissionError": ".azure",
+    "clear_workspace_pool": ".azure",
+    "set_workspace_pool_ttl": ".azure",
+    "CompilationCache": ".cache",
+    "QIRCache": ".cache",
+    "ResultCache": ".cache",
+    "AzureConfig": ".config",
+    "set_azure_config": ".config",
+    "WorkspaceConfig": ".config",
+    "JobRecord": ".job_store",
+    "JobStore": ".job_store",
+    "LocalTarget": ".local",
+    "LocalWorkspace": ".local",
+    "uniform_sampler": ".local",
+    "AzureBackendPool": ".pool",
+    "TargetStatusSnapshot": ".target_status",
+    "StageRecorder": ".tracing",
+    "StageSpan": ".tracing",
+}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return getattr(import_module(_SUBMODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_SUBMODULES))
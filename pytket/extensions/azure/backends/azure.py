@@ -11,23 +11,50 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import json
 import os
+import tempfile
+import threading
+import time
+import uuid
 import warnings
+import weakref
 from ast import literal_eval
-from collections import Counter
-from collections.abc import Sequence
+from collections import Counter, OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field
 from enum import Enum
-from functools import cache
-from typing import Any, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
-from azure.quantum import Job, Workspace
+import numpy as np
 from pytket.backends import Backend, CircuitStatus, ResultHandle, StatusEnum
 from pytket.backends.backend import KwargTypes
-from pytket.backends.backend_exceptions import CircuitNotRunError
+from pytket.backends.backend_exceptions import (
+    CircuitNotRunError,
+    CircuitNotValidError,
+)
 from pytket.backends.backendinfo import BackendInfo
 from pytket.backends.backendresult import BackendResult
 from pytket.backends.resulthandle import _ResultIdTuple
-from pytket.circuit import Circuit, OpType
+from pytket.circuit import Bit, BitRegister, Circuit, OpType, Qubit
 from pytket.extensions.azure._metadata import __extension_version__
 from pytket.passes import (
     AutoRebase,
@@ -52,10 +79,24 @@ from pytket.predicates import (
     NoSymbolsPredicate,
     Predicate,
 )
-from pytket.qir import QIRFormat, QIRProfile, pytket_to_qir
 from pytket.utils import OutcomeArray
 
+from .cache import CompilationCache, QIRCache, ResultCache, circuit_hash
 from .config import AzureConfig
+from .device_catalogue import DeviceCatalogue
+from .job_store import JobRecord, JobStore
+from .local import LocalJob, LocalJobDetails
+from .target_status import TargetStatusCache, TargetStatusSnapshot
+from .tracing import StageSpan, Tracer
+
+if TYPE_CHECKING:
+    # azure.quantum and pytket.qir are slow to import, so they are imported
+    # where they are first used.
+    from azure.quantum import Job, Workspace
+    from pytket.qir import QIRProfile
+    from sympy import Symbol
+
+    from .qir_template import QIRTemplate
 
 
 class DeviceType(Enum):
@@ -67,15 +108,94 @@ class DeviceType(Enum):
     Default = 3
 
 
-def _get_workspace(
+_T = TypeVar("_T")
+
+_WorkspaceKey = tuple[str | None, str | None, str | None, str | None]
+
+
+class _WorkspacePool:
+    """Process-wide pool of objects, such as workspaces and targets, each reused
+    for `ttl_s` seconds after it is created."""
+
+    def __init__(self, ttl_s: float):
+        self.ttl_s = ttl_s
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_s:
+            return cast("_T", entry[1])
+        # Created outside the lock, so a slow connection does not hold up
+        # lookups of other keys.
+        value = factory()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_workspace_pool = _WorkspacePool(ttl_s=3600.0)
+
+_device_catalogue = DeviceCatalogue()
+
+_target_statuses = TargetStatusCache()
+
+# Workspaces given to backends, by id, while they are alive.
+_given_workspaces: "weakref.WeakValueDictionary[int, Any]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def set_workspace_pool_ttl(ttl_s: float) -> None:
+    """Set how long, in seconds, Azure workspaces and targets are reused by
+    backends constructed in this process. Defaults to one hour."""
+    _workspace_pool.ttl_s = ttl_s
+
+
+def clear_workspace_pool() -> None:
+    """Discard the Azure workspaces and targets pooled in this process."""
+    _workspace_pool.clear()
+
+
+def _workspace_key(
     resource_id: str | None = None,
     location: str | None = None,
     connection_string: str | None = None,
-) -> Workspace:
+) -> _WorkspaceKey:
+    return (
+        os.getenv("AZURE_QUANTUM_CONNECTION_STRING"),
+        resource_id,
+        location,
+        connection_string,
+    )
+
+
+def _given_workspace_key(workspace: Any) -> _WorkspaceKey:
+    # Backends given the same workspace share its target statuses, which are
+    # dropped when it is freed, before its id can be reused.
+    key = (f"workspace-{id(workspace)}", None, None, None)
+    if _given_workspaces.get(id(workspace)) is not workspace:
+        _given_workspaces[id(workspace)] = workspace
+        weakref.finalize(workspace, _target_statuses.discard, key)
+    return key
+
+
+def _create_workspace(
+    resource_id: str | None = None,
+    location: str | None = None,
+    connection_string: str | None = None,
+) -> "Workspace":
+    from azure.quantum import Workspace  # noqa: PLC0415
+
     if os.getenv("AZURE_QUANTUM_CONNECTION_STRING") is not None:
         return Workspace()
     config = AzureConfig.from_default_config_file()
-    if config.use_string:
+    if connection_string is not None or config.use_string:
         if connection_string is None:
             connection_string = config.connection_string
         return Workspace.from_connection_string(connection_string)
@@ -86,6 +206,23 @@ def _get_workspace(
     return Workspace(resource_id=resource_id, location=location)
 
 
+def _get_workspace(
+    resource_id: str | None = None,
+    location: str | None = None,
+    connection_string: str | None = None,
+) -> "Workspace":
+    return _workspace_pool.get(
+        ("workspace", _workspace_key(resource_id, location, connection_string)),
+        partial(_create_workspace, resource_id, location, connection_string),
+    )
+
+
+def _get_target(workspace_key: _WorkspaceKey, workspace: "Workspace", name: str) -> Any:
+    return _workspace_pool.get(
+        ("target", workspace_key, name), partial(workspace.get_targets, name=name)
+    )
+
+
 _GATE_SET = {
     OpType.CX,
     OpType.CY,
@@ -129,17 +266,719 @@ _QUANTINUUM_TARGET_GATESET = {
 _ALL_GATES = _ADDITIONAL_GATES.copy()
 _ALL_GATES.update(_GATE_SET)
 
+_QIR_INT_TYPE = 64
+
+
+def _rebase_pass(device_type: DeviceType) -> BasePass:
+    if device_type == DeviceType.Quantinuum:
+        return AutoRebase(
+            _QUANTINUUM_TARGET_GATESET,
+            allow_swaps=True,
+        )
+    return AutoRebase(gateset=_GATE_SET)
+
+
+def _default_compilation_pass(
+    device_type: DeviceType, optimisation_level: int, timeout: int
+) -> BasePass:
+    assert optimisation_level in range(4)
+
+    if device_type != DeviceType.Quantinuum:
+        return _rebase_pass(device_type)
+
+    passlist = [
+        DecomposeBoxes(),
+        scratch_reg_resize_pass(),
+    ]
+    squash = AutoSquash({OpType.Rx, OpType.Rz})
+    target_2qb_gate = OpType.ZZPhase
+    assert target_2qb_gate is not None
+    decomposition_passes = [
+        NormaliseTK2(),
+        DecomposeTK2(
+            allow_swaps=True,
+            ZZPhase_fidelity=1.0,
+        ),
+    ]
+
+    if optimisation_level == 0:
+        passlist.append(_rebase_pass(device_type))
+    elif optimisation_level == 1:
+        passlist.append(SynthesiseTK())
+        passlist.extend(decomposition_passes)
+        passlist.extend(
+            [
+                _rebase_pass(device_type),
+                ZZPhaseToRz(),
+                RemoveRedundancies(),
+                squash,
+                RemoveRedundancies(),
+            ]
+        )
+    elif optimisation_level == 2:  # noqa: PLR2004
+        passlist.append(
+            FullPeepholeOptimise(
+                allow_swaps=True,
+                target_2qb_gate=OpType.TK2,
+            )
+        )
+        passlist.extend(decomposition_passes)
+        passlist.extend(
+            [
+                _rebase_pass(device_type),
+                RemoveRedundancies(),
+                squash,
+                RemoveRedundancies(),
+            ]
+        )
+    else:
+        passlist.extend(
+            [
+                RemoveBarriers(),
+                AutoRebase(
+                    {
+                        OpType.Z,
+                        OpType.X,
+                        OpType.Y,
+                        OpType.S,
+                        OpType.Sdg,
+                        OpType.V,
+                        OpType.Vdg,
+                        OpType.H,
+                        OpType.CX,
+                        OpType.CY,
+                        OpType.CZ,
+                        OpType.SWAP,
+                        OpType.Rz,
+                        OpType.Rx,
+                        OpType.Ry,
+                        OpType.T,
+                        OpType.Tdg,
+                        OpType.ZZMax,
+                        OpType.ZZPhase,
+                        OpType.XXPhase,
+                        OpType.YYPhase,
+                    }
+                ),
+                GreedyPauliSimp(
+                    allow_zzphase=True,
+                    only_reduce=True,
+                    thread_timeout=timeout,
+                    trials=10,
+                ),
+            ]
+        )
+        passlist.extend(decomposition_passes)
+        passlist.extend(
+            [
+                _rebase_pass(device_type),
+                RemoveRedundancies(),
+                squash,
+                RemoveRedundancies(),
+            ]
+        )
+    passlist.append(RemovePhaseOps())
+
+    passlist.append(FlattenRelabelRegistersPass("q"))
+    return SequencePass(passlist)
+
+
+def _compile_from_dict(
+    circuit_dict: dict[str, Any],
+    device_type: str,
+    optimisation_level: int,
+    timeout: int,
+) -> dict[str, Any]:
+    # Runs in worker processes: circuits are passed in serialised form.
+    c = Circuit.from_dict(circuit_dict)
+    _default_compilation_pass(
+        DeviceType[device_type], optimisation_level, timeout
+    ).apply(c)
+    return c.to_dict()
+
+
+def _timed(fn: Callable[..., _T], *args: Any) -> tuple[_T, float, float]:
+    # Also runs in worker processes, so the times are wall-clock times.
+    start = time.time()
+    result = fn(*args)
+    return result, start, time.time()
+
+
+def _pytket_to_qir(c: Circuit, profile: "QIRProfile") -> str:
+    from pytket.qir import QIRFormat, pytket_to_qir  # noqa: PLC0415
+
+    module = pytket_to_qir(
+        c,
+        qir_format=QIRFormat.STRING,
+        int_type=_QIR_INT_TYPE,
+        cut_pytket_register=False,
+        profile=profile,
+    )
+    assert isinstance(module, str)
+    return module
+
+
+_QIR_PAYLOADS = ("text", "bitcode", "gzip")
+
+
+def _encode_qir(module: str, payload: str) -> str | bytes:
+    """Encode a textual QIR module for upload."""
+    if payload == "bitcode":
+        import pyqir  # noqa: PLC0415
+
+        return pyqir.Module.from_ir(pyqir.Context(), module).bitcode
+    if payload == "gzip":
+        return gzip.compress(module.encode(), compresslevel=6)
+    return module
+
+
+def _qir_from_dict(circuit_dict: dict[str, Any], profile: str) -> str:
+    # Runs in worker processes: circuits are passed in serialised form.
+    from pytket.qir import QIRProfile  # noqa: PLC0415
+
+    return _pytket_to_qir(Circuit.from_dict(circuit_dict), QIRProfile[profile])
+
+
+def _split_shots(n_shots: int, max_shots: int | None) -> list[int]:
+    """Split `n_shots` as evenly as possible into chunks of at most
+    `max_shots`."""
+    if max_shots is None or n_shots <= max_shots:
+        return [n_shots]
+    n_chunks = -(-n_shots // max_shots)
+    size, remainder = divmod(n_shots, n_chunks)
+    return [size + 1] * remainder + [size] * (n_chunks - remainder)
+
+
+# Separates the handles of the chunks in the handle of a split circuit.
+_CHUNK_SEPARATOR = "+"
+
+
+def _chunk_handles(handle: ResultHandle) -> list[ResultHandle] | None:
+    """Handles of the chunks of a split circuit, or None if `handle` is not
+    the handle of a split circuit."""
+    ids = str(handle[0]).split(_CHUNK_SEPARATOR)
+    if len(ids) == 1:
+        return None
+    return [ResultHandle(i) for i in ids]
+
+
+def _merge_results(
+    results: list[BackendResult], c_bits: list[Bit] | None
+) -> BackendResult:
+    """Merge the counts of the results of the chunks of a split circuit."""
+    counts: Counter[tuple[int, ...]] = Counter()
+    for result in results:
+        counts.update(result.get_counts())
+    keys = list(counts)
+    readouts = np.array(keys, dtype=np.uint8).reshape(
+        len(keys), len(keys[0]) if keys else 0
+    )
+    return BackendResult(
+        counts=_counts_from_readouts(readouts, list(counts.values())), c_bits=c_bits
+    )
+
+
+@dataclass
+class _Packing:
+    """Which part of the results of a job shared with other circuits belongs to
+    a circuit: the position of its bits among the decoded bits of a program
+    packing several circuits, or its slice of the shots of a job coalescing
+    identical circuits."""
+
+    # Columns of the circuit's bits, or None if it has all the bits.
+    columns: list[int] | None
+    # Registers of the program, if its results are keyed on registers.
+    c_regs: list[BitRegister] | None
+    # Handles of all the circuits in the program, once they are registered.
+    handles: list[ResultHandle] = field(default_factory=list)
+    # Offset and number of the circuit's shots among the shuffled shots of the
+    # job, or None if it has all the shots.
+    shots: tuple[int, int] | None = None
+
+
+# A program to submit: its circuit, its number of shots, and the indices of the
+# circuits it holds, each with its packing (None for an unpacked circuit).
+_Program = tuple[Circuit, int, list[tuple[int, _Packing | None]]]
+
+
+def _pack_circuits(
+    circuits: list[Circuit],
+    n_shots_list: list[int],
+    max_qubits: int | None,
+    by_register: bool,
+) -> list[_Program]:
+    """Pack circuits run for the same number of shots side by side, on disjoint
+    qubits and registers, into programs of at most `max_qubits` qubits.
+
+    Circuits are packed greedily in order; a circuit wider than `max_qubits` is
+    submitted alone. If `max_qubits` is None, every circuit is submitted alone.
+    """
+    if max_qubits is None:
+        return [
+            (c, n_shots, [(i, None)])
+            for i, (c, n_shots) in enumerate(zip(circuits, n_shots_list, strict=True))
+        ]
+    groups: list[list[int]] = []
+    open_groups: dict[int, tuple[list[int], int]] = {}
+    for i, (c, n_shots) in enumerate(zip(circuits, n_shots_list, strict=True)):
+        members, width = open_groups.get(n_shots, ([], 0))
+        if members and width + c.n_qubits > max_qubits:
+            members, width = [], 0
+        if not members:
+            groups.append(members)
+        members.append(i)
+        open_groups[n_shots] = (members, width + c.n_qubits)
+    programs: list[_Program] = []
+    for members in groups:
+        if len(members) == 1:
+            i = members[0]
+            programs.append((circuits[i], n_shots_list[i], [(i, None)]))
+            continue
+        program, packings = _packed_program([circuits[i] for i in members], by_register)
+        programs.append(
+            (
+                program,
+                n_shots_list[members[0]],
+                list(zip(members, packings, strict=True)),
+            )
+        )
+    return programs
+
+
+def _coalesce_circuits(
+    circuits: list[Circuit], n_shots_list: list[int], max_shots: int | None
+) -> tuple[list[_Program], list[int]]:
+    """Coalesce identical circuits into programs run for their summed shots,
+    each of at most `max_shots` shots.
+
+    :return: The coalesced programs, and the indices of the circuits left alone.
+    """
+    duplicates: dict[str, list[int]] = {}
+    for i, c in enumerate(circuits):
+        duplicates.setdefault(circuit_hash(c), []).append(i)
+    programs: list[_Program] = []
+    alone: list[int] = []
+    for indices in duplicates.values():
+        groups: list[list[int]] = []
+        total = 0
+        for i in indices:
+            if not groups or (
+                max_shots is not None and total + n_shots_list[i] > max_shots
+            ):
+                groups.append([])
+                total = 0
+            groups[-1].append(i)
+            total += n_shots_list[i]
+        for members in groups:
+            if len(members) == 1:
+                alone.append(members[0])
+                continue
+            handles: list[ResultHandle] = []
+            shares: list[tuple[int, _Packing | None]] = []
+            offset = 0
+            for i in members:
+                shots = (offset, n_shots_list[i])
+                shares.append((i, _Packing(None, None, handles, shots)))
+                offset += n_shots_list[i]
+            programs.append((circuits[members[0]], offset, shares))
+    return programs, sorted(alone)
+
+
+def _share_counts(
+    shot_counts: list[int], shots: tuple[int, int], job_id: str
+) -> np.ndarray:
+    """Number of times each outcome occurs in a circuit's slice of the shots of
+    a coalesced job.
+
+    The shots are shuffled with a seed taken from the job id, so that every
+    share, in any process, slices the same order and the slices are disjoint.
+    """
+    seed = int.from_bytes(hashlib.sha256(job_id.encode()).digest()[:8], "little")
+    order = np.random.default_rng(seed).permutation(
+        np.repeat(np.arange(len(shot_counts)), shot_counts)
+    )
+    offset, n_shots = shots
+    return np.bincount(order[offset : offset + n_shots], minlength=len(shot_counts))
+
+
+def _packed_program(
+    circuits: list[Circuit], by_register: bool
+) -> tuple[Circuit, list[_Packing]]:
+    program = Circuit()
+    offset = 0
+    renamings: list[dict[str, str]] = []
+    offsets: list[int] = []
+    for k, c in enumerate(circuits):
+        names = {creg.name: f"p{k}_{creg.name}" for creg in c.c_registers}
+        bits = [Bit(names[b.reg_name], b.index[0]) for b in c.bits]
+        units: dict = {q: Qubit("q", offset + j) for j, q in enumerate(c.qubits)}
+        units.update(zip(c.bits, bits, strict=True))
+        renamed = c.copy()
+        renamed.rename_units(units)
+        program.append(renamed)
+        renamings.append(names)
+        offsets.append(offset)
+        offset += c.n_qubits
+    handles: list[ResultHandle] = []
+    if by_register:
+        # Registers are decoded in order, each into as many bits as it has.
+        c_regs = program.c_registers
+        starts = {}
+        start = 0
+        for creg in c_regs:
+            starts[creg.name] = start
+            start += creg.size
+        columns = [
+            [
+                starts[names[creg.name]] + j
+                for creg in c.c_registers
+                for j in range(creg.size)
+            ]
+            for c, names in zip(circuits, renamings, strict=True)
+        ]
+        return program, [_Packing(cols, c_regs, handles) for cols in columns]
+    # Otherwise every qubit is measured at the end of the program, and result j
+    # is that of qubit j, whatever the measurements of the circuit.
+    return program, [
+        _Packing(list(range(start, start + c.n_qubits)), None, handles)
+        for c, start in zip(circuits, offsets, strict=True)
+    ]
+
+
+def _completed_job(
+    target: str, name: str, input_params: dict[str, Any], results: dict[str, Any]
+) -> LocalJob:
+    """Job standing in for one whose results were found in a result cache."""
+    details = LocalJobDetails(
+        id=f"cached-{uuid.uuid4()}",
+        name=name,
+        target=target,
+        status="Succeeded",
+        input_params=input_params,
+        creation_time=datetime.now(timezone.utc),
+        output_data_format="microsoft.quantum-results.v1",
+    )
+    return LocalJob(
+        details,
+        "",
+        sampler=lambda module, n_shots: results,
+        queue_time_s=0.0,
+        run_time_s=0.0,
+        fails=False,
+    )
+
+
+class _Occurrences:
+    """Counts, safely across threads, how many times each key has been seen."""
+
+    def __init__(self) -> None:
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def next(self, key: str) -> int:
+        """Return the number of earlier occurrences of `key`, and count this one."""
+        with self._lock:
+            n = self._counts[key]
+            self._counts[key] = n + 1
+        return n
+
+
+class _RateLimiter:
+    """Spaces out calls to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("max_submissions_per_s must be positive")
+        self._interval = 1 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Number of times a submission refused with HTTP 429 (Too Many Requests) is
+# retried, and the delay before the first retry if the response does not say.
+_THROTTLE_RETRIES = 3
+_THROTTLE_DELAY_S = 1.0
+
+
+def _throttle_delay(e: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying a submission that raised `e`, or None
+    if it was not throttled."""
+    if getattr(e, "status_code", None) != 429:  # noqa: PLR2004
+        return None
+    response = getattr(e, "response", None)
+    retry_after = getattr(response, "headers", {}).get("Retry-After")
+    if retry_after is not None:
+        with contextlib.suppress(ValueError):
+            return float(retry_after)
+    return _THROTTLE_DELAY_S * 2**attempt
+
+
+def _run_submissions(
+    n: int,
+    modules: Iterator[tuple[int, str | BaseException | None]],
+    submit: Callable[[int, str | None], "Job"],
+    max_workers: int | None,
+    executor: ThreadPoolExecutor | None = None,
+) -> tuple[list["Job | None"], dict[int, BaseException]]:
+    # Submit each module as it arrives, on `executor` if given, or else on a
+    # thread pool of its own if `max_workers > 1`. Returns the jobs in input
+    # order and the errors keyed by index.
+    jobs: list[Job | None] = [None] * n
+    errors: dict[int, BaseException] = {}
+    if executor is None and (max_workers is None or max_workers <= 1):
+        for i, module in modules:
+            if isinstance(module, BaseException):
+                errors[i] = module
+                continue
+            try:
+                jobs[i] = submit(i, module)
+            except Exception as e:  # noqa: BLE001
+                errors[i] = e
+        return jobs, errors
+    with (
+        contextlib.nullcontext(executor)
+        if executor is not None
+        else ThreadPoolExecutor(max_workers=max_workers)
+    ) as pool:
+        futures = {}
+        for i, module in modules:
+            if isinstance(module, BaseException):
+                errors[i] = module
+            else:
+                futures[pool.submit(submit, i, module)] = i
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                jobs[i] = future.result()
+            except Exception as e:  # noqa: BLE001
+                errors[i] = e
+    return jobs, errors
+
+
+def _job_spans(job: "Job") -> list[StageSpan]:
+    """Queueing and execution spans from the timestamps recorded on a job."""
+    created = job.details.creation_time
+    begun = job.details.begin_execution_time
+    ended = job.details.end_execution_time
+    spans = []
+    if created is not None and begun is not None:
+        spans.append(StageSpan("queue", created.timestamp(), begun.timestamp()))
+    if begun is not None and ended is not None:
+        spans.append(StageSpan("execution", begun.timestamp(), ended.timestamp()))
+    return spans
+
+
+# Compile spans are held until their circuits are submitted; beyond this many,
+# the oldest are dropped.
+_MAX_HELD_COMPILE_SPANS = 10_000
+
+# Number of QIR templates of symbolic circuits kept by a backend for sweeps; the
+# least recently used are dropped.
+_MAX_QIR_TEMPLATES = 32
+
+_KEY_SEPARATORS = str.maketrans("[](),", "     ")
+
+
+def _parse_result_keys(keys: list[str], width: int | None) -> np.ndarray:
+    """Parse histogram keys such as "[1, 0, 1]" or "(5, 3)" into a 2D array with
+    one row per key.
+
+    All keys are parsed in one pass. Keys that are not plain lists of integers
+    fall back to `literal_eval`.
+    """
+    if width is None:
+        width = len(keys[0].translate(_KEY_SEPARATORS).split()) if keys else 0
+    tokens = " ".join(keys).translate(_KEY_SEPARATORS).split()
+    if len(tokens) == len(keys) * width:
+        try:
+            return np.array(tokens, dtype=np.int64).reshape(len(keys), width)
+        except (ValueError, OverflowError):
+            pass
+    values = np.array([list(literal_eval(key)) for key in keys], dtype=object)
+    assert values.shape == (len(keys), width)
+    return values
+
+
+def _shot_counts(probabilities: list[float], n_shots: int) -> list[int]:
+    return [int(n_shots * p + 0.5) for p in probabilities]
+
+
+def _decode_register_counts(
+    results: dict[str, float], n_shots: int, c_regs: list[BitRegister]
+) -> Counter[OutcomeArray]:
+    """Decode a histogram whose keys hold one integer per classical register.
+
+    Each register value is unpacked, least significant bit first, into as many
+    bits as the register has; the registers are concatenated in order.
+    """
+    return _counts_from_readouts(
+        _register_readouts(results, c_regs),
+        _shot_counts(list(results.values()), n_shots),
+    )
+
+
+def _register_readouts(
+    results: dict[str, float], c_regs: list[BitRegister]
+) -> np.ndarray:
+    keys = list(results)
+    values = _parse_result_keys(keys, len(c_regs))
+    # Bits are taken from the magnitude of each value.
+    values = np.abs(values)
+    columns = [
+        (values[:, [j]] >> np.arange(creg.size)) & 1 for j, creg in enumerate(c_regs)
+    ]
+    if columns:
+        readouts = np.concatenate(columns, axis=1).astype(np.uint8)
+    else:
+        readouts = np.zeros((len(keys), 0), dtype=np.uint8)
+    return readouts
+
+
+def _decode_bit_counts(
+    results: dict[str, float], n_shots: int
+) -> Counter[OutcomeArray]:
+    """Decode a histogram whose keys hold one value per bit."""
+    return _counts_from_readouts(
+        _bit_readouts(results), _shot_counts(list(results.values()), n_shots)
+    )
+
+
+def _bit_readouts(results: dict[str, float]) -> np.ndarray:
+    return _parse_result_keys(list(results), None).astype(np.uint8)
+
+
+def _counts_from_readouts(
+    readouts: np.ndarray, shot_counts: list[int]
+) -> Counter[OutcomeArray]:
+    # One OutcomeArray holds every outcome; each count is keyed on a row of it.
+    # Rows repeat when only some of the decoded bits are kept.
+    outcomes = OutcomeArray.from_readouts(readouts)
+    counts: Counter[OutcomeArray] = Counter()
+    for i, n in enumerate(shot_counts):
+        counts[cast("OutcomeArray", outcomes[i : i + 1])] += n
+    return counts
+
+
+def _write_json(path: str, data: Any) -> None:
+    # Write atomically, so that readers never see a partial file.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as fp:
+        json.dump(data, fp)
+    os.replace(tmp_path, path)
+
+
+def _merge_statuses(statuses: list[CircuitStatus]) -> CircuitStatus:
+    """Status of a circuit run in several parts with the given statuses. It has
+    errored if any part has, and has completed once all have."""
+    for circuit_status in statuses:
+        if circuit_status.status is StatusEnum.ERROR:
+            return circuit_status
+    if all(st.status is StatusEnum.COMPLETED for st in statuses):
+        return CircuitStatus(StatusEnum.COMPLETED)
+    if any(st.status is StatusEnum.RUNNING for st in statuses):
+        return CircuitStatus(StatusEnum.RUNNING)
+    return CircuitStatus(StatusEnum.QUEUED)
+
+
+def _next_poll(  # noqa: PLR0913
+    pending: list[ResultHandle],
+    statuses: list[CircuitStatus],
+    interval: float,
+    min_wait: float,
+    max_wait: float,
+    *,
+    errored: dict[ResultHandle, CircuitStatus],
+) -> tuple[list[ResultHandle], float]:
+    # Return the handles still outstanding after a poll and the interval to wait
+    # before the next one: back off while all are queued, reset once any runs.
+    # Errored handles are added to `errored` and not polled again.
+    still_pending = []
+    running = False
+    for handle, circuit_status in zip(pending, statuses, strict=True):
+        if circuit_status.status is StatusEnum.ERROR:
+            errored[handle] = circuit_status
+        elif circuit_status.status is not StatusEnum.COMPLETED:
+            still_pending.append(handle)
+            running = running or circuit_status.status is StatusEnum.RUNNING
+    if running:
+        return still_pending, min_wait
+    return still_pending, min(2 * interval, max_wait)
+
+
+def _raise_errored(errored: dict[ResultHandle, CircuitStatus]) -> None:
+    if errored:
+        raise RuntimeError(
+            f"{len(errored)} circuits have errored. "
+            + " ".join(f"{h!r}: {st}" for h, st in errored.items())
+        )
+
+
+class AzureSubmissionError(RuntimeError):
+    """Raised when some circuits in a batch could not be submitted.
+
+    Circuits that were submitted successfully are registered with the backend as
+    usual. Their handles are listed in `handles`, in the order of the input
+    circuits, with `None` in place of each circuit that failed; the
+    corresponding exceptions are in `errors`, keyed by circuit index.
+
+    A circuit split into several jobs fails if any of its chunks fails to
+    submit. The handles of the chunks that were submitted are in `partial`,
+    keyed by circuit index; each gives the result of its own chunk.
+    """
+
+    def __init__(
+        self,
+        handles: list[ResultHandle | None],
+        errors: dict[int, BaseException],
+        partial: dict[int, list[ResultHandle]] | None = None,
+    ):
+        super().__init__(
+            f"{len(errors)} of {len(handles)} circuits failed to submit "
+            f"(indices {sorted(errors)})"
+        )
+        self.handles = handles
+        self.errors = errors
+        self.partial = {} if partial is None else partial
+
 
 class AzureBackend(Backend):
     """Interface to Azure Quantum."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0912, PLR0913, PLR0915
         self,
         name: str,
         resource_id: str | None = None,
         location: str | None = None,
         connection_string: str | None = None,
         use_string: bool = False,
+        *,
+        max_workers: int | None = None,
+        qir_cache: QIRCache | None = None,
+        qir_processes: int | None = None,
+        compilation_cache: CompilationCache | None = None,
+        compile_processes: int | None = None,
+        async_concurrency: int = 32,
+        job_store: JobStore | None = None,
+        max_retained_results: int | None = None,
+        result_ttl_s: float | None = None,
+        result_spill_dir: str | None = None,
+        status_ttl_s: float = 30.0,
+        qir_payload: str = "text",
+        pack_qubits: int | None = None,
+        max_shots_per_job: int | None = None,
+        coalesce_shots: bool = False,
+        workspace: Any = None,
+        tracer: Tracer | None = None,
+        max_submissions_per_s: float | None = None,
+        result_cache: ResultCache | None = None,
     ):
         """Construct an Azure backend for a device.
 
@@ -148,6 +987,10 @@ class AzureBackend(Backend):
         `resource_id` and `location` are read from pytket config, if set, or
         else from the provided arguments.
 
+        Workspaces and targets are pooled within the process, so constructing
+        another backend for the same workspace and target makes no network
+        calls. See `set_workspace_pool_ttl()` and `clear_workspace_pool()`.
+
 
         :param name: Device name. Use `AzureBackend.available_devices()` to
             obtain a list of possible device names.
@@ -165,13 +1008,93 @@ class AzureBackend(Backend):
             the environment variable `AZURE_QUANTUM_CONNECTION_STRING` is set in which
             case this is used.
         :param use_string: Use the `connection_string`. Defaults to False.
+        :param max_workers: Default number of circuits to convert and submit
+            concurrently in `process_circuits()`. If None (the default), circuits
+            are submitted one at a time.
+        :param qir_cache: Optional cache of QIR translations, which can be shared
+            between backends. Circuits found in the cache are not translated
+            again.
+        :param qir_processes: Default number of worker processes used to
+            translate circuits to QIR in `process_circuits()`. If None (the
+            default), circuits are translated in the submitting thread.
+        :param compilation_cache: Optional cache of compiled circuits, which can
+            be shared between backends. Circuits found in the cache are not
+            compiled again.
+        :param compile_processes: Default number of worker processes used by
+            `get_compiled_circuits()`. If None (the default), circuits are
+            compiled in this process.
+        :param async_concurrency: Maximum number of blocking Azure calls the
+            asynchronous methods make at once. Defaults to 32.
+        :param job_store: Optional persistent record of submitted jobs. Handles
+            of jobs recorded in the store can be used with any backend for the
+            same target that shares the store, including in another process.
+        :param max_retained_results: Maximum number of finished handles whose
+            results and job bookkeeping are kept in memory. The oldest are
+            evicted first. Handles still in flight, and those whose results a
+            call is returning, are not evicted. Status and result calls on an evicted handle raise `CircuitNotRunError`,
+            unless its result was spilled to `result_spill_dir` or its job is
+            in the `job_store`.
+        :param result_ttl_s: Time in seconds after which the results and job
+            bookkeeping of finished handles are evicted from memory.
+        :param result_spill_dir: Optional directory to which evicted results
+            are written, so that `get_result()` can still return them.
+        :param status_ttl_s: Maximum age in seconds of the target status used by
+            `is_available()` and `average_queue_time_s()`. Defaults to 30.
+        :param qir_payload: Form in which QIR modules are uploaded: "text" (the
+            default) for textual LLVM IR, "bitcode" for LLVM bitcode, or "gzip"
+            for gzip-compressed LLVM IR. Use `payload_size()` to see the number
+            of bytes uploaded for a job.
+        :param pack_qubits: Default maximum number of qubits of the jobs into
+            which `process_circuits()` packs small circuits, placing them side by
+            side on disjoint qubits and registers. If None (the default), each
+            circuit is submitted as its own job.
+        :param max_shots_per_job: Default maximum number of shots per job.
+            `process_circuits()` splits circuits run for more shots into
+            several jobs, whose counts are merged into one result. If None (the
+            default), shots are not split.
+        :param coalesce_shots: Default for whether `process_circuits()`
+            submits identical circuits of a batch as one job, run for their
+            summed shots (up to `max_shots_per_job`), whose shots are then split
+            at random between their handles. Defaults to False.
+        :param workspace: Workspace to use instead of connecting to Azure
+            Quantum, such as a :py:class:`LocalWorkspace` for offline use. The
+            other connection arguments are then ignored.
+        :param tracer: Optional callable receiving, for each handle, a
+            :py:class:`StageSpan` for every stage its circuit went through:
+            "compile" (if compiled by this backend), "qir", "upload", "queue",
+            "execution", "download" and "decode". Spans are passed once the
+            handle exists, and the Azure ones once the result is decoded. A
+            circuit split into several jobs has its compile span passed with
+            its own handle and its other spans with the handles of its chunks.
+            Use a :py:class:`StageRecorder` to keep them in memory.
+        :param max_submissions_per_s: Optional limit on the rate at which this
+            backend submits jobs, to stay within the workspace's quota. Whatever
+            the limit, submissions refused as throttled (HTTP 429) are retried a
+            few times, after the delay the service asks for.
+        :param result_cache: Optional cache of job results, which can be shared
+            between backends. A job whose QIR, shots and input parameters match
+            an entry is not submitted; its handle completes with the cached
+            results at once. Intended for simulators. Such handles are not
+            recorded in the job store.
         """
         super().__init__()
         if use_string:
-            self._workspace = _get_workspace(connection_string=connection_string)
+            resource_id = location = None
+        else:
+            connection_string = None
+        if workspace is None:
+            self._workspace_key = _workspace_key(
+                resource_id, location, connection_string
+            )
+            workspace = _get_workspace(resource_id, location, connection_string)
+            target = _get_target(self._workspace_key, workspace, name)
         else:
-            self._workspace = _get_workspace(resource_id, location)
-        self._target = self._workspace.get_targets(name=name)
+            # A given workspace is not pooled: its targets are looked up
+            # directly.
+            self._workspace_key = _given_workspace_key(workspace)
+            target = workspace.get_targets(name=name)
+        self._workspace = workspace
+        self._target = target
         self._backendinfo = BackendInfo(
             name=type(self).__name__,
             device_name=name,
@@ -179,10 +1102,56 @@ class AzureBackend(Backend):
             architecture=None,
             gate_set=_GATE_SET,
         )
-        _persistent_handles = False
+        self._job_store = job_store
+        if max_retained_results is not None and max_retained_results < 1:
+            raise ValueError("max_retained_results must be at least 1")
+        self._max_retained_results = max_retained_results
+        self._result_ttl_s = result_ttl_s
+        self._result_spill_dir = result_spill_dir
+        if result_spill_dir is not None:
+            os.makedirs(result_spill_dir, exist_ok=True)
+        self._finished: OrderedDict[ResultHandle, float] = OrderedDict()
+        # Handles whose results a call is fetching, which are not evicted.
+        self._retained: Counter[ResultHandle] = Counter()
+        # Chunks of split circuits, kept until merged into their circuit's result.
+        self._unmerged_chunks: set[ResultHandle] = set()
+        self._status_ttl_s = status_ttl_s
+        if qir_payload not in _QIR_PAYLOADS:
+            raise ValueError(
+                f"qir_payload must be one of {_QIR_PAYLOADS}, not {qir_payload!r}"
+            )
+        self._qir_payload = qir_payload
+        self._payload_sizes: dict[ResultHandle, int] = {}
+        self._pack_qubits = pack_qubits
+        self._packings: dict[ResultHandle, _Packing] = {}
+        if max_shots_per_job is not None and max_shots_per_job < 1:
+            raise ValueError("max_shots_per_job must be at least 1")
+        self._max_shots_per_job = max_shots_per_job
+        self._coalesce_shots = coalesce_shots
+        self._tracer = tracer
+        self._result_cache = result_cache
+        # Result cache keys of the submitted jobs, by job id, until they finish.
+        self._result_keys: dict[str, str] = {}
+        self._rate_limiter = (
+            None
+            if max_submissions_per_s is None
+            else _RateLimiter(max_submissions_per_s)
+        )
+        self._compile_spans: OrderedDict[int, tuple[Circuit, StageSpan]] = OrderedDict()
+        self._qir_templates: OrderedDict[str, QIRTemplate] = OrderedDict()
+        self._templates_lock = threading.Lock()
+        self._persistent_handles = job_store is not None
         self._jobs: dict[ResultHandle, Job] = {}
         self._result_bits: dict[ResultHandle, list] = {}
         self._result_c_regs: dict[ResultHandle, list] = {}
+        self._max_workers = max_workers
+        self._qir_cache = qir_cache
+        self._qir_processes = qir_processes
+        self._compilation_cache = compilation_cache
+        self._compile_processes = compile_processes
+        self._async_concurrency = async_concurrency
+        self._async_executor: ThreadPoolExecutor | None = None
+        self._async_lock = threading.Lock()
 
         self._device_type = DeviceType.Default
 
@@ -213,12 +1182,7 @@ using default compilation"
         return OpType.ZZPhase
 
     def rebase_pass(self) -> BasePass:
-        if self._device_type == DeviceType.Quantinuum:
-            return AutoRebase(
-                _QUANTINUUM_TARGET_GATESET,
-                allow_swaps=True,
-            )
-        return AutoRebase(gateset=_GATE_SET)
+        return _rebase_pass(self._device_type)
 
     def default_compilation_pass(
         self, optimisation_level: int = 2, timeout: int = 300
@@ -233,106 +1197,97 @@ using default compilation"
 
         :return: Compilation pass for compiling circuits to Quantinuum devices
         """
-        assert optimisation_level in range(4)
+        return _default_compilation_pass(self._device_type, optimisation_level, timeout)
+
+    def get_compiled_circuit(
+        self, circuit: Circuit, optimisation_level: int = 2, timeout: int = 300
+    ) -> Circuit:
+        """
+        Return a single circuit compiled with :py:meth:`default_compilation_pass`.
+        See :py:meth:`get_compiled_circuits`.
+        """
+        return self.get_compiled_circuits([circuit], optimisation_level, timeout)[0]
 
-        if self._device_type != DeviceType.Quantinuum:
-            return self.rebase_pass()
+    def get_compiled_circuits(
+        self,
+        circuits: Sequence[Circuit],
+        optimisation_level: int = 2,
+        timeout: int = 300,
+        n_processes: int | None = None,
+    ) -> list[Circuit]:
+        """Compile a sequence of circuits with :py:meth:`default_compilation_pass`
+        and return the list of compiled circuits (does not act in place).
 
-        passlist = [
-            DecomposeBoxes(),
-            scratch_reg_resize_pass(),
-        ]
-        squash = AutoSquash({OpType.Rx, OpType.Rz})
-        target_2qb_gate = OpType.ZZPhase
-        assert target_2qb_gate is not None
-        decomposition_passes = [
-            NormaliseTK2(),
-            DecomposeTK2(
-                allow_swaps=True,
-                ZZPhase_fidelity=1.0,
-            ),
-        ]
+        See :py:meth:`pytket.backends.Backend.get_compiled_circuits`. Circuits found
+        in the backend's compilation cache, if it has one, are not compiled again.
 
-        if optimisation_level == 0:
-            passlist.append(self.rebase_pass())
-        elif optimisation_level == 1:
-            passlist.append(SynthesiseTK())
-            passlist.extend(decomposition_passes)
-            passlist.extend(
-                [
-                    self.rebase_pass(),
-                    ZZPhaseToRz(),
-                    RemoveRedundancies(),
-                    squash,
-                    RemoveRedundancies(),
-                ]
-            )
-        elif optimisation_level == 2:  # noqa: PLR2004
-            passlist.append(
-                FullPeepholeOptimise(
-                    allow_swaps=True,
-                    target_2qb_gate=OpType.TK2,
+        :param circuits: The circuits to compile.
+        :param optimisation_level: See :py:meth:`default_compilation_pass`.
+        :param timeout: See :py:meth:`default_compilation_pass`.
+        :param n_processes: Number of worker processes to compile on. Overrides
+            the value given to the constructor. If None or 1, circuits are
+            compiled in this process.
+        :return: Compiled circuits.
+        """
+        if n_processes is None:
+            n_processes = self._compile_processes
+        device_type = self._device_type.name
+        compiled: list[Circuit | None] = [None] * len(circuits)
+        spans: dict[int, StageSpan] = {}
+        keys: dict[int, str] = {}
+        misses = []
+        for i, c in enumerate(circuits):
+            if self._compilation_cache is not None:
+                start = time.time()
+                keys[i] = CompilationCache.key(
+                    c, optimisation_level, timeout, device_type
                 )
-            )
-            passlist.extend(decomposition_passes)
-            passlist.extend(
-                [
-                    self.rebase_pass(),
-                    RemoveRedundancies(),
-                    squash,
-                    RemoveRedundancies(),
+                serialised = self._compilation_cache.get(keys[i])
+                if serialised is not None:
+                    compiled[i] = Circuit.from_dict(json.loads(serialised))
+                    spans[i] = StageSpan("compile", start, time.time())
+                    continue
+            misses.append(i)
+
+        if n_processes is not None and n_processes > 1 and len(misses) > 1:
+            with ProcessPoolExecutor(max_workers=n_processes) as executor:
+                futures = [
+                    executor.submit(
+                        _timed,
+                        _compile_from_dict,
+                        circuits[i].to_dict(),
+                        device_type,
+                        optimisation_level,
+                        timeout,
+                    )
+                    for i in misses
                 ]
-            )
+                compiled_dicts = [future.result() for future in futures]
         else:
-            passlist.extend(
-                [
-                    RemoveBarriers(),
-                    AutoRebase(
-                        {
-                            OpType.Z,
-                            OpType.X,
-                            OpType.Y,
-                            OpType.S,
-                            OpType.Sdg,
-                            OpType.V,
-                            OpType.Vdg,
-                            OpType.H,
-                            OpType.CX,
-                            OpType.CY,
-                            OpType.CZ,
-                            OpType.SWAP,
-                            OpType.Rz,
-                            OpType.Rx,
-                            OpType.Ry,
-                            OpType.T,
-                            OpType.Tdg,
-                            OpType.ZZMax,
-                            OpType.ZZPhase,
-                            OpType.XXPhase,
-                            OpType.YYPhase,
-                        }
-                    ),
-                    GreedyPauliSimp(
-                        allow_zzphase=True,
-                        only_reduce=True,
-                        thread_timeout=timeout,
-                        trials=10,
-                    ),
-                ]
-            )
-            passlist.extend(decomposition_passes)
-            passlist.extend(
-                [
-                    self.rebase_pass(),
-                    RemoveRedundancies(),
-                    squash,
-                    RemoveRedundancies(),
-                ]
-            )
-        passlist.append(RemovePhaseOps())
+            compiled_dicts = [
+                _timed(
+                    _compile_from_dict,
+                    circuits[i].to_dict(),
+                    device_type,
+                    optimisation_level,
+                    timeout,
+                )
+                for i in misses
+            ]
 
-        passlist.append(FlattenRelabelRegistersPass("q"))
-        return SequencePass(passlist)
+        for i, (compiled_dict, start, end) in zip(misses, compiled_dicts, strict=True):
+            compiled[i] = Circuit.from_dict(compiled_dict)
+            spans[i] = StageSpan("compile", start, end)
+            if self._compilation_cache is not None:
+                self._compilation_cache.put(keys[i], json.dumps(compiled_dict))
+        if self._tracer is not None:
+            # Held until the compiled circuits are submitted and get handles.
+            for i, span in spans.items():
+                c = cast("Circuit", compiled[i])
+                self._compile_spans[id(c)] = (c, span)
+            while len(self._compile_spans) > _MAX_HELD_COMPILE_SPANS:
+                self._compile_spans.popitem(last=False)
+        return cast("list[Circuit]", compiled)
 
     @property
     def _result_id_type(self) -> _ResultIdTuple:
@@ -353,7 +1308,38 @@ using default compilation"
         - option_params: a dictionary with string keys and arbitrary values;
           key-value pairs in the dictionary are passed as input parameters to
           the backend. Their semantics are backend-dependent.
+        - max_workers (int): number of circuits to convert and submit
+          concurrently. Overrides the value given to the constructor.
+        - qir_processes (int): number of worker processes used to translate
+          circuits to QIR. Modules are submitted as soon as they are ready.
+          Overrides the value given to the constructor.
+        - pack_qubits (int): pack circuits run for the same number of shots
+          side by side into jobs of at most this many qubits. Each circuit
+          still gets its own handle and result. Overrides the value given to
+          the constructor.
+        - max_shots_per_job (int): split circuits run for more shots than this
+          into chunks submitted as separate, concurrent jobs. The circuit's
+          handle refers to all the chunks, and its result merges their counts.
+          Overrides the value given to the constructor.
+        - coalesce_shots (bool): submit identical circuits as one job run for
+          their summed shots, and split its shots at random between their
+          handles. Each handle's result has as many shots as requested for it.
+          Overrides the value given to the constructor.
+
+        If some circuits fail to submit, the others are still submitted and
+        registered, and an :py:class:`AzureSubmissionError` is raised that holds
+        their handles.
         """
+        return self._process_circuits(circuits, n_shots, valid_check, kwargs)
+
+    def _process_circuits(
+        self,
+        circuits: Sequence[Circuit],
+        n_shots: int | Sequence[int | None] | None,
+        valid_check: bool,
+        kwargs: dict[str, KwargTypes],
+        executor: ThreadPoolExecutor | None = None,
+    ) -> list[ResultHandle]:
         option_params = kwargs.get("option_params")
         circuits = list(circuits)
         n_shots_list = Backend._get_n_shots_as_list(  # noqa: SLF001
@@ -365,49 +1351,489 @@ using default compilation"
         if valid_check:
             self._check_all_circuits(circuits)
 
-        handles = []
-        for i, (c, n_shots) in enumerate(zip(circuits, n_shots_list, strict=False)):  # noqa: PLR1704
-            input_params = {
-                "entryPoint": "main",
-                "arguments": [],
-                "count": n_shots,
-            }
-
-            if self._device_type == DeviceType.Quantinuum:
-                module_bitcode = pytket_to_qir(
-                    c,
-                    qir_format=QIRFormat.STRING,
-                    int_type=64,
-                    cut_pytket_register=False,
-                    profile=QIRProfile.AZUREADAPTIVE,
-                )
+        max_workers = cast("int | None", kwargs.get("max_workers", self._max_workers))
+        qir_processes = cast(
+            "int | None", kwargs.get("qir_processes", self._qir_processes)
+        )
+
+        pack_qubits = cast("int | None", kwargs.get("pack_qubits", self._pack_qubits))
+        max_shots = cast(
+            "int | None", kwargs.get("max_shots_per_job", self._max_shots_per_job)
+        )
+        coalesce = bool(kwargs.get("coalesce_shots", self._coalesce_shots))
+        return self._process(
+            circuits,
+            n_shots_list,
+            option_params,
+            max_workers=max_workers,
+            qir_processes=qir_processes,
+            pack_qubits=pack_qubits,
+            coalesce=coalesce,
+            max_shots=max_shots,
+            executor=executor,
+        )
+
+    def process_sweep(
+        self,
+        circuit: Circuit,
+        points: "Sequence[Mapping[Symbol, float]]",
+        n_shots: int | Sequence[int] | None = None,
+        valid_check: bool = True,
+        **kwargs: KwargTypes,
+    ) -> list[ResultHandle]:
+        """Run a circuit with symbolic parameters at several values of its
+        symbols, submitting a job for each point.
+
+        Compile the symbolic circuit once, with :py:meth:`get_compiled_circuit`.
+        It is then translated to QIR once, as a template into which the gate
+        angles of each point are written, instead of substituting the values
+        and compiling and translating the circuit again for every point. The
+        template is kept for later sweeps of the same circuit. If a template
+        cannot be made for the circuit, each point is translated after its
+        values are substituted.
+
+        Supported kwargs:
+
+        - option_params, max_workers and max_shots_per_job, as for
+          :py:meth:`process_circuits`. Points are neither packed nor coalesced.
+
+        :param circuit: Compiled circuit, whose gates may have symbolic
+            parameters.
+        :param points: Values of all the symbols of the circuit at each point,
+            in half-turns for angles.
+        :param n_shots: Number of shots for every point, or for each point.
+        :param valid_check: Whether to check that the circuit satisfies the
+            predicates of the backend, other than having no symbols.
+        :raises ValueError: if a point has no value for one of the symbols.
+        :return: Handles of the points, in order.
+        """
+        n_shots_list = Backend._get_n_shots_as_list(  # noqa: SLF001
+            n_shots,
+            len(points),
+            optional=False,
+        )
+        if valid_check:
+            for pred in self.required_predicates:
+                if not isinstance(pred, NoSymbolsPredicate) and not pred.verify(
+                    circuit
+                ):
+                    raise CircuitNotValidError(0, repr(pred))
+        template = self._qir_template(circuit)
+        modules = [template.bind(point) for point in points]
+        max_shots = cast(
+            "int | None", kwargs.get("max_shots_per_job", self._max_shots_per_job)
+        )
+        return self._process(
+            [circuit] * len(points),
+            n_shots_list,
+            kwargs.get("option_params"),
+            max_workers=cast(
+                "int | None", kwargs.get("max_workers", self._max_workers)
+            ),
+            qir_processes=None,
+            pack_qubits=None,
+            coalesce=False,
+            max_shots=max_shots,
+            modules=modules,
+        )
+
+    def _qir_template(self, circuit: Circuit) -> "QIRTemplate":
+        from .qir_template import QIRTemplate  # noqa: PLC0415
+
+        key = circuit_hash(circuit)
+        with self._templates_lock:
+            template = self._qir_templates.get(key)
+            if template is not None:
+                self._qir_templates.move_to_end(key)
+                return template
+        # Templates are not put in the QIR cache, since the modules translated
+        # to build them are not those of any circuit.
+        template = QIRTemplate(
+            circuit, partial(_pytket_to_qir, profile=self._qir_profile)
+        )
+        with self._templates_lock:
+            self._qir_templates[key] = template
+            while len(self._qir_templates) > _MAX_QIR_TEMPLATES:
+                self._qir_templates.popitem(last=False)
+        return template
+
+    def _process(  # noqa: PLR0913
+        self,
+        circuits: list[Circuit],
+        n_shots_list: list[int],
+        option_params: Any,
+        *,
+        max_workers: int | None,
+        qir_processes: int | None,
+        pack_qubits: int | None,
+        coalesce: bool,
+        max_shots: int | None,
+        modules: list[str] | None = None,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> list[ResultHandle]:
+        # Circuits run for more than `max_shots` shots are submitted as several
+        # chunks, each with a handle of its own.
+        chunks = [
+            (i, chunk_shots)
+            for i, n in enumerate(n_shots_list)
+            for chunk_shots in _split_shots(n, max_shots)
+        ]
+        chunk_handles, chunk_errors = self._submit_circuits(
+            [circuits[i] for i, _ in chunks],
+            [chunk_shots for _, chunk_shots in chunks],
+            option_params,
+            max_workers=max_workers,
+            qir_processes=qir_processes,
+            pack_qubits=pack_qubits,
+            coalesce=coalesce,
+            max_shots=max_shots,
+            modules=None if modules is None else [modules[i] for i, _ in chunks],
+            executor=executor,
+        )
+
+        handles: list[ResultHandle | None] = [None] * len(circuits)
+        errors: dict[int, BaseException] = {}
+        partial: dict[int, list[ResultHandle]] = {}
+        grouped: dict[int, list[ResultHandle | None]] = {}
+        for j, (i, _) in enumerate(chunks):
+            grouped.setdefault(i, []).append(chunk_handles[j])
+            if j in chunk_errors:
+                errors.setdefault(i, chunk_errors[j])
+        for i, group in grouped.items():
+            if i in errors:
+                submitted = [h for h in group if h is not None]
+                if submitted:
+                    partial[i] = submitted
+                continue
+            if len(group) == 1:
+                handles[i] = group[0]
             else:
-                module_bitcode = pytket_to_qir(
-                    c,
-                    qir_format=QIRFormat.STRING,
-                    int_type=64,
-                    cut_pytket_register=False,
-                    profile=QIRProfile.AZUREBASE,
+                # The handle of a split circuit lists the handles of its chunks.
+                handle = ResultHandle(
+                    _CHUNK_SEPARATOR.join(cast("str", h[0]) for h in group if h)
+                )
+                self._cache[handle] = dict()  # noqa: C408
+                self._unmerged_chunks.update(cast("list[ResultHandle]", group))
+                handles[i] = handle
+        if self._tracer is not None:
+            self._trace_compilation(circuits, handles)
+        if errors:
+            raise AzureSubmissionError(handles, errors, partial) from next(
+                iter(errors.values())
+            )
+        return cast("list[ResultHandle]", handles)
+
+    def _submit_circuits(  # noqa: PLR0913
+        self,
+        circuits: list[Circuit],
+        n_shots_list: list[int],
+        option_params: Any,
+        *,
+        max_workers: int | None,
+        qir_processes: int | None,
+        pack_qubits: int | None,
+        coalesce: bool,
+        max_shots: int | None,
+        modules: list[str] | None = None,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> tuple[list[ResultHandle | None], dict[int, BaseException]]:
+        programs = self._programs(
+            circuits, n_shots_list, pack_qubits, coalesce=coalesce, max_shots=max_shots
+        )
+        payload_sizes = [0] * len(programs)
+        tracing = self._tracer is not None
+        program_spans: list[list[StageSpan]] = [[] for _ in programs]
+        # Programs answered from the result cache, and the number of times each
+        # job has been seen in this batch.
+        cached: set[int] = set()
+        occurrences = _Occurrences()
+
+        def submit(i: int, module: str | None) -> "Job":
+            start = time.time() if tracing else 0.0
+            if module is None:
+                module = self._circuit_to_qir(programs[i][0])
+            key = None
+            if self._result_cache is not None:
+                input_params = self._input_params(programs[i][1], option_params)
+                key = self._result_key(module, input_params, occurrences)
+                results = self._result_cache.get_results(key)
+                if results is not None:
+                    cached.add(i)
+                    return _completed_job(
+                        self._target.name, f"job_{i}", input_params, results
+                    )
+            payload = _encode_qir(module, self._qir_payload)
+            payload_sizes[i] = len(payload)
+            encoded = time.time() if tracing else 0.0
+            job = self._submit_qir(payload, programs[i][1], f"job_{i}", option_params)
+            if key is not None:
+                self._result_keys[job.id] = key
+            if tracing:
+                program_spans[i] += [
+                    StageSpan("qir", start, encoded),
+                    StageSpan("upload", encoded, time.time()),
+                ]
+            return job
+
+        # Each program is paired either with its QIR module, with None if the
+        # module is to be generated in the submitting thread, or with the error
+        # raised while generating it.
+        program_modules: Iterator[tuple[int, str | BaseException | None]]
+        if modules is not None:
+            # Modules given by the caller are those of unpacked, uncoalesced
+            # circuits, so they are paired with the programs in order.
+            program_modules = enumerate(modules)
+        elif qir_processes is not None and qir_processes > 1:
+            program_modules = self._generate_qir_in_processes(
+                [program[0] for program in programs], qir_processes, program_spans
+            )
+        else:
+            program_modules = ((i, None) for i in range(len(programs)))
+
+        jobs, program_errors = _run_submissions(
+            len(programs), program_modules, submit, max_workers, executor
+        )
+
+        handles: list[ResultHandle | None] = [None] * len(circuits)
+        errors: dict[int, BaseException] = {}
+        records: list[tuple[str, JobRecord]] = []
+        for p, (job, size) in enumerate(zip(jobs, payload_sizes, strict=True)):
+            members = programs[p][2]
+            if job is None:
+                errors.update((i, program_errors[p]) for i, _ in members)
+                continue
+            for k, (i, packing) in enumerate(members):
+                # Circuits packed or coalesced into one job get a handle each.
+                handle = ResultHandle(job.id if packing is None else f"{job.id}/{k}")
+                handles[i] = handle
+                record = self._register_handle(
+                    handle,
+                    job,
+                    circuits[i],
+                    n_shots_list[i],
+                    payload_size=size,
+                    packing=packing,
                 )
+                # Jobs answered from the result cache only exist in this backend.
+                if self._job_store is not None and p not in cached:
+                    records.append((cast("str", handle[0]), record))
+        if records:
+            assert self._job_store is not None
+            self._job_store.add(records)
+        if tracing:
+            self._trace_submissions(circuits, handles, programs, program_spans)
+        return handles, errors
 
-            if option_params is not None:
-                input_params.update(option_params)  # type: ignore
-            job = self._target.submit(
-                input_data=module_bitcode,
-                input_data_format="qir.v1",
-                output_data_format="microsoft.quantum-results.v1",
-                name=f"job_{i}",
-                input_params=input_params,
+    def _programs(
+        self,
+        circuits: list[Circuit],
+        n_shots_list: list[int],
+        pack_qubits: int | None,
+        *,
+        coalesce: bool,
+        max_shots: int | None,
+    ) -> list[_Program]:
+        by_register = self._device_type == DeviceType.Quantinuum
+        if not coalesce:
+            return _pack_circuits(circuits, n_shots_list, pack_qubits, by_register)
+        programs, alone = _coalesce_circuits(circuits, n_shots_list, max_shots)
+        # The circuits left alone may still be packed together.
+        for c, n_shots, members in _pack_circuits(
+            [circuits[i] for i in alone],
+            [n_shots_list[i] for i in alone],
+            pack_qubits,
+            by_register,
+        ):
+            programs.append(
+                (c, n_shots, [(alone[j], packing) for j, packing in members])
             )
-            jobid: str = job.id
-            handle = ResultHandle(jobid)
-            handles.append(handle)
-            self._jobs[handle] = job
-            self._result_bits[handle] = c.bits
-            self._result_c_regs[handle] = c.c_registers
-        for handle in handles:
-            self._cache[handle] = dict()  # noqa: C408
-        return handles
+        # Jobs are named after the programs, in the order of their circuits.
+        return sorted(programs, key=lambda program: program[2][0][0])
+
+    def _trace_submissions(
+        self,
+        circuits: list[Circuit],
+        handles: list[ResultHandle | None],
+        programs: list[_Program],
+        program_spans: list[list[StageSpan]],
+    ) -> None:
+        for program, spans in zip(programs, program_spans, strict=True):
+            for i, _ in program[2]:
+                handle = handles[i]
+                if handle is None:
+                    continue
+                self._trace(handle, spans)
+
+    def _trace_compilation(
+        self, circuits: list[Circuit], handles: list[ResultHandle | None]
+    ) -> None:
+        # A circuit split into several jobs was compiled once, so its compile
+        # span goes to its own handle rather than to those of its chunks.
+        for c, handle in zip(circuits, handles, strict=True):
+            held = self._compile_spans.get(id(c))
+            if handle is not None and held is not None:
+                self._trace(handle, [held[1]])
+        for c in circuits:
+            self._compile_spans.pop(id(c), None)
+
+    def _trace(self, handle: ResultHandle, spans: list[StageSpan]) -> None:
+        assert self._tracer is not None
+        try:
+            for span in spans:
+                self._tracer(handle, span)
+        except Exception as e:  # noqa: BLE001
+            # A failing tracer must not lose the handles of submitted jobs.
+            warnings.warn(f"Tracer failed on {handle!r}: {e!r}", stacklevel=2)
+
+    def _register_handle(  # noqa: PLR0913
+        self,
+        handle: ResultHandle,
+        job: "Job",
+        c: Circuit,
+        n_shots: int,
+        *,
+        payload_size: int,
+        packing: _Packing | None,
+    ) -> JobRecord:
+        self._jobs[handle] = job
+        self._payload_sizes[handle] = payload_size
+        self._result_bits[handle] = c.bits
+        self._result_c_regs[handle] = c.c_registers
+        self._cache[handle] = dict()  # noqa: C408
+        record = JobRecord(job.id, self._target.name, n_shots, c.bits, c.c_registers)
+        if packing is not None:
+            packing.handles.append(handle)
+            self._packings[handle] = packing
+            record.columns = packing.columns
+            record.packed_c_regs = packing.c_regs
+            record.shots = packing.shots
+        return record
+
+    def _submit_qir(
+        self,
+        payload: str | bytes,
+        n_shots: int,
+        name: str,
+        option_params: Any = None,
+    ) -> "Job":
+        input_params = self._input_params(n_shots, option_params)
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.wait()
+            try:
+                return self._target.submit(
+                    input_data=payload,
+                    input_data_format="qir.v1",
+                    output_data_format="microsoft.quantum-results.v1",
+                    name=name,
+                    input_params=input_params,
+                    **({"encoding": "gzip"} if self._qir_payload == "gzip" else {}),
+                )
+            except Exception as e:
+                delay = _throttle_delay(e, attempt)
+                if delay is None or attempt == _THROTTLE_RETRIES:
+                    raise
+            attempt += 1
+            time.sleep(delay)
+
+    def _result_key(
+        self, module: str, input_params: dict[str, Any], occurrences: "_Occurrences"
+    ) -> str:
+        occurrence = occurrences.next(
+            ResultCache.key(self._target.name, module, input_params)
+        )
+        return ResultCache.key(self._target.name, module, input_params, occurrence)
+
+    @staticmethod
+    def _input_params(n_shots: int, option_params: Any) -> dict[str, Any]:
+        input_params = {
+            "entryPoint": "main",
+            "arguments": [],
+            "count": n_shots,
+        }
+        if option_params is not None:
+            input_params.update(option_params)
+        return input_params
+
+    def payload_size(self, handle: ResultHandle) -> int | None:
+        """Number of bytes of QIR uploaded for a handle, summed over the chunks
+        of a split circuit.
+
+        :return: Payload size, or None if the handle was not submitted by this
+            backend or has been evicted.
+        """
+        chunks = _chunk_handles(handle)
+        if chunks is None:
+            return self._payload_sizes.get(handle)
+        sizes = [self._payload_sizes.get(chunk) for chunk in chunks]
+        if None in sizes:
+            return None
+        return sum(cast("list[int]", sizes))
+
+    @property
+    def _qir_profile(self) -> "QIRProfile":
+        from pytket.qir import QIRProfile  # noqa: PLC0415
+
+        if self._device_type == DeviceType.Quantinuum:
+            return QIRProfile.AZUREADAPTIVE
+        return QIRProfile.AZUREBASE
+
+    def _circuit_to_qir(self, c: Circuit) -> str:
+        profile = self._qir_profile
+        key = None
+        if self._qir_cache is not None:
+            key = QIRCache.key(c, profile.name, _QIR_INT_TYPE)
+            module = self._qir_cache.get(key)
+            if module is not None:
+                return module
+        module = _pytket_to_qir(c, profile)
+        if key is not None:
+            assert self._qir_cache is not None
+            self._qir_cache.put(key, module)
+        return module
+
+    def _generate_qir_in_processes(
+        self,
+        circuits: list[Circuit],
+        n_processes: int,
+        spans: list[list[StageSpan]],
+    ) -> Iterator[tuple[int, str | BaseException]]:
+        """Translate circuits to QIR on a process pool.
+
+        Modules are yielded as soon as they are ready, so that the caller can
+        start submitting them while the remaining circuits are translated. Cache
+        hits are yielded first. The time each translation took in its worker is
+        added to `spans`.
+        """
+        profile = self._qir_profile
+        keys: dict[int, str] = {}
+        hits: list[tuple[int, str]] = []
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            futures = {}
+            for i, c in enumerate(circuits):
+                if self._qir_cache is not None:
+                    keys[i] = QIRCache.key(c, profile.name, _QIR_INT_TYPE)
+                    module = self._qir_cache.get(keys[i])
+                    if module is not None:
+                        hits.append((i, module))
+                        continue
+                future = executor.submit(
+                    _timed, _qir_from_dict, c.to_dict(), profile.name
+                )
+                futures[future] = i
+            yield from hits
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    module, start, end = future.result()
+                except Exception as e:  # noqa: BLE001
+                    yield i, e
+                    continue
+                spans[i].append(StageSpan("qir", start, end))
+                if self._qir_cache is not None:
+                    self._qir_cache.put(keys[i], module)
+                yield i, module
 
     def _update_cache_result(
         self, handle: ResultHandle, result_dict: dict[str, BackendResult]
@@ -416,55 +1842,377 @@ using default compilation"
             self._cache[handle].update(result_dict)
         else:
             self._cache[handle] = result_dict
+        if "result" in result_dict:
+            self._finished[handle] = time.monotonic()
+            self._finished.move_to_end(handle)
+            self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        # Drop the oldest finished handles beyond the retention limits. Handles
+        # still in flight are never in `_finished`, so they are unaffected, and
+        # retained handles are skipped until released.
+        now = time.monotonic()
+        for handle, finished_time in list(self._finished.items()):
+            over_count = (
+                self._max_retained_results is not None
+                and len(self._finished) > self._max_retained_results
+            )
+            expired = (
+                self._result_ttl_s is not None
+                and now - finished_time > self._result_ttl_s
+            )
+            if not (over_count or expired):
+                return
+            if handle in self._retained or handle in self._unmerged_chunks:
+                continue
+            if self._result_spill_dir is not None:
+                result = self._cache.get(handle, {}).get("result")
+                if result is not None:
+                    _write_json(self._spill_path(handle), result.to_dict())
+            self._cache.pop(handle, None)
+            self._forget(handle)
+
+    @contextlib.contextmanager
+    def _retaining(self, handles: Sequence[ResultHandle]) -> Iterator[None]:
+        # Keep the results of `handles` while a call fetches them: decoding the
+        # results of other circuits, such as those packed in the same job, could
+        # otherwise evict them before the caller has them.
+        self._retained.update(handles)
+        try:
+            yield
+        finally:
+            self._retained.subtract(handles)
+            for handle in handles:
+                if self._retained[handle] <= 0:
+                    del self._retained[handle]
+            self._evict_finished()
+
+    def _forget(self, handle: ResultHandle) -> None:
+        self._jobs.pop(handle, None)
+        self._result_bits.pop(handle, None)
+        self._result_c_regs.pop(handle, None)
+        self._payload_sizes.pop(handle, None)
+        self._packings.pop(handle, None)
+        self._finished.pop(handle, None)
+        self._unmerged_chunks.discard(handle)
+
+    def _spill_path(self, handle: ResultHandle) -> str:
+        assert self._result_spill_dir is not None
+        name = hashlib.sha256(str(handle[0]).encode()).hexdigest()
+        return os.path.join(self._result_spill_dir, f"{name}.json")
+
+    def _cached_result(self, handle: ResultHandle) -> BackendResult | None:
+        if handle in self._cache and "result" in self._cache[handle]:
+            return cast("BackendResult", self._cache[handle]["result"])
+        if self._result_spill_dir is not None:
+            try:
+                with open(self._spill_path(handle)) as fp:
+                    return BackendResult.from_dict(json.load(fp))
+            except FileNotFoundError:
+                pass
+        return None
+
+    def pop_result(self, handle: ResultHandle) -> dict[str, Any] | None:
+        """Remove cache entry corresponding to handle from the cache and return.
+
+        The job bookkeeping for the handle, and any result spilled to disk, is
+        removed as well.
+
+        :param handle: ResultHandle object
+        :return: Cache entry corresponding to handle, if it was present
+        """
+        for chunk in _chunk_handles(handle) or []:
+            self.pop_result(chunk)
+        self._forget(handle)
+        if self._result_spill_dir is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._spill_path(handle))
+        return super().pop_result(handle)
 
     def _make_backend_result(
-        self, results: Any, job: Job, handle: ResultHandle
+        self, results: Any, job: "Job", handle: ResultHandle
     ) -> BackendResult:
         n_shots = job.details.input_params["count"]
-        counts: Counter[OutcomeArray] = Counter()
-        if self._device_type == DeviceType.Quantinuum:
-            for s, p in results.items():
-                outcome = literal_eval(s)
-                n = int(n_shots * p + 0.5)
-                assert len(outcome) == len(self._result_c_regs[handle])
-                list_bits: list = []
-                for res, creg in zip(
-                    outcome, self._result_c_regs[handle], strict=False
-                ):
-                    long_res = bin(int(res)).replace(
-                        "0b",
-                        "0000000000000000000000000000000000000\
-00000000000000000000000000",  # 0 * 63
-                    )
-                    list_bits.append(long_res[-1 : -creg.size - 1 : -1])
-
-                all_bits = "".join(list_bits)
-
-                counts[OutcomeArray.from_readouts([[int(x) for x in all_bits]])] = n
+        packing = self._packings.get(handle)
+        by_register = self._device_type == DeviceType.Quantinuum
+        if by_register:
+            c_regs = self._result_c_regs[handle]
+            if packing is not None and packing.c_regs is not None:
+                c_regs = packing.c_regs
+            readouts = _register_readouts(results, c_regs)
+        else:
+            readouts = _bit_readouts(results)
+        shot_counts = _shot_counts(list(results.values()), n_shots)
+        if packing is not None and packing.columns is not None:
+            readouts = readouts[:, packing.columns]
+        if packing is not None and packing.shots is not None:
+            share = _share_counts(shot_counts, packing.shots, job.id)
+            readouts = readouts[share > 0]
+            shot_counts = share[share > 0].tolist()
+        counts = _counts_from_readouts(readouts, shot_counts)
+        if by_register:
             return BackendResult(counts=counts, c_bits=self._result_bits[handle])
-        for s, p in results.items():
-            outcome = literal_eval(s)
-            n = int(n_shots * p + 0.5)
-            oa = OutcomeArray.from_readouts([outcome])
-            counts[oa] = n
         return BackendResult(counts=counts)
 
     def circuit_status(self, handle) -> CircuitStatus:
-        job = self._jobs[handle]
+        if self._has_result(handle):
+            return CircuitStatus(StatusEnum.COMPLETED)
+        if _chunk_handles(handle) is not None:
+            return self.circuit_statuses([handle])[0]
+        job = self._get_job(handle)
         job.refresh()
+        return self._status_from_job(handle, job)
+
+    def circuit_statuses(self, handles: Sequence[ResultHandle]) -> list[CircuitStatus]:
+        """Return the statuses of many circuits, refreshing their jobs together.
+
+        Instead of refreshing each job separately, the jobs submitted to this
+        target since the earliest of them are listed from the workspace in one
+        (paginated) query. Jobs whose results are already cached are not queried,
+        and the results of every job found to have finished are cached.
+
+        :param handles: Handles to the circuits.
+        :return: Statuses in the same order as `handles`.
+        """
+        pending = [h for h in dict.fromkeys(handles) if not self._has_result(h)]
+        # The chunks of split circuits are refreshed with the other jobs.
+        chunks = {h: _chunk_handles(h) for h in pending}
+        for h_chunks in chunks.values():
+            self._unmerged_chunks.update(h_chunks or [])
+        jobs_pending = [
+            c
+            for c in dict.fromkeys(c for h in pending for c in chunks[h] or [h])
+            if not self._has_result(c)
+        ]
+        self._refresh_jobs([self._get_job(h) for h in jobs_pending])
+        statuses = {h: self._status_from_job(h, self._jobs[h]) for h in jobs_pending}
+        for h in pending:
+            h_chunks = chunks[h]
+            if h_chunks is not None:
+                statuses[h] = self._merged_status(
+                    h,
+                    h_chunks,
+                    [
+                        statuses.get(c, CircuitStatus(StatusEnum.COMPLETED))
+                        for c in h_chunks
+                    ],
+                )
+        return [statuses.get(h, CircuitStatus(StatusEnum.COMPLETED)) for h in handles]
+
+    def _merged_status(
+        self,
+        handle: ResultHandle,
+        chunks: list[ResultHandle],
+        statuses: list[CircuitStatus],
+    ) -> CircuitStatus:
+        # Once all the chunks have completed, the result is merged from theirs.
+        circuit_status = _merge_statuses(statuses)
+        if circuit_status.status is StatusEnum.COMPLETED:
+            self._merge_chunks(handle, chunks)
+        return circuit_status
+
+    def _merge_chunks(
+        self, handle: ResultHandle, chunks: list[ResultHandle]
+    ) -> BackendResult:
+        results = []
+        for chunk in chunks:
+            result = self._cached_result(chunk)
+            if result is None:
+                # Dropped, say by `pop_result`: fetched again if its job is known.
+                result = self.get_result(chunk)
+            results.append(result)
+        c_bits = None
+        if self._device_type == DeviceType.Quantinuum:
+            c_bits = self._result_bits[chunks[0]]
+        result = _merge_results(results, c_bits)
+        # Only the merged result is kept.
+        for chunk in chunks:
+            self._cache.pop(chunk, None)
+            self._forget(chunk)
+        self._update_cache_result(handle, {"result": result})
+        return result
+
+    def iter_results(
+        self, handles: Sequence[ResultHandle], **kwargs: KwargTypes
+    ) -> Iterator[tuple[ResultHandle, BackendResult]]:
+        """Yield `(handle, result)` pairs in the order in which the jobs finish.
+
+        Outstanding jobs are polled together with :py:meth:`circuit_statuses`.
+        The polling interval doubles, up to `max_wait`, while every outstanding
+        job is queued, and drops back to `min_wait` as soon as one is running.
+
+        Supported kwargs:
+
+        - timeout (float): overall timeout in seconds
+        - min_wait (float): shortest polling interval in seconds, defaults to 0.5
+        - max_wait (float): longest polling interval in seconds, defaults to 30
+
+        :raises RuntimeError: if any circuit errors, once the results of all the
+            others have been yielded.
+        :raises TimeoutError: if the timeout expires before all jobs finish.
+        """
+        timeout = cast("float | None", kwargs.get("timeout"))
+        min_wait = cast("float", kwargs.get("min_wait", 0.5))
+        max_wait = cast("float", kwargs.get("max_wait", 30.0))
+        start = time.monotonic()
+        pending = list(dict.fromkeys(handles))
+        errored: dict[ResultHandle, CircuitStatus] = {}
+        interval = min_wait
+        while True:
+            with self._retaining(pending):
+                statuses = self.circuit_statuses(pending)
+                finished = self._finished_results(pending, statuses)
+            yield from finished
+            pending, interval = _next_poll(
+                pending, statuses, interval, min_wait, max_wait, errored=errored
+            )
+            if not pending:
+                _raise_errored(errored)
+                return
+            if timeout is not None and time.monotonic() - start >= timeout:
+                raise TimeoutError(
+                    f"{len(pending)} jobs did not complete in {timeout}s"
+                )
+            time.sleep(interval)
+
+    async def iter_results_async(
+        self, handles: Sequence[ResultHandle], **kwargs: KwargTypes
+    ) -> AsyncIterator[tuple[ResultHandle, BackendResult]]:
+        """Asynchronous counterpart of :py:meth:`iter_results`, taking the same
+        kwargs."""
+        timeout = cast("float | None", kwargs.get("timeout"))
+        min_wait = cast("float", kwargs.get("min_wait", 0.5))
+        max_wait = cast("float", kwargs.get("max_wait", 30.0))
+        start = time.monotonic()
+        pending = list(dict.fromkeys(handles))
+        errored: dict[ResultHandle, CircuitStatus] = {}
+        interval = min_wait
+        while True:
+            with self._retaining(pending):
+                statuses = cast(
+                    "list[CircuitStatus]",
+                    await self._run_blocking(partial(self.circuit_statuses, pending)),
+                )
+                finished = self._finished_results(pending, statuses)
+            for handle, result in finished:
+                yield handle, result
+            pending, interval = _next_poll(
+                pending, statuses, interval, min_wait, max_wait, errored=errored
+            )
+            if not pending:
+                _raise_errored(errored)
+                return
+            if timeout is not None and time.monotonic() - start >= timeout:
+                raise TimeoutError(
+                    f"{len(pending)} jobs did not complete in {timeout}s"
+                )
+            await asyncio.sleep(interval)
+
+    def _finished_results(
+        self, handles: list[ResultHandle], statuses: list[CircuitStatus]
+    ) -> list[tuple[ResultHandle, BackendResult]]:
+        return [
+            (handle, cast("BackendResult", self._cached_result(handle)))
+            for handle, circuit_status in zip(handles, statuses, strict=True)
+            if circuit_status.status is StatusEnum.COMPLETED
+        ]
+
+    def _get_job(self, handle: ResultHandle) -> "Job":
+        # Jobs submitted by another backend are rehydrated from the job store.
+        if handle in self._jobs:
+            return self._jobs[handle]
+        record = (
+            None
+            if self._job_store is None
+            else self._job_store.get(cast("str", handle[0]))
+        )
+        if record is None:
+            # Never submitted by this backend, or evicted without a spilled
+            # result.
+            raise CircuitNotRunError(handle)
+        if record.target != self._target.name:
+            raise ValueError(
+                f"{handle!r} was submitted to {record.target}, not {self._target.name}"
+            )
+        job = self._workspace.get_job(record.job_id)
+        self._jobs[handle] = job
+        self._result_bits[handle] = record.bits
+        self._result_c_regs[handle] = record.c_regs
+        if record.columns is not None or record.shots is not None:
+            self._packings[handle] = _Packing(
+                record.columns, record.packed_c_regs, shots=record.shots
+            )
+        return job
+
+    def _has_result(self, handle: ResultHandle) -> bool:
+        if handle in self._cache and "result" in self._cache[handle]:
+            return True
+        return self._result_spill_dir is not None and os.path.exists(
+            self._spill_path(handle)
+        )
+
+    def _refresh_jobs(self, jobs: list["Job"]) -> None:
+        if len(jobs) <= 1:
+            for job in jobs:
+                job.refresh()
+            return
+        unrefreshed = {job.id: job for job in jobs}
+        creation_times = [
+            job.details.creation_time
+            for job in jobs
+            if job.details.creation_time is not None
+        ]
+        if creation_times:
+            listed_jobs = self._workspace.list_jobs(
+                target=[self._target.name],
+                created_after=min(creation_times) - timedelta(seconds=1),
+            )
+            for listed_job in listed_jobs:
+                job = unrefreshed.pop(listed_job.id, None)
+                if job is not None:
+                    job.details = listed_job.details
+        # Jobs missing from the listing are refreshed individually.
+        for job in unrefreshed.values():
+            job.refresh()
+
+    def _status_from_job(self, handle: ResultHandle, job: "Job") -> CircuitStatus:
         status = job.details.status
         if status == "Succeeded":
+            if self._has_result(handle):
+                return CircuitStatus(StatusEnum.COMPLETED)
+            start = time.time()
             results = job.get_results()
-            self._update_cache_result(
-                handle,
-                {"result": self._make_backend_result(results, job, handle)},
-            )
+            downloaded = time.time()
+            key = self._result_keys.pop(job.id, None)
+            if key is not None:
+                assert self._result_cache is not None
+                self._result_cache.put_results(key, results)
+            # The results of a packed or coalesced job are split between all its
+            # circuits.
+            packing = self._packings.get(handle)
+            siblings = [] if packing is None else packing.handles
+            for h in [handle, *(h for h in siblings if h != handle)]:
+                if h in self._jobs and not self._has_result(h):
+                    decode_start = time.time()
+                    self._update_cache_result(
+                        h, {"result": self._make_backend_result(results, job, h)}
+                    )
+                    if self._tracer is not None:
+                        self._trace(
+                            h,
+                            [
+                                *_job_spans(job),
+                                StageSpan("download", start, downloaded),
+                                StageSpan("decode", decode_start, time.time()),
+                            ],
+                        )
             return CircuitStatus(StatusEnum.COMPLETED)
         if status == "Waiting":
             return CircuitStatus(StatusEnum.QUEUED)
         if status == "Executing":
             return CircuitStatus(StatusEnum.RUNNING)
         if status == "Failed":
+            self._result_keys.pop(job.id, None)
             return CircuitStatus(StatusEnum.ERROR, job.details.error_data.message)
         return CircuitStatus(StatusEnum.ERROR, f"Unrecognized job status: '{status}'")
 
@@ -479,28 +2227,190 @@ using default compilation"
         try:
             return super().get_result(handle)
         except CircuitNotRunError:
-            self._jobs[handle].wait_until_completed(timeout_secs=kwargs.get("timeout"))
-            circuit_status = self.circuit_status(handle)
-            if circuit_status.status is StatusEnum.COMPLETED:
-                return cast("BackendResult", self._cache[handle]["result"])
+            result = self._cached_result(handle)
+            if result is not None:
+                return result
+            chunks = _chunk_handles(handle)
+            if chunks is not None:
+                self._unmerged_chunks.update(chunks)
+                for chunk in chunks:
+                    self.get_result(chunk, **kwargs)
+                return self._merge_chunks(handle, chunks)
+            with self._retaining([handle]):
+                self._get_job(handle).wait_until_completed(
+                    timeout_secs=kwargs.get("timeout")
+                )
+                circuit_status = self.circuit_status(handle)
+                if circuit_status.status is StatusEnum.COMPLETED:
+                    return cast("BackendResult", self._cached_result(handle))
             assert circuit_status.status is StatusEnum.ERROR
             raise RuntimeError(f"Circuit has errored. {circuit_status}")  # noqa: B904
 
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        # Blocking calls made by the asynchronous methods share one bounded pool.
+        with self._async_lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=self._async_concurrency,
+                    thread_name_prefix="pytket-azure",
+                )
+            return self._async_executor
+
+    async def _run_blocking(self, fn: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_async_executor(), fn)
+
+    async def process_circuits_async(
+        self,
+        circuits: Sequence[Circuit],
+        n_shots: int | Sequence[int | None] | None = None,
+        valid_check: bool = True,
+        **kwargs: KwargTypes,
+    ) -> list[ResultHandle]:
+        """
+        Awaitable counterpart of :py:meth:`process_circuits`, taking the same
+        arguments.
+
+        Circuits are submitted on the pool shared by the asynchronous methods,
+        so that across all of them at most `async_concurrency` blocking Azure
+        calls are made at once; `max_workers` is ignored.
+        """
+        # The submissions are not waited on from a thread of the shared pool,
+        # which they could otherwise fill.
+        return await asyncio.to_thread(
+            self._process_circuits,
+            circuits,
+            n_shots,
+            valid_check,
+            kwargs,
+            self._get_async_executor(),
+        )
+
+    async def circuit_status_async(self, handle: ResultHandle) -> CircuitStatus:
+        """Awaitable counterpart of :py:meth:`circuit_status`."""
+        return cast(
+            "CircuitStatus",
+            await self._run_blocking(partial(self.circuit_status, handle)),
+        )
+
+    async def get_result_async(
+        self, handle: ResultHandle, **kwargs: KwargTypes
+    ) -> BackendResult:
+        """
+        Awaitable counterpart of :py:meth:`get_result`.
+
+        The job is polled from the event loop rather than waited on in a thread,
+        so many results can be awaited at once.
+
+        Supported kwargs:
+
+        - timeout (float): timeout in seconds
+        - wait (float): polling interval in seconds, defaults to 1
+        """
+        timeout = cast("float | None", kwargs.get("timeout"))
+        wait = cast("float", kwargs.get("wait", 1.0))
+        self._check_handle_type(handle)
+        result = self._cached_result(handle)
+        if result is not None:
+            return result
+        start = time.monotonic()
+        while True:
+            with self._retaining([handle]):
+                circuit_status = await self.circuit_status_async(handle)
+                if circuit_status.status is StatusEnum.COMPLETED:
+                    return cast("BackendResult", self._cached_result(handle))
+            if circuit_status.status is StatusEnum.ERROR:
+                raise RuntimeError(f"Circuit has errored. {circuit_status}")
+            if timeout is not None and time.monotonic() - start >= timeout:
+                raise TimeoutError(f"{handle!r} did not complete in {timeout}s")
+            await asyncio.sleep(wait)
+
+    async def get_results_async(
+        self, handles: Sequence[ResultHandle], **kwargs: KwargTypes
+    ) -> list[BackendResult]:
+        """
+        Awaitable counterpart of :py:meth:`get_results`.
+
+        Outstanding jobs are polled together, as by
+        :py:meth:`iter_results_async`, whose kwargs are supported. The `wait`
+        kwarg of :py:meth:`get_result_async`, if given, sets a fixed polling
+        interval.
+        """
+        wait = kwargs.get("wait")
+        if wait is not None:
+            kwargs = {**kwargs, "min_wait": wait, "max_wait": wait}
+        results = {
+            handle: result
+            async for handle, result in self.iter_results_async(handles, **kwargs)
+        }
+        return [results[handle] for handle in handles]
+
+    def _fetch_target_statuses(self) -> dict[str, tuple[str, int]]:
+        return {
+            target.name: (target.current_availability, target.average_queue_time)
+            for target in self._workspace.get_targets()
+        }
+
+    def target_statuses(
+        self, max_age: float | None = None
+    ) -> dict[str, TargetStatusSnapshot]:
+        """Statuses of all the targets in this backend's workspace.
+
+        The statuses are shared by all backends for the workspace and fetched
+        together, at most once per `max_age` seconds.
+
+        :param max_age: Age in seconds beyond which the statuses are fetched
+            again. Defaults to the `status_ttl_s` given to the constructor.
+        :return: Status snapshots keyed by target name.
+        """
+        if max_age is None:
+            max_age = self._status_ttl_s
+        return _target_statuses.get(
+            self._workspace_key, self._fetch_target_statuses, max_age
+        )
+
+    def _target_status(self) -> TargetStatusSnapshot:
+        snapshot = self.target_statuses().get(self._target.name)
+        if snapshot is None:
+            self._target.refresh()
+            snapshot = TargetStatusSnapshot(
+                self._target.current_availability,
+                self._target.average_queue_time,
+                time.time(),
+            )
+        return snapshot
+
+    def start_status_refresher(self, interval_s: float = 30.0) -> None:
+        """Keep the statuses of the targets in this backend's workspace fresh
+        on a background thread, refreshing every `interval_s` seconds."""
+        _target_statuses.start_refresher(
+            self._workspace_key, self._fetch_target_statuses, interval_s
+        )
+
+    def stop_status_refresher(self) -> None:
+        """Stop the background refresher of this backend's workspace."""
+        _target_statuses.stop_refresher(self._workspace_key)
+
     def is_available(self) -> bool:
-        """Availability reported by the target."""
-        self._target.refresh()
-        return self._target.current_availability == "Available"
+        """Availability reported by the target.
+
+        Served from the workspace's status snapshot; see
+        :py:meth:`target_statuses`.
+        """
+        return self._target_status().availability == "Available"
 
     def average_queue_time_s(self) -> int:
-        """Average queue time in seconds reported by the target."""
-        self._target.refresh()
-        return self._target.average_queue_time
+        """Average queue time in seconds reported by the target.
+
+        Served from the workspace's status snapshot; see
+        :py:meth:`target_statuses`.
+        """
+        return self._target_status().average_queue_time_s
 
     @classmethod
-    @cache
     def available_devices(cls, **kwargs: Any) -> list[BackendInfo]:
         """
-        See :py:meth:`pytket.backends.Backend.get_result`.
+        See :py:meth:`pytket.backends.Backend.available_devices`.
 
         Supported kwargs:
 
@@ -508,24 +2418,60 @@ using default compilation"
         - location (str)
         - connection_string (str)
         - use_string (bool) = False
+        - max_age (float): age in seconds beyond which the device list is
+          refreshed, defaults to 3600
+        - refresh (bool): query the workspace now, defaults to False
+        - workspace: workspace to list the devices of instead of connecting to
+          Azure Quantum, such as a :py:class:`LocalWorkspace`; its devices are
+          not cached
 
         If omitted these are read from config, unless the environment variable
         `AZURE_QUANTUM_CONNECTION_STRING` is set in which case it is used.
+
+        The device list is cached in memory and in a snapshot file next to the
+        pytket config file, shared between processes. A cached list older than
+        `max_age` is returned while a fresh one is fetched in the background;
+        the workspace is only queried synchronously when nothing is cached or
+        `refresh` is set.
         """
+        workspace = kwargs.get("workspace")
         if kwargs.get("use_string"):
-            connection_string = kwargs.get("connection_string")
-            workspace = _get_workspace(connection_string=connection_string)
+            key_args: tuple[str | None, str | None, str | None] = (
+                None,
+                None,
+                kwargs.get("connection_string"),
+            )
+        else:
+            key_args = (kwargs.get("resource_id"), kwargs.get("location"), None)
+
+        def fetch() -> list[str]:
+            workspace = _get_workspace(*key_args)
+            return [target.name for target in workspace.get_targets()]
+
+        if workspace is not None:
+            names = [target.name for target in workspace.get_targets()]
         else:
-            resource_id = kwargs.get("resource_id")
-            location = kwargs.get("location")
-            workspace = _get_workspace(resource_id, location)
+            names = _device_catalogue.get(
+                _workspace_key(*key_args),
+                fetch,
+                max_age=kwargs.get("max_age", 3600.0),
+                refresh=kwargs.get("refresh", False),
+            )
         return [
             BackendInfo(
                 name=cls.__name__,
-                device_name=target.name,
+                device_name=name,
                 version=__extension_version__,
                 architecture=None,
                 gate_set=_GATE_SET,
             )
-            for target in workspace.get_targets()
+            for name in names
         ]
+
+    @classmethod
+    def refresh_available_devices(cls, **kwargs: Any) -> list[BackendInfo]:
+        """
+        Query the workspace for its devices, update the cached device list and
+        return it. Kwargs are as for :py:meth:`available_devices`.
+        """
+        return cls.available_devices(**{**kwargs, "refresh": True})
@@ -0,0 +1,235 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Caches of compiled circuits, of QIR modules generated from them, and of job
+results."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from pytket.circuit import Circuit
+
+
+def circuit_hash(circuit: Circuit) -> str:
+    """Stable content hash of a circuit, based on its JSON serialisation."""
+    serialised = json.dumps(circuit.to_dict(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialised.encode()).hexdigest()
+
+
+class _ContentCache:
+    """Content-addressed string store with an LRU in-memory tier and an optional
+    on-disk tier."""
+
+    _suffix = ".txt"
+
+    def __init__(self, maxsize: int = 256, cache_dir: str | None = None):
+        """
+        :param maxsize: Maximum number of entries held in memory.
+        :param cache_dir: Optional directory for the on-disk tier. It is created
+            if it does not exist.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        assert self._cache_dir is not None
+        return os.path.join(self._cache_dir, f"{key}{self._suffix}")
+
+    def get(self, key: str) -> str | None:
+        """Return the entry for `key`, or None if there is none."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        if self._cache_dir is not None:
+            try:
+                with open(self._path(key)) as fp:
+                    value = fp.read()
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._insert(key, value)
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store `value` under `key`."""
+        with self._lock:
+            self._insert(key, value)
+        if self._cache_dir is not None:
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as fp:
+                fp.write(value)
+            os.replace(tmp_path, self._path(key))
+
+    def _insert(self, key: str, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts, and the number of entries held in memory."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Empty the in-memory tier and reset the statistics.
+
+        Files in the on-disk tier are left in place.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+
+class QIRCache(_ContentCache):
+    """Content-addressed cache of QIR modules.
+
+    Entries are keyed on a hash of the serialised circuit together with the QIR
+    profile and integer width used for the translation, so a circuit that has
+    already been translated is not passed to `pytket_to_qir` again.
+
+    The in-memory tier is a bounded LRU. If `cache_dir` is given, every module is
+    also written to that directory, which lets separate processes share
+    translations; entries evicted from memory are then reloaded from disk.
+    """
+
+    _suffix = ".ll"
+
+    @staticmethod
+    def key(circuit: Circuit, profile: str, int_type: int) -> str:
+        """Cache key for the translation of `circuit`.
+
+        :param circuit: Circuit to translate.
+        :param profile: Name of the QIR profile.
+        :param int_type: Integer width used for classical registers.
+        :return: Hex digest identifying the translation.
+        """
+        h = hashlib.sha256(circuit_hash(circuit).encode())
+        h.update(f"|{profile}|{int_type}".encode())
+        return h.hexdigest()
+
+
+class CompilationCache(_ContentCache):
+    """Content-addressed cache of compiled circuits.
+
+    Entries are keyed on a hash of the serialised input circuit together with the
+    optimisation level, the compilation timeout and the device type, and hold the
+    serialised compiled circuit. Tiers behave as for :py:class:`QIRCache`.
+    """
+
+    _suffix = ".json"
+
+    @staticmethod
+    def key(
+        circuit: Circuit, optimisation_level: int, timeout: int, device_type: str
+    ) -> str:
+        """Cache key for the compilation of `circuit`.
+
+        :param circuit: Circuit to compile.
+        :param optimisation_level: Optimisation level of the compilation pass.
+        :param timeout: Timeout of the compilation pass.
+        :param device_type: Name of the device type the pass targets.
+        :return: Hex digest identifying the compilation.
+        """
+        h = hashlib.sha256(circuit_hash(circuit).encode())
+        h.update(f"|{optimisation_level}|{timeout}|{device_type}".encode())
+        return h.hexdigest()
+
+
+class ResultCache(_ContentCache):
+    """Cache of the results of jobs, so that a job is not submitted again.
+
+    Meant for targets whose results may be reused, such as simulators run
+    repeatedly by tests. Entries are keyed on the target name, a hash of the
+    QIR module and the job's input parameters, which include the number of
+    shots. Identical jobs submitted in one batch are told apart by their
+    occurrence, so that each keeps its own sample. Results older than `ttl_s`
+    are ignored. Tiers behave as for :py:class:`QIRCache`.
+    """
+
+    _suffix = ".json"
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        cache_dir: str | None = None,
+        ttl_s: float | None = None,
+    ):
+        """
+        :param maxsize: Maximum number of entries held in memory.
+        :param cache_dir: Optional directory for the on-disk tier. It is created
+            if it does not exist.
+        :param ttl_s: Age in seconds beyond which results are not reused. If
+            None (the default), results do not expire.
+        """
+        super().__init__(maxsize, cache_dir)
+        self._ttl_s = ttl_s
+
+    @staticmethod
+    def key(
+        target: str, module: str, input_params: dict[str, Any], occurrence: int = 0
+    ) -> str:
+        """Cache key for the results of a job.
+
+        :param target: Name of the target.
+        :param module: QIR module submitted.
+        :param input_params: Input parameters of the job.
+        :param occurrence: Number of identical jobs earlier in the same batch.
+        :return: Hex digest identifying the job.
+        """
+        h = hashlib.sha256(module.encode())
+        params = json.dumps(input_params, sort_keys=True, default=str)
+        h.update(f"|{target}|{params}|{occurrence}".encode())
+        return h.hexdigest()
+
+    def get_results(self, key: str) -> dict[str, Any] | None:
+        """Return the unexpired results stored under `key`, or None."""
+        value = self.get(key)
+        if value is None:
+            return None
+        entry = json.loads(value)
+        if self._ttl_s is not None and time.time() - entry["stored_at"] > self._ttl_s:
+            return None
+        return dict(entry["results"])
+
+    def put_results(self, key: str, results: dict[str, Any]) -> None:
+        """Store the results of a job under `key`."""
+        self.put(key, json.dumps({"stored_at": time.time(), "results": results}))
@@ -14,15 +14,35 @@
 
 """Azure config."""
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
 from pytket.config import PytketExtConfig
 
 
+@dataclass
+class WorkspaceConfig:
+    """Connection parameters of one Azure Quantum workspace, given either as a
+    `resource_id` and `location` or as a `connection_string`."""
+
+    resource_id: str | None = None
+    location: str | None = None
+    connection_string: str | None = None
+
+    @property
+    def use_string(self) -> bool:
+        return self.connection_string is not None
+
+
 @dataclass
 class AzureConfig(PytketExtConfig):
-    """Holds config parameters for pytket-azure."""
+    """Holds config parameters for pytket-azure.
+
+    `workspaces` lists the workspaces across which an
+    :py:class:`AzureBackendPool` built with
+    :py:meth:`AzureBackendPool.for_workspaces` shards jobs.
+    """
 
     ext_dict_key: ClassVar[str] = "azure"
 
@@ -30,6 +50,7 @@ class AzureConfig(PytketExtConfig):
     location: str | None
     connection_string: str | None
     use_string: bool = False
+    workspaces: list[WorkspaceConfig] = field(default_factory=list)
 
     @classmethod
     def from_extension_dict(
@@ -40,6 +61,7 @@ class AzureConfig(PytketExtConfig):
             ext_dict.get("location"),
             ext_dict.get("connection_string"),
             ext_dict.get("use_string", False),
+            [WorkspaceConfig(**w) for w in ext_dict.get("workspaces", [])],
         )
 
 
@@ -48,9 +70,16 @@ def set_azure_config(
     location: str | None = None,
     connection_string: str | None = None,
     use_string: bool = False,
+    workspaces: Sequence[WorkspaceConfig] | None = None,
 ) -> None:
-    """Save Azure confuguration."""
+    """Save Azure confuguration.
+
+    :param workspaces: If given, replaces the list of workspaces to shard jobs
+        across; see :py:meth:`AzureBackendPool.for_workspaces`.
+    """
     config = AzureConfig.from_default_config_file()
+    if workspaces is not None:
+        config.workspaces = list(workspaces)
     if use_string:
         config.use_string = use_string
         if connection_string is not None:
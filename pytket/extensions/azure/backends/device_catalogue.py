@@ -0,0 +1,152 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Catalogue of the targets available in Azure Quantum workspaces."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Hashable
+
+from pytket.config import get_config_file_path
+
+
+def _default_snapshot_path() -> str:
+    return os.path.join(
+        os.path.dirname(get_config_file_path()), "azure_device_catalogue.json"
+    )
+
+
+class DeviceCatalogue:
+    """Target names per workspace, kept in memory and in a snapshot file.
+
+    Entries younger than the maximum age are served without network access.
+    Older entries are still served, while a background thread fetches fresh
+    ones; only a workspace with no entry at all is fetched synchronously.
+    """
+
+    def __init__(self, snapshot_path: str | None = None):
+        """
+        :param snapshot_path: Path of the snapshot file shared between processes.
+            Defaults to a file next to the pytket config file.
+        """
+        self._snapshot_path = snapshot_path
+        self._entries: dict[str, tuple[float, list[str]]] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._snapshot_loaded = False
+
+    @property
+    def snapshot_path(self) -> str:
+        if self._snapshot_path is None:
+            self._snapshot_path = _default_snapshot_path()
+        return self._snapshot_path
+
+    @staticmethod
+    def _key(workspace_key: Hashable) -> str:
+        # Workspace keys may hold credentials, so only a digest is written out.
+        return hashlib.sha256(repr(workspace_key).encode()).hexdigest()
+
+    def get(
+        self,
+        workspace_key: Hashable,
+        fetch: Callable[[], list[str]],
+        max_age: float,
+        refresh: bool = False,
+    ) -> list[str]:
+        """Return the target names of a workspace.
+
+        :param workspace_key: Identifies the workspace.
+        :param fetch: Queries the workspace for its target names.
+        :param max_age: Age in seconds beyond which an entry is refreshed.
+        :param refresh: Fetch the target names now, whatever the entry's age.
+        :return: Target names.
+        """
+        key = self._key(workspace_key)
+        entry = None if refresh else self._lookup(key)
+        if entry is None:
+            return self._fetch(key, fetch)
+        fetched_at, names = entry
+        if time.time() - fetched_at >= max_age:
+            self._refresh_in_background(key, fetch)
+        return names
+
+    def _lookup(self, key: str) -> tuple[float, list[str]] | None:
+        with self._lock:
+            if not self._snapshot_loaded:
+                self._snapshot_loaded = True
+                for k, (fetched_at, names) in self._read_snapshot().items():
+                    self._entries.setdefault(k, (fetched_at, names))
+            return self._entries.get(key)
+
+    def _fetch(self, key: str, fetch: Callable[[], list[str]]) -> list[str]:
+        names = list(fetch())
+        with self._lock:
+            self._entries[key] = (time.time(), names)
+            self._refreshing.discard(key)
+        self._write_snapshot(key)
+        return names
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], list[str]]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                self._fetch(key, fetch)
+            except Exception:  # noqa: BLE001
+                # The stale entry is kept; the next lookup tries again.
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _read_snapshot(self) -> dict[str, tuple[float, list[str]]]:
+        try:
+            with open(self.snapshot_path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        return {k: (v["fetched_at"], v["targets"]) for k, v in data.items()}
+
+    def _write_snapshot(self, key: str) -> None:
+        # Merge with the current file, so that entries written by other
+        # processes are kept.
+        with self._lock:
+            fetched_at, names = self._entries[key]
+        data = {
+            k: {"fetched_at": t, "targets": n}
+            for k, (t, n) in self._read_snapshot().items()
+        }
+        data[key] = {"fetched_at": fetched_at, "targets": names}
+        directory = os.path.dirname(self.snapshot_path)
+        with contextlib.suppress(OSError):
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as fp:
+                json.dump(data, fp)
+            os.replace(tmp_path, self.snapshot_path)
+
+    def clear(self) -> None:
+        """Forget the in-memory entries; they are reloaded from the snapshot file
+        on the next lookup."""
+        with self._lock:
+            self._entries.clear()
+            self._snapshot_loaded = False
@@ -0,0 +1,149 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent store of submitted Azure jobs."""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass
+
+from pytket.circuit import Bit, BitRegister
+
+
+@dataclass
+class JobRecord:
+    """What is needed to retrieve and decode the results of a submitted job.
+
+    For a circuit packed with others into one program, `columns` holds the
+    positions of its bits among the program's decoded bits, and `packed_c_regs`
+    the program's classical registers if its results are keyed on registers.
+    For a circuit coalesced with identical ones into one job, `shots` holds the
+    offset and number of its shots among the job's shuffled shots.
+    """
+
+    job_id: str
+    target: str
+    n_shots: int
+    bits: list[Bit]
+    c_regs: list[BitRegister]
+    columns: list[int] | None = None
+    packed_c_regs: list[BitRegister] | None = None
+    shots: tuple[int, int] | None = None
+
+
+def _dump_registers(c_regs: list[BitRegister]) -> list[list]:
+    return [[creg.name, creg.size] for creg in c_regs]
+
+
+def _load_registers(c_regs: list[list]) -> list[BitRegister]:
+    return [BitRegister(name, size) for name, size in c_regs]
+
+
+def _dump_packing(record: JobRecord) -> str | None:
+    if record.columns is None and record.shots is None:
+        return None
+    packed_c_regs = (
+        None if record.packed_c_regs is None else _dump_registers(record.packed_c_regs)
+    )
+    return json.dumps([record.columns, packed_c_regs, record.shots])
+
+
+class JobStore:
+    """SQLite-backed record of submitted jobs, keyed by result handle.
+
+    A backend given a job store records every job it submits, so that a backend
+    in another process can retrieve the results of a handle without
+    resubmitting the circuit.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Path of the SQLite database file. It is created if it does
+            not exist.
+        """
+        self._path = path
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "handle TEXT PRIMARY KEY, job_id TEXT NOT NULL, "
+                "target TEXT NOT NULL, n_shots INTEGER NOT NULL, "
+                "bits TEXT NOT NULL, c_regs TEXT NOT NULL, created REAL NOT NULL, "
+                "packing TEXT)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the store safe to use from several
+        # threads and processes.
+        return sqlite3.connect(self._path, timeout=30)
+
+    def add(self, records: Iterable[tuple[str, JobRecord]]) -> None:
+        """Add or replace records.
+
+        :param records: Pairs of handle identifier and record.
+        """
+        now = time.time()
+        rows = [
+            (
+                handle,
+                record.job_id,
+                record.target,
+                record.n_shots,
+                json.dumps([bit.to_list() for bit in record.bits]),
+                json.dumps(_dump_registers(record.c_regs)),
+                now,
+                _dump_packing(record),
+            )
+            for handle, record in records
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def get(self, handle: str) -> JobRecord | None:
+        """Return the record for a handle identifier, or None if there is none."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT job_id, target, n_shots, bits, c_regs, packing FROM jobs "
+                "WHERE handle = ?",
+                (handle,),
+            ).fetchone()
+        if row is None:
+            return None
+        job_id, target, n_shots, bits, c_regs, packing = row
+        record = JobRecord(
+            job_id=job_id,
+            target=target,
+            n_shots=n_shots,
+            bits=[Bit.from_list(bit) for bit in json.loads(bits)],
+            c_regs=_load_registers(json.loads(c_regs)),
+        )
+        if packing is not None:
+            # Stores written before coalescing have no shots.
+            columns, packed_c_regs, *shots = json.loads(packing)
+            record.columns = columns
+            if packed_c_regs is not None:
+                record.packed_c_regs = _load_registers(packed_c_regs)
+            if shots and shots[0] is not None:
+                offset, n_shots = shots[0]
+                record.shots = (offset, n_shots)
+        return record
+
+    def remove(self, handle: str) -> None:
+        """Remove the record for a handle identifier, if there is one."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM jobs WHERE handle = ?", (handle,))
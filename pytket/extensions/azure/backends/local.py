@@ -0,0 +1,313 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline stand-ins for Azure Quantum workspaces, targets and jobs."""
+
+import gzip
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+# Takes the textual QIR module and the number of shots, and returns a histogram
+# keyed as in the "microsoft.quantum-results.v1" format.
+Sampler = Callable[[str, int], dict[str, float]]
+
+_RECORD_OUTPUT = re.compile(
+    r"call void @__quantum__rt__(int|result|bool)_record_output"
+)
+
+
+def _qir_text(input_data: str | bytes, encoding: str) -> str:
+    if encoding == "gzip":
+        assert isinstance(input_data, bytes)
+        input_data = gzip.decompress(input_data)
+    if isinstance(input_data, str):
+        return input_data
+    if input_data.startswith(b"BC"):
+        import pyqir  # noqa: PLC0415
+
+        return str(pyqir.Module.from_bitcode(pyqir.Context(), input_data))
+    return input_data.decode()
+
+
+def uniform_sampler(seed: int | None = None) -> Sampler:
+    """Sampler drawing every recorded output uniformly at random.
+
+    Integer outputs, which hold the value of a classical register, are drawn
+    from 32 random bits; result and boolean outputs from 0 and 1.
+
+    :param seed: Seed of the random number generator.
+    """
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    def sample(module: str, n_shots: int) -> dict[str, float]:
+        kinds = _RECORD_OUTPUT.findall(module)
+        with lock:
+            shots = Counter(
+                str([rng.getrandbits(32 if kind == "int" else 1) for kind in kinds])
+                for _ in range(n_shots)
+            )
+        return {key: n / n_shots for key, n in shots.items()}
+
+    return sample
+
+
+@dataclass
+class LocalErrorData:
+    code: str
+    message: str
+
+
+@dataclass
+class LocalJobDetails:
+    """The subset of Azure Quantum job details read by `AzureBackend`."""
+
+    id: str
+    name: str
+    target: str
+    status: str
+    input_params: dict[str, Any]
+    creation_time: datetime
+    output_data_format: str
+    error_data: LocalErrorData | None = None
+    begin_execution_time: datetime | None = None
+    end_execution_time: datetime | None = None
+
+
+@dataclass
+class _LocalListedJob:
+    id: str
+    details: LocalJobDetails
+
+
+class LocalJob:
+    """Job on a :py:class:`LocalTarget`.
+
+    Like an Azure Quantum job, its `details` only change when it is refreshed.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        details: LocalJobDetails,
+        module: str,
+        *,
+        sampler: Sampler,
+        queue_time_s: float,
+        run_time_s: float,
+        fails: bool,
+    ):
+        self.id = details.id
+        self.details = details
+        self._module = module
+        self._sampler = sampler
+        self._queue_time_s = queue_time_s
+        self._run_time_s = run_time_s
+        self._fails = fails
+        self._submitted = time.monotonic()
+        self._results: dict[str, float] | None = None
+
+    def current_details(self) -> LocalJobDetails:
+        """Details as they would be after a refresh, leaving `details` as is."""
+        elapsed = time.monotonic() - self._submitted
+        if elapsed < self._queue_time_s:
+            return replace(self.details, status="Waiting")
+        begun = self.details.creation_time + timedelta(seconds=self._queue_time_s)
+        if elapsed < self._queue_time_s + self._run_time_s:
+            return replace(self.details, status="Executing", begin_execution_time=begun)
+        ended = begun + timedelta(seconds=self._run_time_s)
+        if self._fails:
+            return replace(
+                self.details,
+                status="Failed",
+                error_data=LocalErrorData("InjectedFailure", "Injected job failure"),
+                begin_execution_time=begun,
+                end_execution_time=ended,
+            )
+        return replace(
+            self.details,
+            status="Succeeded",
+            begin_execution_time=begun,
+            end_execution_time=ended,
+        )
+
+    def refresh(self) -> None:
+        self.details = self.current_details()
+
+    def has_completed(self) -> bool:
+        return self.details.status in ("Succeeded", "Failed", "Cancelled")
+
+    def wait_until_completed(
+        self, max_poll_wait_secs: float = 30, timeout_secs: float | None = None
+    ) -> None:
+        start = time.monotonic()
+        self.refresh()
+        while not self.has_completed():
+            if timeout_secs is not None and time.monotonic() - start >= timeout_secs:
+                raise TimeoutError(f"Job {self.id} did not complete in {timeout_secs}s")
+            time.sleep(min(0.01, max_poll_wait_secs))
+            self.refresh()
+
+    def get_results(self, timeout_secs: float = 300) -> dict[str, float]:
+        self.wait_until_completed(timeout_secs=timeout_secs)
+        if self.details.status != "Succeeded":
+            raise RuntimeError(
+                f"Cannot retrieve results as job execution failed "
+                f"(status: {self.details.status}. error: {self.details.error_data})"
+            )
+        if self._results is None:
+            self._results = self._sampler(
+                self._module, self.details.input_params["count"]
+            )
+        return self._results
+
+
+class LocalTarget:
+    """Offline stand-in for an Azure Quantum target.
+
+    Jobs wait in the queue for `queue_time_s`, execute for `run_time_s`, and
+    then succeed, or fail with probability `failure_rate`. Results are drawn
+    from `sampler` when first requested.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        *,
+        sampler: Sampler | None = None,
+        submit_latency_s: float = 0.0,
+        queue_time_s: float = 0.0,
+        run_time_s: float = 0.0,
+        failure_rate: float = 0.0,
+        submit_failure_rate: float = 0.0,
+        seed: int | None = None,
+    ):
+        """
+        :param name: Target name, such as "quantinuum.sim.h1-1sc". The prefix
+            selects how `AzureBackend` compiles circuits and decodes results.
+        :param sampler: Returns the histogram of a job. Defaults to
+            :py:func:`uniform_sampler`.
+        :param submit_latency_s: Time taken by each submission.
+        :param queue_time_s: Time each job spends waiting in the queue.
+        :param run_time_s: Time each job spends executing.
+        :param failure_rate: Probability that a job fails.
+        :param submit_failure_rate: Probability that a submission raises.
+        :param seed: Seed for failure injection and the default sampler.
+        """
+        self.name = name
+        self.current_availability = "Available"
+        self.average_queue_time = int(queue_time_s)
+        self._sample = sampler if sampler is not None else uniform_sampler(seed)
+        self._submit_latency_s = submit_latency_s
+        self._queue_time_s = queue_time_s
+        self._run_time_s = run_time_s
+        self._failure_rate = failure_rate
+        self._submit_failure_rate = submit_failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.jobs: dict[str, LocalJob] = {}
+
+    def refresh(self) -> None:
+        pass
+
+    def submit(  # noqa: PLR0913
+        self,
+        input_data: str | bytes,
+        name: str = "azure-quantum-job",
+        input_params: dict[str, Any] | None = None,
+        *,
+        input_data_format: str = "qir.v1",
+        output_data_format: str = "microsoft.quantum-results.v1",
+        encoding: str = "",
+        **kwargs: Any,
+    ) -> LocalJob:
+        """Submit a QIR module, as text, bitcode or gzip-compressed text."""
+        if self._submit_latency_s:
+            time.sleep(self._submit_latency_s)
+        with self._lock:
+            if self._rng.random() < self._submit_failure_rate:
+                raise RuntimeError(f"Injected submission failure for {name}")
+            job_id = str(uuid.uuid4())
+            fails = self._rng.random() < self._failure_rate
+        details = LocalJobDetails(
+            id=job_id,
+            name=name,
+            target=self.name,
+            status="Waiting",
+            input_params=dict(input_params or {}),
+            creation_time=datetime.now(timezone.utc),
+            output_data_format=output_data_format,
+        )
+        job = LocalJob(
+            details,
+            _qir_text(input_data, encoding),
+            sampler=self._sample,
+            queue_time_s=self._queue_time_s,
+            run_time_s=self._run_time_s,
+            fails=fails,
+        )
+        job.refresh()
+        with self._lock:
+            self.jobs[job_id] = job
+        return job
+
+
+@dataclass
+class LocalWorkspace:
+    """Offline stand-in for an Azure Quantum workspace, holding local targets.
+
+    Pass it as the `workspace` of an `AzureBackend` to run the backend without
+    Azure credentials or network access.
+    """
+
+    targets: Sequence[LocalTarget] = field(default_factory=list)
+
+    def get_targets(self, name: str | None = None) -> Any:
+        if name is None:
+            return list(self.targets)
+        for target in self.targets:
+            if target.name == name:
+                return target
+        raise ValueError(f"No target named {name}")
+
+    def get_job(self, job_id: str) -> LocalJob:
+        for target in self.targets:
+            if job_id in target.jobs:
+                job = target.jobs[job_id]
+                job.refresh()
+                return job
+        raise KeyError(job_id)
+
+    def list_jobs(
+        self,
+        target: list[str] | None = None,
+        created_after: datetime | None = None,
+        **kwargs: Any,
+    ) -> list[_LocalListedJob]:
+        listed = []
+        for local_target in self.targets:
+            if target is not None and local_target.name not in target:
+                continue
+            for job in list(local_target.jobs.values()):
+                details = job.current_details()
+                if created_after is None or details.creation_time > created_after:
+                    listed.append(_LocalListedJob(job.id, details))
+        return listed
@@ -0,0 +1,479 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load balancing of circuits over several Azure backends."""
+
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
+
+from pytket.backends import Backend, CircuitStatus, ResultHandle, StatusEnum
+from pytket.backends.backend import KwargTypes
+from pytket.backends.backendinfo import BackendInfo
+from pytket.backends.backendresult import BackendResult
+from pytket.backends.resulthandle import _ResultIdTuple
+from pytket.circuit import Circuit
+from pytket.extensions.azure._metadata import __extension_version__
+from pytket.passes import BasePass
+from pytket.predicates import Predicate
+
+from .azure import (
+    _CHUNK_SEPARATOR,
+    AzureBackend,
+    AzureSubmissionError,
+    DeviceType,
+    _chunk_handles,
+    _job_spans,
+    _merge_results,
+    _merge_statuses,
+)
+from .config import AzureConfig, WorkspaceConfig
+
+if TYPE_CHECKING:
+    from azure.quantum import Job
+
+
+class AzureBackendPool(Backend):
+    """Backend spreading circuits over several :py:class:`AzureBackend` instances.
+
+    Each batch passed to :py:meth:`process_circuits` is divided between the
+    available backends. Circuits are taken largest first, and each is given to
+    the backend expected to finish it soonest: the one with the least average
+    queue time plus shots already assigned in the batch divided by throughput.
+    Throughput is measured from the execution times of the backend's completed
+    jobs.
+
+    Circuits that a backend fails to submit are submitted to the others, and
+    the backend is passed over for a while. Of a circuit split into several
+    jobs, only the shots of the chunks that failed are submitted again, and its
+    result is merged from those of all its jobs. The backends may be for the same
+    target in different workspaces; see :py:meth:`for_workspaces`.
+
+    The backends must compile circuits in the same way, that is, have targets
+    from the same provider. A handle records which backend holds its circuit,
+    and is used with the pool like the handle of any other backend.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[AzureBackend],
+        *,
+        default_shots_per_s: float = 100.0,
+        failover: bool = True,
+        failure_cooldown_s: float = 60.0,
+    ):
+        """
+        :param backends: Backends to spread circuits over.
+        :param default_shots_per_s: Throughput, in shots per second, assumed for
+            a backend until one of its jobs completes. Defaults to 100.
+        :param failover: Submit circuits that a backend failed to submit to the
+            other backends. Defaults to True.
+        :param failure_cooldown_s: Time in seconds for which a backend that
+            failed to submit a circuit is given no circuits, unless no other
+            backend is available. Defaults to 60.
+        """
+        super().__init__()
+        if not backends:
+            raise ValueError("AzureBackendPool needs at least one backend")
+        device_types = {b._device_type for b in backends}  # noqa: SLF001
+        if len(device_types) > 1:
+            raise ValueError("The backends must have targets from the same provider")
+        self._backends = list(backends)
+        self._default_shots_per_s = default_shots_per_s
+        self._failover = failover
+        self._failure_cooldown_s = failure_cooldown_s
+        self._cooldown_until = [0.0] * len(self._backends)
+        # Shots and seconds of execution of the completed jobs of each backend.
+        self._executed = [(0, 0.0)] * len(self._backends)
+        # Jobs of each handle, until their execution is accounted for.
+        self._pending_jobs: dict[ResultHandle, list[Job]] = {}
+        # Handles of the parts, submitted to different backends, of circuits
+        # recovered by failover after some of their chunks were submitted.
+        self._parts: dict[ResultHandle, list[ResultHandle]] = {}
+        self._lock = threading.Lock()
+        self._backendinfo = BackendInfo(
+            name=type(self).__name__,
+            device_name=",".join(
+                cast("str", b.backend_info.device_name) for b in self._backends
+            ),
+            version=__extension_version__,
+            architecture=None,
+            gate_set=self._backends[0].backend_info.gate_set,
+        )
+
+    @classmethod
+    def for_workspaces(
+        cls,
+        name: str,
+        workspaces: Sequence[Any] | None = None,
+        *,
+        default_shots_per_s: float = 100.0,
+        failover: bool = True,
+        failure_cooldown_s: float = 60.0,
+        **kwargs: Any,
+    ) -> "AzureBackendPool":
+        """Pool of backends for one device in each of several workspaces, to
+        shard jobs across the workspaces' quotas.
+
+        The backend index in each handle is the index of the job's workspace in
+        `workspaces`, so the handle can be used with any pool built from the
+        same list. Note that if the environment variable
+        `AZURE_QUANTUM_CONNECTION_STRING` is set, it overrides every
+        :py:class:`WorkspaceConfig`.
+
+        :param name: Device name.
+        :param workspaces: Each a :py:class:`WorkspaceConfig`, or a workspace
+            such as a :py:class:`LocalWorkspace`. Defaults to the workspaces
+            saved in config (see `set_azure_config()`).
+        :param default_shots_per_s: See :py:class:`AzureBackendPool`.
+        :param failover: See :py:class:`AzureBackendPool`.
+        :param failure_cooldown_s: See :py:class:`AzureBackendPool`.
+        :param kwargs: Passed to each :py:class:`AzureBackend`, for example
+            `max_submissions_per_s` to keep within each workspace's quota.
+        """
+        if workspaces is None:
+            workspaces = AzureConfig.from_default_config_file().workspaces
+        if not workspaces:
+            raise ValueError("No workspaces given or saved in config")
+        backends = []
+        for workspace in workspaces:
+            if isinstance(workspace, WorkspaceConfig):
+                backend = AzureBackend(
+                    name,
+                    workspace.resource_id,
+                    workspace.location,
+                    workspace.connection_string,
+                    workspace.use_string,
+                    **kwargs,
+                )
+            else:
+                backend = AzureBackend(name, workspace=workspace, **kwargs)
+            backends.append(backend)
+        return cls(
+            backends,
+            default_shots_per_s=default_shots_per_s,
+            failover=failover,
+            failure_cooldown_s=failure_cooldown_s,
+        )
+
+    @property
+    def backends(self) -> list[AzureBackend]:
+        return list(self._backends)
+
+    @property
+    def backend_info(self) -> BackendInfo:
+        return self._backendinfo
+
+    @property
+    def required_predicates(self) -> list[Predicate]:
+        return self._backends[0].required_predicates
+
+    def rebase_pass(self) -> BasePass:
+        return self._backends[0].rebase_pass()
+
+    def default_compilation_pass(
+        self, optimisation_level: int = 2, timeout: int = 300
+    ) -> BasePass:
+        """See :py:meth:`AzureBackend.default_compilation_pass`."""
+        return self._backends[0].default_compilation_pass(optimisation_level, timeout)
+
+    def get_compiled_circuits(
+        self,
+        circuits: Sequence[Circuit],
+        optimisation_level: int = 2,
+        timeout: int = 300,
+        n_processes: int | None = None,
+    ) -> list[Circuit]:
+        """See :py:meth:`AzureBackend.get_compiled_circuits`."""
+        return self._backends[0].get_compiled_circuits(
+            circuits, optimisation_level, timeout, n_processes
+        )
+
+    @property
+    def _result_id_type(self) -> _ResultIdTuple:
+        # The member's handle identifier and the index of the member.
+        return (str, int)
+
+    def throughputs(self) -> list[float]:
+        """Shots per second of execution of each backend, measured from its
+        completed jobs, or the default for a backend with none."""
+        with self._lock:
+            executed = list(self._executed)
+        return [
+            shots / seconds if seconds > 0 else self._default_shots_per_s
+            for shots, seconds in executed
+        ]
+
+    def _assign(self, n_shots_list: list[int], excluded: set[int]) -> list[int] | None:
+        # Backends that are cooling down after a failure or reported unavailable
+        # are skipped, unless all the backends not excluded are. Returns None if
+        # all backends are excluded.
+        remaining = [k for k in range(len(self._backends)) if k not in excluded]
+        if not remaining:
+            return None
+        now = time.monotonic()
+        candidates = [
+            k
+            for k in remaining
+            if self._cooldown_until[k] <= now and self._backends[k].is_available()
+        ] or remaining
+        queue_times = {k: self._backends[k].average_queue_time_s() for k in candidates}
+        throughputs = self.throughputs()
+        assigned = dict.fromkeys(candidates, 0)
+        assignment = [0] * len(n_shots_list)
+        for i in sorted(range(len(n_shots_list)), key=lambda i: -n_shots_list[i]):
+            n = n_shots_list[i]
+            finish = {
+                k: queue_times[k] + (assigned[k] + n) / throughputs[k]
+                for k in candidates
+            }
+            k = min(finish, key=finish.__getitem__)
+            assigned[k] += n
+            assignment[i] = k
+        return assignment
+
+    def process_circuits(
+        self,
+        circuits: Sequence[Circuit],
+        n_shots: int | Sequence[int | None] | None = None,
+        valid_check: bool = True,
+        **kwargs: KwargTypes,
+    ) -> list[ResultHandle]:
+        """
+        See :py:meth:`pytket.backends.Backend.process_circuits`.
+
+        Circuits are divided between the backends, and each backend's share is
+        submitted concurrently with the others. Kwargs are passed on to
+        :py:meth:`AzureBackend.process_circuits`.
+
+        With failover, circuits that a backend fails to submit are divided
+        between the backends that have not failed in this call. If some circuits
+        still fail to submit, the others are still submitted, and an
+        :py:class:`AzureSubmissionError` is raised that holds their handles.
+        """
+        circuits = list(circuits)
+        n_shots_list = Backend._get_n_shots_as_list(  # noqa: SLF001
+            n_shots,
+            len(circuits),
+            optional=False,
+        )
+        if valid_check:
+            self._check_all_circuits(circuits)
+
+        # Shots of each circuit not yet in a submitted job.
+        shots_left = list(n_shots_list)
+
+        def submit(k: int, indices: list[int]) -> list[ResultHandle]:
+            return self._backends[k].process_circuits(
+                [circuits[i] for i in indices],
+                [shots_left[i] for i in indices],
+                valid_check=False,
+                **kwargs,
+            )
+
+        handles: list[ResultHandle | None] = [None] * len(circuits)
+        errors: dict[int, BaseException] = {}
+        partial: dict[int, list[ResultHandle]] = {}
+        failed: set[int] = set()
+        pending = list(range(len(circuits)))
+        while pending:
+            assignment = self._assign([shots_left[i] for i in pending], failed)
+            if assignment is None:
+                break
+            batches: dict[int, list[int]] = {}
+            for i, k in zip(pending, assignment, strict=True):
+                batches.setdefault(k, []).append(i)
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                futures = {
+                    k: executor.submit(submit, k, indices)
+                    for k, indices in batches.items()
+                }
+            errors = {}
+            for k, future in futures.items():
+                indices = batches[k]
+                member_partial: dict[int, list[ResultHandle]] = {}
+                for i, handle in zip(
+                    indices,
+                    self._member_handles(future, indices, errors, member_partial),
+                    strict=True,
+                ):
+                    if handle is None:
+                        continue
+                    pool_handle = self._register(k, handle)
+                    if i in partial:
+                        pool_handle = self._join([*partial.pop(i), pool_handle])
+                    handles[i] = pool_handle
+                for i, chunks in member_partial.items():
+                    partial.setdefault(i, []).extend(
+                        self._register(k, h) for h in chunks
+                    )
+                    shots_left[i] -= sum(
+                        self._backends[k]._jobs[h].details.input_params["count"]  # noqa: SLF001
+                        for h in chunks
+                    )
+                if any(i in errors for i in indices):
+                    failed.add(k)
+                    self._cooldown_until[k] = (
+                        time.monotonic() + self._failure_cooldown_s
+                    )
+            pending = sorted(errors) if self._failover else []
+        if errors:
+            raise AzureSubmissionError(
+                handles, errors, {i: h for i, h in partial.items() if i in errors}
+            ) from next(iter(errors.values()))
+        return cast("list[ResultHandle]", handles)
+
+    @staticmethod
+    def _member_handles(
+        future: "Future[list[ResultHandle]]",
+        indices: list[int],
+        errors: dict[int, BaseException],
+        partial: dict[int, list[ResultHandle]],
+    ) -> list[ResultHandle | None]:
+        # The handles returned by a backend, with the errors of the circuits that
+        # it failed to submit added to `errors`, and the handles of their
+        # submitted chunks to `partial`, under their index in the batch.
+        try:
+            return cast("list[ResultHandle | None]", future.result())
+        except AzureSubmissionError as e:
+            errors.update((indices[j], error) for j, error in e.errors.items())
+            partial.update((indices[j], chunks) for j, chunks in e.partial.items())
+            return e.handles
+        except Exception as e:  # noqa: BLE001
+            errors.update((i, e) for i in indices)
+            return [None] * len(indices)
+
+    def _register(self, k: int, member_handle: ResultHandle) -> ResultHandle:
+        handle = ResultHandle(cast("str", member_handle[0]), k)
+        member = self._backends[k]
+        with self._lock:
+            self._pending_jobs[handle] = [
+                member._jobs[h]  # noqa: SLF001
+                for h in _chunk_handles(member_handle) or [member_handle]
+            ]
+        self._cache[handle] = dict()  # noqa: C408
+        return handle
+
+    def _join(self, parts: list[ResultHandle]) -> ResultHandle:
+        # Handle of a circuit whose jobs are split between backends.
+        handle = ResultHandle(
+            _CHUNK_SEPARATOR.join(cast("str", part[0]) for part in parts),
+            cast("int", parts[-1][1]),
+        )
+        for part in parts:
+            k, member_handle = self._member(part)
+            # The backend keeps the part's result until it is merged here.
+            self._backends[k]._unmerged_chunks.add(member_handle)  # noqa: SLF001
+        self._parts[handle] = parts
+        self._cache[handle] = dict()  # noqa: C408
+        return handle
+
+    def _merge_parts(self, handle: ResultHandle) -> BackendResult:
+        if "result" in self._cache.get(handle, {}):
+            return cast("BackendResult", self._cache[handle]["result"])
+        parts = self._parts.pop(handle)
+        results = [self.get_result(part) for part in parts]
+        c_bits = None
+        if self._backends[0]._device_type == DeviceType.Quantinuum:  # noqa: SLF001
+            c_bits = sorted(results[0].c_bits, key=results[0].c_bits.__getitem__)
+        result = _merge_results(results, c_bits)
+        # Only the merged result is kept.
+        for part in parts:
+            self.pop_result(part)
+        self._cache[handle] = {"result": result}
+        return result
+
+    def _member(self, handle: ResultHandle) -> tuple[int, ResultHandle]:
+        self._check_handle_type(handle)
+        return cast("int", handle[1]), ResultHandle(handle[0])
+
+    def _observe(self, handle: ResultHandle) -> None:
+        # Account for the execution of the jobs of a completed handle. Circuits
+        # packed into one job each count the job's shots and time in full, which
+        # leaves the backend's throughput unchanged.
+        with self._lock:
+            jobs = self._pending_jobs.pop(handle, None)
+        if not jobs:
+            return
+        shots, seconds = 0, 0.0
+        for job in {job.id: job for job in jobs}.values():
+            for span in _job_spans(job):
+                if span.stage == "execution":
+                    shots += job.details.input_params["count"]
+                    seconds += span.duration
+        k = cast("int", handle[1])
+        with self._lock:
+            total_shots, total_seconds = self._executed[k]
+            self._executed[k] = (total_shots + shots, total_seconds + seconds)
+
+    def circuit_status(self, handle: ResultHandle) -> CircuitStatus:
+        if handle in self._parts or "result" in self._cache.get(handle, {}):
+            return self.circuit_statuses([handle])[0]
+        k, member_handle = self._member(handle)
+        circuit_status = self._backends[k].circuit_status(member_handle)
+        if circuit_status.status is StatusEnum.COMPLETED:
+            self._observe(handle)
+        return circuit_status
+
+    def circuit_statuses(self, handles: Sequence[ResultHandle]) -> list[CircuitStatus]:
+        """Return the statuses of many circuits, refreshing the jobs of each
+        backend together. See :py:meth:`AzureBackend.circuit_statuses`."""
+        statuses: dict[ResultHandle, CircuitStatus] = {}
+        groups: dict[int, list[ResultHandle]] = {}
+        for handle in dict.fromkeys(handles):
+            if "result" in self._cache.get(handle, {}):
+                statuses[handle] = CircuitStatus(StatusEnum.COMPLETED)
+                continue
+            for part in self._parts.get(handle, [handle]):
+                groups.setdefault(self._member(part)[0], []).append(part)
+        for k, group in groups.items():
+            member_statuses = self._backends[k].circuit_statuses(
+                [self._member(h)[1] for h in group]
+            )
+            for handle, circuit_status in zip(group, member_statuses, strict=True):
+                statuses[handle] = circuit_status
+                if circuit_status.status is StatusEnum.COMPLETED:
+                    self._observe(handle)
+        for handle in dict.fromkeys(handles):
+            parts = self._parts.get(handle)
+            if parts is None:
+                continue
+            statuses[handle] = _merge_statuses([statuses[part] for part in parts])
+            if statuses[handle].status is StatusEnum.COMPLETED:
+                self._merge_parts(handle)
+        return [statuses[h] for h in handles]
+
+    def get_result(self, handle: ResultHandle, **kwargs: KwargTypes) -> BackendResult:
+        """See :py:meth:`AzureBackend.get_result`."""
+        if handle in self._parts or "result" in self._cache.get(handle, {}):
+            return self._merge_parts(handle)
+        k, member_handle = self._member(handle)
+        result = self._backends[k].get_result(member_handle, **kwargs)
+        self._observe(handle)
+        return result
+
+    def pop_result(self, handle: ResultHandle) -> dict[str, Any] | None:
+        """Remove the cached result of a handle from its backend and return it."""
+        parts = self._parts.pop(handle, None)
+        if parts is not None or "result" in self._cache.get(handle, {}):
+            for part in parts or []:
+                self.pop_result(part)
+            return self._cache.pop(handle, None)
+        k, member_handle = self._member(handle)
+        with self._lock:
+            self._pending_jobs.pop(handle, None)
+        self._cache.pop(handle, None)
+        return self._backends[k].pop_result(member_handle)
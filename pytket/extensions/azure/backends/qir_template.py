@@ -0,0 +1,186 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""QIR templates of symbolic circuits, for sweeps over the values of their
+symbols."""
+
+import math
+import random
+import re
+import struct
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from pytket.circuit import Circuit
+from sympy import Expr, Symbol, lambdify, sympify
+
+# Constant operands of type double in textual LLVM IR. They are printed in
+# hexadecimal unless they have a short decimal form.
+_DOUBLE = re.compile(r"(?<=double )(0x[0-9A-F]{16}|[-+]?\d+\.\d+e[-+]\d+)")
+
+# Difference in radians allowed between the angles written into a template and
+# those of the module translated from the circuit with the same values.
+_TOLERANCE = 1e-9
+
+# Period in half-turns of the angles of gates, to which pytket reduces numeric
+# parameters.
+_PERIOD = 4
+
+# Angles that differ by this many half-turns give the same rotation up to a
+# global phase. Evaluations of the same angle may differ by it, for example on
+# either side of a branch cut of atan2.
+_PHASE_PERIOD = 2
+
+
+def _double_literal(x: float) -> str:
+    """Hexadecimal form of a double in LLVM IR, which represents it exactly."""
+    return "0x" + struct.pack(">d", x).hex().upper()
+
+
+def _parse_double(literal: str) -> float:
+    if literal.startswith("0x"):
+        return float(struct.unpack(">d", bytes.fromhex(literal[2:]))[0])
+    return float(literal)
+
+
+def _substitute_params(
+    obj: Any,
+    symbols: dict[str, Symbol],
+    sentinels: Callable[[], float],
+    expressions: list[Expr],
+) -> None:
+    """Replace, in a serialised circuit, each symbolic parameter of an operation
+    by a distinct number, appending the parameter to `expressions`."""
+    if isinstance(obj, list):
+        for item in obj:
+            _substitute_params(item, symbols, sentinels, expressions)
+        return
+    if not isinstance(obj, dict):
+        return
+    if "type" in obj and isinstance(obj.get("params"), list):
+        for j, param in enumerate(obj["params"]):
+            # Names such as "beta" or "I" are the circuit's symbols, not sympy's.
+            expr = sympify(param, locals=symbols)
+            if expr.free_symbols:
+                expressions.append(expr)
+                obj["params"][j] = repr(sentinels())
+    for value in obj.values():
+        _substitute_params(value, symbols, sentinels, expressions)
+
+
+def _matches(module: str, expected: str) -> bool:
+    """Whether two modules differ at most by small differences in their double
+    constants, up to angles giving the same rotations."""
+    if _DOUBLE.sub("", module) != _DOUBLE.sub("", expected):
+        return False
+    period = _PHASE_PERIOD * math.pi
+    for a, b in zip(_DOUBLE.findall(module), _DOUBLE.findall(expected), strict=True):
+        difference = (_parse_double(a) - _parse_double(b)) % period
+        if min(difference, period - difference) > _TOLERANCE:
+            return False
+    return True
+
+
+class QIRTemplate:
+    """QIR module of a symbolic circuit, into which the values of its symbols
+    are written without translating the circuit again.
+
+    The circuit is translated once with every symbolic angle replaced by a
+    distinct number, which is then located in the module. Binding values
+    evaluates the angles and writes them in its place. A template that does not
+    reproduce the translation of the circuit at a test point, for example
+    because the translation does not keep the angles as they are, falls back
+    to substituting the values and translating the circuit for every binding.
+    """
+
+    def __init__(self, circuit: Circuit, to_qir: Callable[[Circuit], str]):
+        """
+        :param circuit: Compiled circuit, whose gates may have symbolic
+            parameters.
+        :param to_qir: Translation of a circuit without symbols to QIR.
+        """
+        self._circuit = circuit
+        self._to_qir = to_qir
+        self.symbols: list[Symbol] = sorted(circuit.free_symbols(), key=str)
+        # Text of the module between the angles, and the index in
+        # `expressions` of the angle after each piece but the last.
+        self._pieces: list[str] | None = None
+        self._slots: list[int] = []
+        rng = random.Random(0)
+        circuit_dict = circuit.to_dict()
+        expressions: list[Expr] = []
+        values: list[float] = []
+
+        def sentinel() -> float:
+            # Few enough digits to be parsed back to the same double.
+            values.append(round(rng.uniform(0.1, 1.9), 12))
+            return values[-1]
+
+        _substitute_params(
+            circuit_dict, {str(s): s for s in self.symbols}, sentinel, expressions
+        )
+        self._evaluate = lambdify(self.symbols, expressions, "math", dummify=True)
+        module = to_qir(Circuit.from_dict(circuit_dict))
+        positions = []
+        for k, value in enumerate(values):
+            literal = _double_literal(value * math.pi)
+            if module.count(literal) != 1:
+                return
+            positions.append((module.index(literal), len(literal), k))
+        positions.sort()
+        pieces = []
+        end = 0
+        for start, length, k in positions:
+            pieces.append(module[end:start])
+            self._slots.append(k)
+            end = start + length
+        pieces.append(module[end:])
+        self._pieces = pieces
+        check = {s: round(rng.uniform(0.05, 1.95), 6) for s in self.symbols}
+        if not _matches(self._fill(check), self._translate(check)):
+            self._pieces = None
+
+    @property
+    def is_template(self) -> bool:
+        """Whether values are written into a template, rather than translated."""
+        return self._pieces is not None
+
+    def bind(self, values: Mapping[Symbol, float]) -> str:
+        """Return the QIR module of the circuit with values for its symbols.
+
+        :param values: Value of every symbol of the circuit, in half-turns for
+            angles.
+        :raises ValueError: if a symbol has no value.
+        """
+        missing = [s for s in self.symbols if s not in values]
+        if missing:
+            raise ValueError(f"No values for symbols {missing}")
+        if self._pieces is None:
+            return self._translate(values)
+        return self._fill(values)
+
+    def _fill(self, values: Mapping[Symbol, float]) -> str:
+        assert self._pieces is not None
+        angles = self._evaluate(*(float(values[s]) for s in self.symbols))
+        parts = [self._pieces[0]]
+        for k, piece in zip(self._slots, self._pieces[1:], strict=True):
+            angle = float(angles[k]) % _PERIOD
+            parts.append(_double_literal(angle * math.pi))
+            parts.append(piece)
+        return "".join(parts)
+
+    def _translate(self, values: Mapping[Symbol, float]) -> str:
+        c = self._circuit.copy()
+        c.symbol_substitution(dict(values))
+        return self._to_qir(c)
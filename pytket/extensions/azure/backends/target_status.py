@@ -0,0 +1,113 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Snapshots of the status of the targets in Azure Quantum workspaces."""
+
+import contextlib
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TargetStatusSnapshot:
+    """Status of a target as reported by its workspace."""
+
+    availability: str
+    average_queue_time_s: int
+    fetched_at: float
+
+
+StatusFetcher = Callable[[], dict[str, tuple[str, int]]]
+
+
+class TargetStatusCache:
+    """Status snapshots of every target of each workspace.
+
+    The statuses of all the targets of a workspace are fetched together, and
+    served from memory until they are older than the maximum age requested. A
+    background thread per workspace can keep them fresh, so that reads never
+    wait for the network.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: dict[Hashable, dict[str, TargetStatusSnapshot]] = {}
+        self._refreshers: dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, workspace_key: Hashable, fetch: StatusFetcher, max_age: float
+    ) -> dict[str, TargetStatusSnapshot]:
+        """Return the statuses of the targets of a workspace, keyed by name.
+
+        :param workspace_key: Identifies the workspace.
+        :param fetch: Queries the workspace for the availability and average
+            queue time of each of its targets.
+        :param max_age: Age in seconds beyond which the statuses are fetched
+            again.
+        """
+        with self._lock:
+            snapshots = self._snapshots.get(workspace_key)
+        if snapshots and all(
+            time.time() - s.fetched_at < max_age for s in snapshots.values()
+        ):
+            return snapshots
+        return self.refresh(workspace_key, fetch)
+
+    def refresh(
+        self, workspace_key: Hashable, fetch: StatusFetcher
+    ) -> dict[str, TargetStatusSnapshot]:
+        """Fetch and store the statuses of the targets of a workspace."""
+        now = time.time()
+        snapshots = {
+            name: TargetStatusSnapshot(availability, queue_time, now)
+            for name, (availability, queue_time) in fetch().items()
+        }
+        with self._lock:
+            self._snapshots[workspace_key] = snapshots
+        return snapshots
+
+    def discard(self, workspace_key: Hashable) -> None:
+        """Drop the statuses of a workspace."""
+        with self._lock:
+            self._snapshots.pop(workspace_key, None)
+
+    def start_refresher(
+        self, workspace_key: Hashable, fetch: StatusFetcher, interval_s: float
+    ) -> None:
+        """Refresh the statuses of a workspace every `interval_s` seconds on a
+        daemon thread, until :py:meth:`stop_refresher` is called. Does nothing
+        if the workspace already has a refresher."""
+        with self._lock:
+            if workspace_key in self._refreshers:
+                return
+            stopped = threading.Event()
+            self._refreshers[workspace_key] = stopped
+
+        def run() -> None:
+            while not stopped.is_set():
+                # On failure the previous snapshot is kept until the next tick.
+                with contextlib.suppress(Exception):
+                    self.refresh(workspace_key, fetch)
+                stopped.wait(interval_s)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def stop_refresher(self, workspace_key: Hashable) -> None:
+        """Stop the background refresher of a workspace, if it has one."""
+        with self._lock:
+            stopped = self._refreshers.pop(workspace_key, None)
+        if stopped is not None:
+            stopped.set()
@@ -0,0 +1,96 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Timing of the stages that circuits go through on their way to a result."""
+
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pytket.backends import ResultHandle
+
+# Stages in the order a circuit goes through them. "queue" and "execution" are
+# read from the job's timestamps on Azure; the others are timed by the backend.
+STAGES = (
+    "compile",
+    "qir",
+    "upload",
+    "queue",
+    "execution",
+    "download",
+    "decode",
+)
+
+
+@dataclass(frozen=True)
+class StageSpan:
+    """Interval spent by a job in one stage, in seconds since the epoch."""
+
+    stage: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+# Called by the backend with each span, once the handle it belongs to is known.
+Tracer = Callable[["ResultHandle", StageSpan], None]
+
+
+class StageRecorder:
+    """Tracer that keeps the spans of every handle in memory.
+
+    Pass it as the `tracer` of an `AzureBackend`, then read the spans of a
+    handle with :py:meth:`spans` or their total duration per stage with
+    :py:meth:`durations`. To export spans elsewhere, for example to
+    OpenTelemetry, pass any other callable taking a handle and a
+    :py:class:`StageSpan` instead.
+    """
+
+    def __init__(self) -> None:
+        self._spans: defaultdict[ResultHandle, list[StageSpan]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def __call__(self, handle: "ResultHandle", span: StageSpan) -> None:
+        with self._lock:
+            self._spans[handle].append(span)
+
+    def spans(self, handle: "ResultHandle") -> list[StageSpan]:
+        """Spans recorded for a handle, including those of the chunks of a
+        circuit split into several jobs, ordered by start time."""
+        from .azure import _chunk_handles  # noqa: PLC0415
+
+        with self._lock:
+            spans = [
+                span
+                for h in [handle, *(_chunk_handles(handle) or [])]
+                for span in self._spans.get(h, [])
+            ]
+        return sorted(spans, key=lambda span: span.start)
+
+    def durations(self, handle: "ResultHandle") -> dict[str, float]:
+        """Total time in seconds spent by a handle in each stage."""
+        durations: dict[str, float] = {}
+        for span in self.spans(handle):
+            durations[span.stage] = durations.get(span.stage, 0.0) + span.duration
+        return durations
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
@@ -0,0 +1,113 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pytket.backends import Backend, ResultHandle
+from pytket.circuit import Circuit
+from pytket.extensions.azure import AzureBackend
+from pytket.extensions.azure.backends.local import LocalJob
+
+
+def test_results_are_awaited_together(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(queue_time_s=0.05)
+    c = bell(b)
+
+    async def run() -> tuple[list[ResultHandle], list[int]]:
+        handles = await b.process_circuits_async([c] * 8, n_shots=10)
+        results = await b.get_results_async(handles, wait=0.01)
+        return handles, [sum(r.get_counts().values()) for r in results]
+
+    start = time.monotonic()
+    handles, counts = asyncio.run(run())
+    assert len(set(handles)) == 8
+    assert counts == [10] * 8
+    # Awaited one after another, the jobs would take at least 0.4s.
+    assert time.monotonic() - start < 0.3
+
+
+def test_submissions_are_bounded(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(async_concurrency=2)
+    submit = b._target.submit  # noqa: SLF001
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def counted_submit(**kwargs: Any) -> Any:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        try:
+            time.sleep(0.01)
+            return submit(**kwargs)
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    b._target.submit = counted_submit  # noqa: SLF001
+    c = bell(b)
+
+    async def run() -> list[list[ResultHandle]]:
+        # The bound holds across concurrent calls, not just within each.
+        return list(
+            await asyncio.gather(
+                *(b.process_circuits_async([c] * 4, n_shots=10) for _ in range(3))
+            )
+        )
+
+    assert [len(handles) for handles in asyncio.run(run())] == [4, 4, 4]
+    assert in_flight[1] == 2
+
+
+def test_outstanding_jobs_are_polled_together(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    b = offline_backend(queue_time_s=0.05)
+    handles = b.process_circuits([bell(b)] * 20, n_shots=10)
+    refreshes = []
+    refresh = LocalJob.refresh
+
+    def counted_refresh(job: LocalJob) -> None:
+        # Jobs known to have finished are refreshed to download their results.
+        if job.details.status not in ("Succeeded", "Failed"):
+            refreshes.append(job)
+        refresh(job)
+
+    monkeypatch.setattr(LocalJob, "refresh", counted_refresh)
+    listings = []
+    list_jobs = b._workspace.list_jobs  # noqa: SLF001
+
+    def counted_list_jobs(**kwargs: Any) -> Any:
+        listings.append(kwargs)
+        return list_jobs(**kwargs)
+
+    monkeypatch.setattr(b._workspace, "list_jobs", counted_list_jobs)  # noqa: SLF001
+    results = asyncio.run(b.get_results_async(handles, wait=0.01))
+    assert [sum(r.get_counts().values()) for r in results] == [10] * 20
+    # Jobs are refreshed one by one only when a single one is outstanding.
+    assert len(refreshes) <= 1
+    assert 1 <= len(listings) < 20
@@ -0,0 +1,76 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from pathlib import Path
+
+from pytket.circuit import Circuit
+from pytket.extensions.azure import AzureBackend, CompilationCache, QIRCache
+
+
+def test_key_depends_on_content_and_profile() -> None:
+    c0 = Circuit(2).H(0).CX(0, 1).measure_all()
+    c1 = Circuit(2).H(0).CX(0, 1).measure_all()
+    c2 = Circuit(2).H(1).CX(0, 1).measure_all()
+    assert QIRCache.key(c0, "AZUREBASE", 64) == QIRCache.key(c1, "AZUREBASE", 64)
+    assert QIRCache.key(c0, "AZUREBASE", 64) != QIRCache.key(c2, "AZUREBASE", 64)
+    assert QIRCache.key(c0, "AZUREBASE", 64) != QIRCache.key(c0, "AZUREADAPTIVE", 64)
+    assert QIRCache.key(c0, "AZUREBASE", 64) != QIRCache.key(c0, "AZUREBASE", 32)
+
+
+def test_lru_eviction() -> None:
+    cache = QIRCache(maxsize=2)
+    cache.put("a", "module a")
+    cache.put("b", "module b")
+    assert cache.get("a") == "module a"
+    cache.put("c", "module c")
+    assert cache.get("b") is None
+    assert cache.get("a") == "module a"
+    assert cache.get("c") == "module c"
+    assert cache.stats() == {"hits": 3, "disk_hits": 0, "misses": 1, "size": 2}
+
+
+def test_disk_tier(tmp_path: Path) -> None:
+    cache = QIRCache(maxsize=1, cache_dir=str(tmp_path))
+    cache.put("a", "module a")
+    cache.put("b", "module b")
+    assert cache.get("a") == "module a"
+    other = QIRCache(cache_dir=str(tmp_path))
+    assert other.get("b") == "module b"
+    assert other.stats()["disk_hits"] == 1
+
+
+def test_compilation_key() -> None:
+    c = Circuit(2).H(0).CX(0, 1).measure_all()
+    key = CompilationCache.key(c, 2, 300, "Quantinuum")
+    assert key == CompilationCache.key(c.copy(), 2, 300, "Quantinuum")
+    assert key != CompilationCache.key(c, 3, 300, "Quantinuum")
+    assert key != CompilationCache.key(c, 2, 60, "Quantinuum")
+    assert key != CompilationCache.key(c, 2, 300, "Ionq")
+
+
+def test_compilation_on_a_process_pool(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    circuits = [
+        Circuit(3, 3).H(0).CX(0, 1).CX(1, 2).Rz(0.1 * n, 2).measure_all()
+        for n in range(4)
+    ]
+    serial = offline_backend().get_compiled_circuits(circuits)
+    cache = CompilationCache()
+    b = offline_backend(compilation_cache=cache, compile_processes=2)
+    assert b.get_compiled_circuits(circuits) == serial
+    assert cache.stats() == {"hits": 0, "disk_hits": 0, "misses": 4, "size": 4}
+    assert b.get_compiled_circuits(circuits) == serial
+    assert cache.stats() == {"hits": 4, "disk_hits": 0, "misses": 4, "size": 4}
@@ -0,0 +1,97 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pytket.circuit import Circuit
+from pytket.extensions.azure import (
+    AzureBackend,
+    JobStore,
+    LocalTarget,
+)
+from pytket.extensions.azure.backends.azure import (
+    _coalesce_circuits,
+    _share_counts,
+)
+
+DEVICES = ["quantinuum.sim.h1-1sc", "ionq.simulator"]
+
+
+def test_coalesce_circuits() -> None:
+    a = Circuit(2, 2).H(0).CX(0, 1).measure_all()
+    b = Circuit(2, 2).X(0).measure_all()
+    circuits = [a, b, a.copy(), a, b]
+    programs, alone = _coalesce_circuits(circuits, [10, 20, 30, 40, 50], 70)
+    assert alone == [3]
+    assert [(n_shots, [i for i, _ in members]) for _, n_shots, members in programs] == [
+        (40, [0, 2]),
+        (70, [1, 4]),
+    ]
+    shares = [packing.shots for _, packing in programs[1][2] if packing is not None]
+    assert shares == [(0, 20), (20, 50)]
+
+    programs, alone = _coalesce_circuits(circuits, [10, 20, 30, 40, 50], None)
+    assert alone == []
+    assert [n_shots for _, n_shots, _ in programs] == [80, 70]
+
+
+def test_share_counts() -> None:
+    shot_counts = [30, 0, 50, 20]
+    shares = [
+        _share_counts(shot_counts, shots, "job")
+        for shots in [(0, 10), (10, 60), (70, 30)]
+    ]
+    assert [share.sum() for share in shares] == [10, 60, 30]
+    assert np.array_equal(sum(shares), shot_counts)
+    assert np.array_equal(_share_counts(shot_counts, (10, 60), "job"), shares[1])
+
+
+@pytest.mark.parametrize("device", DEVICES)
+def test_identical_circuits_share_a_job(
+    offline_backend: Callable[..., AzureBackend],
+    device: str,
+) -> None:
+    target = LocalTarget(device, seed=0)
+    b = offline_backend(target, coalesce_shots=True)
+    bell = b.get_compiled_circuit(Circuit(2, 2).H(0).CX(0, 1).measure_all())
+    flip = b.get_compiled_circuit(Circuit(2, 2).X(1).measure_all())
+    handles = b.process_circuits(
+        [bell, flip, bell, bell], n_shots=[100, 50, 200, 300], max_shots_per_job=400
+    )
+    # The third copy of the Bell circuit does not fit in the first job.
+    assert len(target.jobs) == 3
+    assert len(set(handles)) == 4
+    for h, n_shots in zip(handles, [100, 50, 200, 300], strict=True):
+        counts = b.get_result(h).get_counts()
+        assert sum(counts.values()) == n_shots
+
+
+def test_coalesced_handles_from_job_store(
+    offline_backend: Callable[..., AzureBackend],
+    tmp_path: Path,
+) -> None:
+    target = LocalTarget(DEVICES[0], seed=1)
+    store = JobStore(str(tmp_path / "jobs.db"))
+    b = offline_backend(target, job_store=store)
+    c = b.get_compiled_circuit(Circuit(2, 2).H(0).H(1).measure_all())
+    handles = b.process_circuits([c, c], n_shots=[40, 60], coalesce_shots=True)
+    results = [b.get_result(h).get_counts() for h in handles]
+
+    other = offline_backend(target, job_store=store)
+    assert [other.get_result(h).get_counts() for h in handles] == results
+    assert [sum(counts.values()) for counts in results] == [40, 60]
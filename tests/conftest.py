@@ -12,12 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Callable
+from typing import Any
+
 import pytest
 from _pytest.fixtures import SubRequest
+from pytket.backends import Backend
+from pytket.circuit import Circuit
+
+from pytket.extensions.azure import AzureBackend, LocalTarget, LocalWorkspace
 
-from pytket.extensions.azure import AzureBackend
+DEVICE = "quantinuum.sim.h1-1sc"
 
 
 @pytest.fixture(name="azure_backend")
 def fixture_azure_backend(request: SubRequest) -> AzureBackend:
     return AzureBackend(name=request.param)
+
+
+@pytest.fixture(name="offline_backend")
+def fixture_offline_backend() -> Callable[..., AzureBackend]:
+    """Factory of backends on a :py:class:`LocalTarget`. Given a device name, the
+    backend gets a target of its own whose jobs wait in the queue for
+    `queue_time_s`; given a target, it runs on that target, in `workspace` if
+    one is passed."""
+
+    def make(
+        target: LocalTarget | str = DEVICE,
+        queue_time_s: float = 0.0,
+        workspace: LocalWorkspace | None = None,
+        **kwargs: Any,
+    ) -> AzureBackend:
+        if isinstance(target, str):
+            target = LocalTarget(target, queue_time_s=queue_time_s, seed=0)
+        if workspace is None:
+            workspace = LocalWorkspace([target])
+        return AzureBackend(target.name, workspace=workspace, **kwargs)
+
+    return make
+
+
+@pytest.fixture(name="bell")
+def fixture_bell() -> Callable[[Backend], Circuit]:
+    """Compiles a two-qubit Bell circuit, with both qubits measured, for a
+    backend."""
+
+    def compile_bell(backend: Backend) -> Circuit:
+        return backend.get_compiled_circuit(Circuit(2, 2).H(0).CX(0, 1).measure_all())
+
+    return compile_bell
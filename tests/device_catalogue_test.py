@@ -0,0 +1,50 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from pathlib import Path
+
+from pytket.extensions.azure.backends.device_catalogue import DeviceCatalogue
+
+
+class _Fetcher:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> list[str]:
+        self.calls += 1
+        return [f"target{self.calls}"]
+
+
+def test_fresh_entries_are_served_from_memory_and_disk(tmp_path: Path) -> None:
+    snapshot = str(tmp_path / "devices.json")
+    fetch = _Fetcher()
+    catalogue = DeviceCatalogue(snapshot)
+    assert catalogue.get("ws", fetch, max_age=60) == ["target1"]
+    assert catalogue.get("ws", fetch, max_age=60) == ["target1"]
+    assert DeviceCatalogue(snapshot).get("ws", fetch, max_age=60) == ["target1"]
+    assert fetch.calls == 1
+    assert catalogue.get("ws", fetch, max_age=60, refresh=True) == ["target2"]
+
+
+def test_stale_entries_are_refreshed_in_background(tmp_path: Path) -> None:
+    fetch = _Fetcher()
+    catalogue = DeviceCatalogue(str(tmp_path / "devices.json"))
+    catalogue.get("ws", fetch, max_age=60)
+    assert catalogue.get("ws", fetch, max_age=0) == ["target1"]
+    deadline = time.monotonic() + 5
+    while catalogue.get("ws", fetch, max_age=60) != ["target2"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert fetch.calls == 2
@@ -0,0 +1,61 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = ["azure.quantum", "pytket.qir", "pytket.backends", "scipy"]
+
+
+def _loaded_heavy_modules(statement: str) -> list[str]:
+    # A fresh interpreter, so that modules imported by other tests do not count.
+    script = (
+        f"import sys\n{statement}\n"
+        f"print(' '.join(m for m in {_HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return out.split()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import pytket.extensions.azure",
+        "from pytket.extensions.azure import JobStore, QIRCache, AzureConfig",
+    ],
+)
+def test_package_import_is_light(statement: str) -> None:
+    assert _loaded_heavy_modules(statement) == []
+
+
+def test_backend_import_defers_sdk_and_qir() -> None:
+    loaded = _loaded_heavy_modules("from pytket.extensions.azure import AzureBackend")
+    assert "azure.quantum" not in loaded
+    assert "pytket.qir" not in loaded
+
+
+def test_import_time() -> None:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pytket.extensions.azure"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    # The last line is the package itself; its cumulative time is in us.
+    cumulative_us = int(out.strip().splitlines()[-1].split("|")[1])
+    assert cumulative_us < 1_000_000
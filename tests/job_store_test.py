@@ -0,0 +1,54 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+from pytket.circuit import BitRegister, Circuit
+from pytket.extensions.azure import JobRecord, JobStore
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    c = Circuit(2)
+    a = c.add_c_register("a", 3)
+    c.add_c_register("b", 2)
+    c.Measure(0, a[0])
+    path = str(tmp_path / "jobs.db")
+    JobStore(path).add(
+        [("h0", JobRecord("job0", "quantinuum.sim.h1-1sc", 100, c.bits, c.c_registers))]
+    )
+
+    store = JobStore(path)
+    record = store.get("h0")
+    assert record == JobRecord(
+        "job0", "quantinuum.sim.h1-1sc", 100, c.bits, c.c_registers
+    )
+    assert store.get("h1") is None
+    store.remove("h0")
+    assert store.get("h0") is None
+
+
+def test_packed_round_trip(tmp_path: Path) -> None:
+    c = Circuit(1, 1).Measure(0, 0)
+    record = JobRecord(
+        "job0",
+        "quantinuum.sim.h1-1sc",
+        100,
+        c.bits,
+        c.c_registers,
+        columns=[2],
+        packed_c_regs=[BitRegister("p0_c", 2), BitRegister("p1_c", 1)],
+    )
+    path = str(tmp_path / "jobs.db")
+    JobStore(path).add([("job0/1", record)])
+    assert JobStore(path).get("job0/1") == record
@@ -0,0 +1,182 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytket.backends import Backend, ResultHandle, StatusEnum
+from pytket.circuit import Circuit
+from pytket.extensions.azure import (
+    AzureBackend,
+    AzureSubmissionError,
+    JobStore,
+    LocalTarget,
+    LocalWorkspace,
+)
+
+DEVICES = ["quantinuum.sim.h1-1sc", "ionq.simulator"]
+
+
+@pytest.mark.parametrize("device", DEVICES)
+@pytest.mark.parametrize("qir_payload", ["text", "bitcode", "gzip"])
+def test_round_trip(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+    device: str,
+    qir_payload: str,
+) -> None:
+    b = offline_backend(device, qir_payload=qir_payload)
+    assert b.is_available()
+    c = bell(b)
+    handles = b.process_circuits([c] * 4, n_shots=100, max_workers=4)
+    for h in handles:
+        counts = b.get_result(h).get_counts()
+        assert sum(counts.values()) == 100
+        assert all(len(outcome) == 2 for outcome in counts)
+
+
+def test_available_devices() -> None:
+    workspace = LocalWorkspace([LocalTarget(device) for device in DEVICES])
+    devices = AzureBackend.available_devices(workspace=workspace)
+    assert [d.device_name for d in devices] == DEVICES
+
+
+def test_queueing_and_polling(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    target = LocalTarget(DEVICES[0], queue_time_s=0.05, run_time_s=0.05)
+    b = offline_backend(target)
+    handles = b.process_circuits([bell(b)] * 5, n_shots=10)
+    assert b.circuit_status(handles[0]).status is StatusEnum.QUEUED
+    finished = [h for h, _ in b.iter_results(handles, min_wait=0.01)]
+    assert set(finished) == set(handles)
+
+
+def test_errored_circuits_do_not_stop_streaming(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    target = LocalTarget(DEVICES[0], queue_time_s=0.02, failure_rate=0.5, seed=0)
+    b = offline_backend(target)
+    handles = b.process_circuits([bell(b)] * 6, n_shots=10)
+    finished = []
+    with pytest.raises(RuntimeError, match="circuits have errored") as e:
+        for h, _ in b.iter_results(handles, min_wait=0.01):
+            finished.append(h)
+    errored = [h for h in handles if b.circuit_status(h).status is StatusEnum.ERROR]
+    assert 0 < len(errored) < 6
+    assert str(e.value).startswith(f"{len(errored)} circuits")
+    assert set(finished) == set(handles) - set(errored)
+
+    async def run() -> list[ResultHandle]:
+        return [h async for h, _ in b.iter_results_async(handles, min_wait=0.01)]
+
+    with pytest.raises(RuntimeError, match="have errored"):
+        asyncio.run(run())
+
+
+def test_failure_injection(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    target = LocalTarget(DEVICES[0], failure_rate=1.0)
+    b = offline_backend(target)
+    (h,) = b.process_circuits([bell(b)], n_shots=10)
+    assert b.circuit_status(h).status is StatusEnum.ERROR
+    with pytest.raises(RuntimeError):
+        b.get_result(h)
+
+    target = LocalTarget(DEVICES[0], submit_failure_rate=0.5, seed=3)
+    b = offline_backend(target)
+    with pytest.raises(AzureSubmissionError) as e:
+        b.process_circuits([bell(b)] * 8, n_shots=10)
+    assert 0 < len(e.value.errors) < 8
+    for i, handle in enumerate(e.value.handles):
+        assert (handle is None) == (i in e.value.errors)
+
+
+def test_partially_submitted_split_circuits(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    target = LocalTarget(DEVICES[0], submit_failure_rate=0.3, seed=1)
+    b = offline_backend(target)
+    with pytest.raises(AzureSubmissionError) as e:
+        b.process_circuits([bell(b)] * 4, n_shots=40, max_shots_per_job=10)
+    assert e.value.partial
+    assert set(e.value.partial) <= set(e.value.errors)
+    chunks = [h for handles in e.value.partial.values() for h in handles]
+    for h in chunks:
+        assert sum(b.get_result(h).get_counts().values()) == 10
+    # Every submitted job is reachable through a handle.
+    n_jobs = sum(4 for h in e.value.handles if h is not None) + len(chunks)
+    assert n_jobs == len(target.jobs)
+
+
+def test_packing_and_splitting(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    target = LocalTarget(DEVICES[0], seed=0)
+    b = offline_backend(target)
+    c = bell(b)
+    handles = b.process_circuits(
+        [c] * 4, n_shots=1000, pack_qubits=4, max_shots_per_job=300
+    )
+    assert len(target.jobs) == 2 * 4
+    for h in handles:
+        assert sum(b.get_result(h).get_counts().values()) == 1000
+
+
+def test_job_store_rehydration(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+    tmp_path: Path,
+) -> None:
+    target = LocalTarget(DEVICES[0], seed=0)
+    store = JobStore(str(tmp_path / "jobs.db"))
+    b = offline_backend(target, job_store=store)
+    (h,) = b.process_circuits([bell(b)], n_shots=10)
+    other = offline_backend(target, job_store=store)
+    assert other.get_result(h).get_counts() == b.get_result(h).get_counts()
+
+
+def test_async(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    target = LocalTarget(DEVICES[0], queue_time_s=0.02)
+    b = offline_backend(target)
+
+    async def run() -> list[int]:
+        handles = await b.process_circuits_async([bell(b)] * 3, n_shots=10)
+        results = await asyncio.gather(
+            *(b.get_result_async(h, wait=0.01) for h in handles)
+        )
+        return [sum(r.get_counts().values()) for r in results]
+
+    assert asyncio.run(run()) == [10, 10, 10]
+
+
+def test_targets_are_not_shared_between_workspaces(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    # Workspaces freed in turn may get the same id.
+    for failure_rate in [1.0, 0.0, 1.0, 0.0]:
+        target = LocalTarget(DEVICES[0], failure_rate=failure_rate)
+        b = offline_backend(target)
+        assert b._target is target  # noqa: SLF001
@@ -0,0 +1,144 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from collections.abc import Callable
+
+import numpy as np
+from pytket.circuit import Bit, Circuit, OpType, Qubit
+from pytket.extensions.azure import AzureBackend, LocalTarget
+from pytket.extensions.azure.backends.azure import (
+    _bit_readouts,
+    _pack_circuits,
+    _register_readouts,
+)
+
+
+def _circuit(n_qubits: int, flipped: list[int], reg_sizes: dict[str, int]) -> Circuit:
+    c = Circuit(n_qubits)
+    bits = [b for name, size in reg_sizes.items() for b in c.add_c_register(name, size)]
+    for q in flipped:
+        c.X(q)
+    for q, b in zip(range(n_qubits), bits, strict=False):
+        c.Measure(c.qubits[q], b)
+    return c
+
+
+def _outcome(c: Circuit) -> dict[Bit, int]:
+    # Circuits here only flip and measure, so their outcome is deterministic.
+    flipped = set()
+    outcome = dict.fromkeys(c.bits, 0)
+    for cmd in c.get_commands():
+        if cmd.op.type == OpType.X:
+            flipped.add(cmd.qubits[0])
+        elif cmd.op.type == OpType.Measure:
+            outcome[cmd.bits[0]] = int(cmd.qubits[0] in flipped)
+    return outcome
+
+
+def _flipped_qubits(c: Circuit) -> list[int]:
+    flipped = {cmd.qubits[0] for cmd in c.get_commands() if cmd.op.type == OpType.X}
+    return [int(q in flipped) for q in c.qubits]
+
+
+def _register_key(c: Circuit) -> str:
+    outcome = _outcome(c)
+    values = [
+        sum(outcome[creg[j]] << j for j in range(creg.size)) for creg in c.c_registers
+    ]
+    return str(values)
+
+
+def _circuits() -> list[Circuit]:
+    return [
+        _circuit(2, [0], {"c": 2}),
+        _circuit(3, [1, 2], {"a": 1, "c": 2}),
+        _circuit(1, [0], {"c": 1}),
+        _circuit(2, [1], {"m": 3}),
+    ]
+
+
+def test_grouping() -> None:
+    circuits = _circuits()
+    programs = _pack_circuits(circuits, [10, 10, 20, 10], 5, by_register=True)
+    assert [[i for i, _ in members] for _, _, members in programs] == [
+        [0, 1],
+        [2],
+        [3],
+    ]
+    assert [n for _, n, _ in programs] == [10, 20, 10]
+    assert programs[1][0] is circuits[2]
+    assert programs[1][2][0][1] is None
+    assert programs[0][0].n_qubits == 5
+    unpacked = _pack_circuits(circuits, [10] * 4, None, by_register=True)
+    assert [members for _, _, members in unpacked] == [[(i, None)] for i in range(4)]
+
+
+def test_register_columns() -> None:
+    circuits = _circuits()
+    ((program, _, members),) = _pack_circuits(circuits, [10] * 4, 100, by_register=True)
+    program_results = {_register_key(program): 1.0}
+    for i, packing in members:
+        assert packing is not None
+        assert packing.c_regs is not None
+        readouts = _register_readouts(program_results, packing.c_regs)
+        c = circuits[i]
+        expected = _register_readouts({_register_key(c): 1.0}, c.c_registers)
+        assert np.array_equal(readouts[:, packing.columns], expected)
+
+
+def test_bit_columns() -> None:
+    circuits = _circuits()
+    ((program, _, members),) = _pack_circuits(
+        circuits, [10] * 4, 100, by_register=False
+    )
+    # Without registers, every qubit is measured and result j is that of qubit j.
+    readouts = _bit_readouts({str(_flipped_qubits(program)): 1.0})
+    for i, packing in members:
+        assert packing is not None
+        assert readouts[0, packing.columns].tolist() == _flipped_qubits(circuits[i])
+
+
+_QUBIT = re.compile(r"__quantum__qis__x__body\(ptr (?:(null)|inttoptr \(i64 (\d+))")
+
+
+def _base_profile_sampler(module: str, n_shots: int) -> dict[str, float]:
+    """Outcome of a module that only flips qubits, laid out as by the base
+    profile: one result per qubit, in the order of the qubits."""
+    n_qubits = int(re.findall(r'"required_num_qubits"="(\d+)"', module)[0])
+    outcome = [0] * n_qubits
+    for null, index in _QUBIT.findall(module):
+        outcome[0 if null else int(index)] ^= 1
+    return {str(outcome): 1.0}
+
+
+def test_base_profile_packing(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    b = offline_backend(LocalTarget("ionq.simulator", sampler=_base_profile_sampler))
+    circuits = []
+    for k in range(12):
+        # More qubits than bits, measured out of order.
+        c = Circuit(k % 3 + 1, 1)
+        c.add_c_register("m", 1)
+        for q in range(c.n_qubits):
+            if (k >> q) & 1:
+                c.X(q)
+        c.Measure(Qubit(c.n_qubits - 1), Bit(0))
+        circuits.append(c)
+    unpacked = [b.get_result(h) for h in b.process_circuits(circuits, n_shots=10)]
+    packed = b.process_circuits(circuits, n_shots=10, pack_qubits=64)
+    assert len({str(h[0]).split("/")[0] for h in packed}) == 1
+    for h, result in zip(packed, unpacked, strict=True):
+        assert b.get_result(h).get_counts() == result.get_counts()
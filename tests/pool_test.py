@@ -0,0 +1,151 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+
+import pytest
+from pytket.backends import Backend, StatusEnum
+from pytket.circuit import Circuit
+from pytket.extensions.azure import (
+    AzureBackend,
+    AzureBackendPool,
+    AzureSubmissionError,
+    LocalTarget,
+    LocalWorkspace,
+)
+
+DEVICES = ["quantinuum.sim.h1-1sc", "quantinuum.sim.h1-1e"]
+
+
+@pytest.fixture(name="local_pool")
+def fixture_local_pool(
+    offline_backend: Callable[..., AzureBackend],
+) -> Callable[..., AzureBackendPool]:
+    """Factory of pools over local targets in one workspace."""
+
+    def make(*targets: LocalTarget) -> AzureBackendPool:
+        workspace = LocalWorkspace(list(targets))
+        return AzureBackendPool(
+            [offline_backend(t, workspace=workspace) for t in targets]
+        )
+
+    return make
+
+
+def test_batches_are_spread_and_results_routed(
+    local_pool: Callable[..., AzureBackendPool],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    pool = local_pool(*(LocalTarget(name, seed=0) for name in DEVICES))
+    handles = pool.process_circuits([bell(pool)] * 8, n_shots=50)
+    assert [h[1] for h in handles].count(0) == 4
+    for h in handles:
+        assert sum(pool.get_result(h).get_counts().values()) == 50
+    statuses = pool.circuit_statuses(handles)
+    assert all(st.status is StatusEnum.COMPLETED for st in statuses)
+
+
+def test_queue_time_and_availability(
+    local_pool: Callable[..., AzureBackendPool],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    fast, slow, down = (LocalTarget(name) for name in [*DEVICES, "quantinuum.qpu.h1-1"])
+    slow.average_queue_time = 3600
+    down.current_availability = "Unavailable"
+    pool = local_pool(fast, slow, down)
+    handles = pool.process_circuits([bell(pool)] * 6, n_shots=10)
+    assert {h[1] for h in handles} == {0}
+
+    # Shots beyond what the fast target can run within the slow one's queue
+    # time go to the slow one.
+    handles = pool.process_circuits([bell(pool)] * 2, n_shots=[400_000, 10])
+    assert [h[1] for h in handles] == [0, 1]
+
+
+def test_throughput_is_measured(
+    local_pool: Callable[..., AzureBackendPool],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    quick = LocalTarget(DEVICES[0], run_time_s=0.01)
+    sluggish = LocalTarget(DEVICES[1], run_time_s=0.1)
+    pool = local_pool(quick, sluggish)
+    assert pool.throughputs() == [100.0, 100.0]
+    for h in pool.process_circuits([bell(pool)] * 2, n_shots=10):
+        pool.get_result(h)
+    quick_rate, sluggish_rate = pool.throughputs()
+    assert quick_rate == pytest.approx(1000, rel=0.01)
+    assert sluggish_rate == pytest.approx(100, rel=0.01)
+
+    handles = pool.process_circuits([bell(pool)] * 11, n_shots=10)
+    assert [h[1] for h in handles].count(1) == 1
+
+
+def test_pop_result(
+    local_pool: Callable[..., AzureBackendPool],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    pool = local_pool(LocalTarget(DEVICES[0]))
+    (h,) = pool.process_circuits([bell(pool)], n_shots=5)
+    pool.get_result(h)
+    assert pool.pop_result(h) is not None
+    assert pool.pop_result(h) is None
+
+
+def test_partially_submitted_split_circuits(
+    local_pool: Callable[..., AzureBackendPool],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    pool = local_pool(LocalTarget(DEVICES[0], submit_failure_rate=0.3, seed=1))
+    with pytest.raises(AzureSubmissionError) as e:
+        pool.process_circuits([bell(pool)] * 4, n_shots=40, max_shots_per_job=10)
+    assert e.value.partial
+    for handles in e.value.partial.values():
+        for h in handles:
+            assert sum(pool.get_result(h).get_counts().values()) == 10
+
+
+def test_failover_submits_missing_chunks(
+    local_pool: Callable[..., AzureBackendPool],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    flaky = LocalTarget(DEVICES[0], submit_failure_rate=0.3, seed=1)
+    working = LocalTarget(DEVICES[1], seed=0)
+    pool = local_pool(flaky, working)
+    handles = pool.process_circuits([bell(pool)] * 4, n_shots=40, max_shots_per_job=10)
+    # Some circuits have chunks on both targets.
+    assert pool._parts  # noqa: SLF001
+    submitted = [
+        job.details.input_params["count"]
+        for job in [*flaky.jobs.values(), *working.jobs.values()]
+    ]
+    assert sum(submitted) == 160
+    for h in handles:
+        assert pool.circuit_status(h).status is StatusEnum.COMPLETED
+        counts = pool.get_result(h).get_counts()
+        assert sum(counts.values()) == 40
+        assert all(len(outcome) == 2 for outcome in counts)
+    # Only the merged results are left.
+    assert set(pool._cache) == set(handles)  # noqa: SLF001
+    assert not pool._pending_jobs  # noqa: SLF001
+    for h in handles:
+        assert pool.pop_result(h) is not None
+    assert not pool._cache  # noqa: SLF001
+
+
+def test_backends_must_share_a_provider(
+    local_pool: Callable[..., AzureBackendPool],
+) -> None:
+    targets = [LocalTarget(DEVICES[0]), LocalTarget("ionq.simulator")]
+    with pytest.raises(ValueError, match="same provider"):
+        local_pool(*targets)
@@ -0,0 +1,48 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+
+import pyqir
+import pytest
+from pytket.circuit import Circuit
+from pytket.extensions.azure.backends.azure import (
+    _encode_qir,
+    _pytket_to_qir,
+)
+from pytket.qir import QIRProfile
+
+
+@pytest.fixture
+def module() -> str:
+    c = Circuit(2, 2).H(0).CX(0, 1).Rz(0.25, 1).measure_all()
+    return _pytket_to_qir(c, QIRProfile.AZUREADAPTIVE)
+
+
+def test_text_payload(module: str) -> None:
+    assert _encode_qir(module, "text") is module
+
+
+def test_gzip_payload(module: str) -> None:
+    payload = _encode_qir(module, "gzip")
+    assert isinstance(payload, bytes)
+    assert len(payload) < len(module)
+    assert gzip.decompress(payload).decode() == module
+
+
+def test_bitcode_payload(module: str) -> None:
+    payload = _encode_qir(module, "bitcode")
+    assert isinstance(payload, bytes)
+    parsed = pyqir.Module.from_bitcode(pyqir.Context(), payload)
+    assert parsed.bitcode == payload
@@ -0,0 +1,104 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from pathlib import Path
+
+from pytket.circuit import Circuit
+from pytket.extensions.azure import (
+    AzureBackend,
+    JobStore,
+    LocalTarget,
+    ResultCache,
+)
+
+DEVICE = "ionq.simulator"
+
+
+def _circuits(b: AzureBackend) -> list[Circuit]:
+    return b.get_compiled_circuits(
+        [Circuit(3, 3).H(0).H(1).H(2).measure_all(), Circuit(1, 1).H(0).measure_all()]
+    )
+
+
+def test_repeated_batches_are_not_resubmitted(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    target = LocalTarget(DEVICE, seed=0)
+    cache = ResultCache()
+    b = offline_backend(target, result_cache=cache)
+    circuits = _circuits(b)
+    first = [b.get_result(h) for h in b.process_circuits(circuits, n_shots=100)]
+    assert len(target.jobs) == 2
+
+    b = offline_backend(target, result_cache=cache)
+    second = [b.get_result(h) for h in b.process_circuits(circuits, n_shots=100)]
+    assert len(target.jobs) == 2
+    assert [r.get_counts() for r in second] == [r.get_counts() for r in first]
+
+    # Other shots or input parameters are other jobs.
+    b.process_circuits(circuits, n_shots=50)
+    b.process_circuits(circuits, n_shots=100, option_params={"seed": 1})
+    assert len(target.jobs) == 6
+
+
+def test_identical_jobs_in_a_batch_keep_their_own_samples(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    target = LocalTarget(DEVICE, seed=0)
+    b = offline_backend(target, result_cache=ResultCache())
+    c = _circuits(b)[0]
+    first = [b.get_result(h).get_counts() for h in b.process_circuits([c] * 3, 100)]
+    assert first[0] != first[1]
+    second = [b.get_result(h).get_counts() for h in b.process_circuits([c] * 3, 100)]
+    assert len(target.jobs) == 3
+    assert second == first
+
+
+def test_disk_tier_and_ttl(
+    offline_backend: Callable[..., AzureBackend],
+    tmp_path: Path,
+) -> None:
+    target = LocalTarget(DEVICE)
+    b = offline_backend(target, result_cache=ResultCache(cache_dir=str(tmp_path)))
+    circuits = _circuits(b)
+    for h in b.process_circuits(circuits, n_shots=10):
+        b.get_result(h)
+
+    b = offline_backend(target, result_cache=ResultCache(cache_dir=str(tmp_path)))
+    handles = b.process_circuits(circuits, n_shots=10)
+    assert len(target.jobs) == 2
+    assert all(b.circuit_status(h).status.name == "COMPLETED" for h in handles)
+
+    b = offline_backend(
+        target, result_cache=ResultCache(cache_dir=str(tmp_path), ttl_s=0)
+    )
+    b.process_circuits(circuits, n_shots=10)
+    assert len(target.jobs) == 4
+
+
+def test_cached_handles_are_not_stored(
+    offline_backend: Callable[..., AzureBackend],
+    tmp_path: Path,
+) -> None:
+    target = LocalTarget(DEVICE)
+    store = JobStore(str(tmp_path / "jobs.db"))
+    cache = ResultCache()
+    b = offline_backend(target, result_cache=cache, job_store=store)
+    (h,) = b.process_circuits(_circuits(b)[:1], n_shots=10)
+    b.get_result(h)
+    assert store.get(str(h[0])) is not None
+    (h,) = b.process_circuits(_circuits(b)[:1], n_shots=10)
+    assert store.get(str(h[0])) is None
+    assert sum(b.get_result(h).get_counts().values()) == 10
@@ -0,0 +1,87 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from ast import literal_eval
+from collections import Counter
+
+from pytket.circuit import BitRegister
+from pytket.extensions.azure.backends.azure import (
+    _decode_bit_counts,
+    _decode_register_counts,
+)
+from pytket.utils import OutcomeArray
+
+
+def _reference_register_counts(
+    results: dict[str, float], n_shots: int, c_regs: list[BitRegister]
+) -> Counter[OutcomeArray]:
+    # Per-key decoding, as done before vectorisation.
+    counts: Counter[OutcomeArray] = Counter()
+    for s, p in results.items():
+        outcome = literal_eval(s)
+        list_bits = []
+        for res, creg in zip(outcome, c_regs, strict=True):
+            long_res = bin(int(res)).replace("0b", "0" * 63)
+            list_bits.append(long_res[-1 : -creg.size - 1 : -1])
+        all_bits = "".join(list_bits)
+        counts[OutcomeArray.from_readouts([[int(x) for x in all_bits]])] = int(
+            n_shots * p + 0.5
+        )
+    return counts
+
+
+def _reference_bit_counts(
+    results: dict[str, float], n_shots: int
+) -> Counter[OutcomeArray]:
+    counts: Counter[OutcomeArray] = Counter()
+    for s, p in results.items():
+        counts[OutcomeArray.from_readouts([literal_eval(s)])] = int(n_shots * p + 0.5)
+    return counts
+
+
+def _histogram(keys: list[str]) -> dict[str, float]:
+    weights = [random.random() for _ in keys]
+    total = sum(weights)
+    return {key: w / total for key, w in zip(keys, weights, strict=True)}
+
+
+def test_register_counts_match_reference() -> None:
+    random.seed(1)
+    c_regs = [BitRegister("a", 3), BitRegister("b", 40), BitRegister("c", 63)]
+    keys = {
+        str(tuple(random.getrandbits(reg.size) for reg in c_regs)) for _ in range(500)
+    }
+    results = _histogram(sorted(keys))
+    assert _decode_register_counts(results, 1000, c_regs) == _reference_register_counts(
+        results, 1000, c_regs
+    )
+
+
+def test_register_counts_single_register() -> None:
+    c_regs = [BitRegister("c", 2)]
+    results = {"[0]": 0.25, "[3]": 0.75}
+    assert _decode_register_counts(results, 8, c_regs) == Counter(
+        {
+            OutcomeArray.from_readouts([[0, 0]]): 2,
+            OutcomeArray.from_readouts([[1, 1]]): 6,
+        }
+    )
+
+
+def test_bit_counts_match_reference() -> None:
+    random.seed(2)
+    keys = {str([random.getrandbits(1) for _ in range(20)]) for _ in range(500)}
+    results = _histogram(sorted(keys))
+    assert _decode_bit_counts(results, 1000) == _reference_bit_counts(results, 1000)
@@ -0,0 +1,154 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from pytket.backends import Backend, StatusEnum
+from pytket.backends.backend_exceptions import CircuitNotRunError
+from pytket.circuit import Circuit
+from pytket.extensions.azure import AzureBackend
+
+
+def _is_retained(backend: AzureBackend, handle: object) -> bool:
+    return handle in backend._cache or handle in backend._jobs  # noqa: SLF001
+
+
+def test_oldest_results_are_evicted_first(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(max_retained_results=2)
+    handles = b.process_circuits([bell(b)] * 3, n_shots=10)
+    for h in handles:
+        b.get_result(h)
+    assert not _is_retained(b, handles[0])
+    with pytest.raises(CircuitNotRunError):
+        b.circuit_status(handles[0])
+    with pytest.raises(CircuitNotRunError):
+        b.get_result(handles[0])
+    for h in handles[1:]:
+        assert b.circuit_status(h).status is StatusEnum.COMPLETED
+        assert sum(b.get_result(h).get_counts().values()) == 10
+
+
+def test_results_expire(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(result_ttl_s=0.05)
+    first, second = b.process_circuits([bell(b)] * 2, n_shots=10)
+    b.get_result(first)
+    time.sleep(0.1)
+    # Expired results are evicted when another result is cached.
+    b.get_result(second)
+    assert not _is_retained(b, first)
+    with pytest.raises(CircuitNotRunError):
+        b.get_result(first)
+    assert b.circuit_status(second).status is StatusEnum.COMPLETED
+
+
+def test_evicted_results_are_spilled(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+    tmp_path: Path,
+) -> None:
+    spill_dir = str(tmp_path / "spill")
+    b = offline_backend(max_retained_results=1, result_spill_dir=spill_dir)
+    handles = b.process_circuits([bell(b)] * 3, n_shots=10)
+    results = [b.get_result(h).get_counts() for h in handles]
+    assert len(os.listdir(spill_dir)) == 2
+    assert [b.get_result(h).get_counts() for h in handles] == results
+    assert b.circuit_status(handles[0]).status is StatusEnum.COMPLETED
+    assert [st.status for st in b.circuit_statuses(handles)] == [
+        StatusEnum.COMPLETED
+    ] * 3
+
+    assert b.pop_result(handles[0]) is None
+    assert len(os.listdir(spill_dir)) == 1
+    with pytest.raises(CircuitNotRunError):
+        b.get_result(handles[0])
+
+
+def test_in_flight_handles_are_not_evicted(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(queue_time_s=0.2, max_retained_results=1)
+    finished = b.process_circuits([bell(b)] * 3, n_shots=10)
+    time.sleep(0.25)
+    (in_flight,) = b.process_circuits([bell(b)], n_shots=10)
+    for h in finished:
+        b.get_result(h)
+    assert b.circuit_status(in_flight).status is StatusEnum.QUEUED
+    assert sum(b.get_result(in_flight).get_counts().values()) == 10
+    assert not _is_retained(b, finished[1])
+    with pytest.raises(CircuitNotRunError):
+        b.circuit_status(finished[1])
+
+
+def test_pop_result_drops_bookkeeping(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend()
+    (h,) = b.process_circuits([bell(b)], n_shots=10)
+    result = b.get_result(h)
+    entry = b.pop_result(h)
+    assert entry is not None
+    assert entry["result"] == result
+    assert b.payload_size(h) is None
+    with pytest.raises(CircuitNotRunError):
+        b.circuit_status(h)
+
+
+def test_fetched_results_are_not_evicted(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    # Results decoded together, in one poll or from one packed job, outnumber
+    # those retained.
+    b = offline_backend(max_retained_results=1)
+    handles = b.process_circuits([bell(b)] * 4, n_shots=10)
+    for h, result in b.iter_results(handles, min_wait=0.01):
+        assert h in handles
+        assert sum(result.get_counts().values()) == 10
+
+    handles = b.process_circuits([bell(b)] * 3, n_shots=10, pack_qubits=6)
+    assert sum(b.get_result(handles[0]).get_counts().values()) == 10
+
+    handles = b.process_circuits([bell(b)] * 4, n_shots=10)
+    results = asyncio.run(b.get_results_async(handles, wait=0.01))
+    assert [sum(r.get_counts().values()) for r in results] == [10] * 4
+    assert len(b._finished) == 1  # noqa: SLF001
+
+
+def test_chunks_are_kept_until_merged(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(max_retained_results=1)
+    (split,) = b.process_circuits([bell(b)], n_shots=20, max_shots_per_job=5)
+    assert sum(b.get_result(split).get_counts().values()) == 20
+
+    (split,) = b.process_circuits([bell(b)], n_shots=20, max_shots_per_job=5)
+    (status,) = b.circuit_statuses([split])
+    assert status.status is StatusEnum.COMPLETED
+    assert sum(b.get_result(split).get_counts().values()) == 20
+    assert len(b._finished) == 1  # noqa: SLF001
@@ -0,0 +1,125 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pytket.backends import Backend
+from pytket.circuit import Circuit
+from pytket.extensions.azure import (
+    AzureBackend,
+    AzureBackendPool,
+    AzureConfig,
+    AzureSubmissionError,
+    LocalTarget,
+    LocalWorkspace,
+    WorkspaceConfig,
+)
+
+DEVICE = "quantinuum.sim.h1-1sc"
+
+
+class _Throttled(Exception):
+    status_code = 429
+
+    class response:
+        headers = {"Retry-After": "0"}  # noqa: RUF012
+
+
+class _ThrottlingTarget(LocalTarget):
+    def __init__(self, name: str, n_refusals: int):
+        super().__init__(name)
+        self.n_refusals = n_refusals
+
+    def submit(self, *args: Any, **kwargs: Any) -> Any:
+        if self.n_refusals > 0:
+            self.n_refusals -= 1
+            raise _Throttled
+        return super().submit(*args, **kwargs)
+
+
+def test_config_round_trip() -> None:
+    config = AzureConfig(
+        None,
+        None,
+        None,
+        workspaces=[WorkspaceConfig("rid", "westus"), WorkspaceConfig(None, None, "s")],
+    )
+    assert AzureConfig.from_extension_dict(config.to_dict()) == config
+    assert [w.use_string for w in config.workspaces] == [False, True]
+
+
+def test_jobs_are_sharded_across_workspaces(
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    workspaces = [LocalWorkspace([LocalTarget(DEVICE, seed=k)]) for k in range(3)]
+    pool = AzureBackendPool.for_workspaces(DEVICE, workspaces)
+    c = bell(pool)
+    handles = pool.process_circuits([c] * 9, n_shots=20)
+    assert {h[1] for h in handles} == {0, 1, 2}
+    assert all(len(w.targets[0].jobs) == 3 for w in workspaces)
+    for h in handles:
+        assert sum(pool.get_result(h).get_counts().values()) == 20
+
+
+def test_failover(
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    broken_target = _ThrottlingTarget(DEVICE, n_refusals=1000)
+    broken = LocalWorkspace([broken_target])
+    working = LocalWorkspace([LocalTarget(DEVICE)])
+    pool = AzureBackendPool.for_workspaces(DEVICE, [broken, working])
+    c = bell(pool)
+    handles = pool.process_circuits([c] * 4, n_shots=10)
+    assert [h[1] for h in handles] == [1] * 4
+    assert broken_target.n_refusals < 1000
+    # The broken workspace is cooling down, so it is not tried again.
+    n_refusals = broken_target.n_refusals
+    handles = pool.process_circuits([c] * 4, n_shots=10)
+    assert [h[1] for h in handles] == [1] * 4
+    assert broken_target.n_refusals == n_refusals
+
+    pool = AzureBackendPool.for_workspaces(DEVICE, [broken, working], failover=False)
+    with pytest.raises(AzureSubmissionError) as e:
+        pool.process_circuits([c] * 4, n_shots=10)
+    assert all(
+        (h is None) == (i in e.value.errors) for i, h in enumerate(e.value.handles)
+    )
+    assert e.value.errors
+
+
+def test_throttled_submissions_are_retried(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(_ThrottlingTarget(DEVICE, n_refusals=2))
+    (h,) = b.process_circuits([bell(b)], n_shots=10)
+    assert sum(b.get_result(h).get_counts().values()) == 10
+
+    b = offline_backend(_ThrottlingTarget(DEVICE, n_refusals=10))
+    with pytest.raises(AzureSubmissionError):
+        b.process_circuits([bell(b)], n_shots=10)
+
+
+def test_submission_rate_limit(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+) -> None:
+    b = offline_backend(max_submissions_per_s=50)
+    c = bell(b)
+    start = time.monotonic()
+    b.process_circuits([c] * 5, n_shots=10, max_workers=5)
+    assert time.monotonic() - start >= 4 / 50
@@ -0,0 +1,66 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+
+import pytest
+from pytket.backends import ResultHandle
+from pytket.backends.backendresult import BackendResult
+from pytket.circuit import Bit
+from pytket.extensions.azure.backends.azure import (
+    _chunk_handles,
+    _merge_results,
+    _split_shots,
+)
+from pytket.utils import OutcomeArray
+
+
+@pytest.mark.parametrize(
+    ("n_shots", "max_shots", "chunks"),
+    [
+        (10, None, [10]),
+        (10, 10, [10]),
+        (10, 3, [3, 3, 2, 2]),
+        (9, 3, [3, 3, 3]),
+        (1001, 500, [334, 334, 333]),
+    ],
+)
+def test_split_shots(n_shots: int, max_shots: int | None, chunks: list[int]) -> None:
+    assert _split_shots(n_shots, max_shots) == chunks
+
+
+def test_chunk_handles() -> None:
+    assert _chunk_handles(ResultHandle("job0")) is None
+    assert _chunk_handles(ResultHandle("job0+job1/2")) == [
+        ResultHandle("job0"),
+        ResultHandle("job1/2"),
+    ]
+
+
+def test_merge_results() -> None:
+    bits = [Bit("c", 0), Bit("c", 1)]
+
+    def result(counts: dict[tuple[int, ...], int]) -> BackendResult:
+        return BackendResult(
+            counts=Counter(
+                {OutcomeArray.from_readouts([k]): n for k, n in counts.items()}
+            ),
+            c_bits=bits,
+        )
+
+    merged = _merge_results(
+        [result({(0, 0): 3, (1, 1): 2}), result({(1, 1): 4, (0, 1): 1})], bits
+    )
+    assert merged.get_counts() == Counter({(0, 0): 3, (1, 1): 6, (0, 1): 1})
+    assert merged.get_counts(cbits=[bits[1]]) == Counter({(0,): 3, (1,): 7})
@@ -0,0 +1,57 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pytket.backends import Backend, StatusEnum
+from pytket.circuit import Circuit
+from pytket.extensions.azure import AzureBackend
+
+
+def test_jobs_are_listed_in_one_query(
+    offline_backend: Callable[..., AzureBackend],
+    bell: Callable[[Backend], Circuit],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    b = offline_backend(queue_time_s=0.2)
+    c = bell(b)
+    handles = b.process_circuits([c] * 10, n_shots=10)
+    listings = []
+    list_jobs = b._workspace.list_jobs  # noqa: SLF001
+
+    def counted_list_jobs(**kwargs: Any) -> Any:
+        listings.append(kwargs)
+        return list_jobs(**kwargs)
+
+    monkeypatch.setattr(b._workspace, "list_jobs", counted_list_jobs)  # noqa: SLF001
+    refreshes = []
+    for job in b._jobs.values():  # noqa: SLF001
+        monkeypatch.setattr(job, "refresh", lambda job=job: refreshes.append(job))
+
+    statuses = b.circuit_statuses(handles)
+    assert all(st.status is StatusEnum.QUEUED for st in statuses)
+    assert len(listings) == 1
+    assert not refreshes
+
+    time.sleep(0.2)
+    statuses = b.circuit_statuses([*handles, handles[0]])
+    assert all(st.status is StatusEnum.COMPLETED for st in statuses)
+    assert len(listings) == 2
+    # Results of finished jobs are cached, so they are not listed again.
+    b.circuit_statuses(handles)
+    assert len(listings) == 2
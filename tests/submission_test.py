@@ -0,0 +1,90 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pytket.circuit import Circuit
+from pytket.extensions.azure import AzureBackend, AzureSubmissionError, QIRCache
+from pytket.extensions.azure.backends.azure import _pytket_to_qir
+
+
+def _circuits(backend: AzureBackend) -> list[Circuit]:
+    # Circuits of different widths, so that each handle's bits tell them apart.
+    return [
+        backend.get_compiled_circuit(Circuit(n, n).X(n - 1).measure_all())
+        for n in range(1, 9)
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_handles_are_registered_in_input_order(
+    offline_backend: Callable[..., AzureBackend], max_workers: int | None
+) -> None:
+    b = offline_backend(max_workers=max_workers)
+    circuits = _circuits(b)
+    handles = b.process_circuits(circuits, n_shots=[10 * n for n in range(1, 9)])
+    assert len(set(handles)) == len(circuits)
+    assert set(b._jobs) == set(handles)  # noqa: SLF001
+    for n, (c, h) in enumerate(zip(circuits, handles, strict=True), start=1):
+        job = b._jobs[h]  # noqa: SLF001
+        assert job.details.input_params["count"] == 10 * n
+        assert b._result_bits[h] == c.bits  # noqa: SLF001
+
+
+def test_partial_failure_registers_submitted_circuits(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    b = offline_backend(max_workers=4)
+    submit = b._target.submit  # noqa: SLF001
+
+    def flaky_submit(**kwargs: Any) -> Any:
+        if kwargs["name"] in ("job_1", "job_4"):
+            raise RuntimeError("Submission refused")
+        return submit(**kwargs)
+
+    b._target.submit = flaky_submit  # noqa: SLF001
+    circuits = _circuits(b)
+    with pytest.raises(AzureSubmissionError) as e:
+        b.process_circuits(circuits, n_shots=10)
+    assert sorted(e.value.errors) == [1, 4]
+    for i, h in enumerate(e.value.handles):
+        assert (h is None) == (i in e.value.errors)
+        if h is not None:
+            assert b._result_bits[h] == circuits[i].bits  # noqa: SLF001
+
+
+def test_qir_from_a_process_pool_is_submitted_as_it_arrives(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    b = offline_backend(qir_cache=QIRCache(), qir_processes=2)
+    circuits = _circuits(b)
+    b.process_circuits([circuits[5]], n_shots=10)
+    submit = b._target.submit  # noqa: SLF001
+    modules: dict[str, str] = {}
+
+    def recording_submit(**kwargs: Any) -> Any:
+        job = submit(**kwargs)
+        modules[job.id] = kwargs["input_data"]
+        return job
+
+    b._target.submit = recording_submit  # noqa: SLF001
+    handles = b.process_circuits(circuits, n_shots=10)
+    # The cached module is submitted before any translated in a worker.
+    assert next(iter(modules)) == handles[5][0]
+    profile = b._qir_profile  # noqa: SLF001
+    for c, h in zip(circuits, handles, strict=True):
+        assert modules[str(h[0])] == _pytket_to_qir(c, profile)
@@ -0,0 +1,129 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import itertools
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pytket.backends.backend_exceptions import CircuitNotValidError
+from pytket.circuit import Circuit
+from pytket.extensions.azure import (
+    AzureBackend,
+    LocalTarget,
+    uniform_sampler,
+)
+from pytket.extensions.azure.backends.azure import _pytket_to_qir
+from pytket.extensions.azure.backends.qir_template import QIRTemplate, _matches
+from sympy import Symbol
+
+DEVICES = ["quantinuum.sim.h1-1sc", "ionq.simulator"]
+
+a, b, beta = Symbol("a"), Symbol("b"), Symbol("beta")
+
+
+def _ansatz() -> Circuit:
+    c = Circuit(3, 3).Rx(a, 0).Ry(b, 1).CX(0, 1).Rz(a + 2 * b, 1)
+    return c.ZZPhase(0.3 * beta, 0, 1).CX(1, 2).Rz(beta, 2).measure_all()
+
+
+def _recording_target(device: str, modules: list[str]) -> LocalTarget:
+    sample = uniform_sampler(0)
+
+    def sampler(module: str, n_shots: int) -> dict[str, Any]:
+        modules.append(module)
+        return sample(module, n_shots)
+
+    return LocalTarget(device, sampler=sampler)
+
+
+def _translate(backend: AzureBackend, c: Circuit, values: dict) -> str:
+    c = c.copy()
+    c.symbol_substitution(values)
+    return _pytket_to_qir(c, backend._qir_profile)  # noqa: SLF001
+
+
+@pytest.mark.parametrize("device", DEVICES)
+def test_template_matches_translation(
+    offline_backend: Callable[..., AzureBackend],
+    device: str,
+) -> None:
+    backend = offline_backend(device)
+    c = backend.get_compiled_circuit(_ansatz())
+    template = QIRTemplate(
+        c,
+        lambda circuit: _pytket_to_qir(circuit, backend._qir_profile),  # noqa: SLF001
+    )
+    assert template.is_template
+    assert template.symbols == [a, b, beta]
+    for values in [
+        {a: 0.0, b: 0.0, beta: 0.0},
+        {a: 0.25, b: -1.5, beta: 3.75},
+        {a: 7.1, b: 0.123, beta: -0.4},
+    ]:
+        assert _matches(template.bind(values), _translate(backend, c, values))
+    with pytest.raises(ValueError, match="No values"):
+        template.bind({a: 0.5})
+
+
+def test_template_falls_back_to_translation(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    backend = offline_backend(DEVICES[1])
+    c = backend.get_compiled_circuit(_ansatz())
+    count = itertools.count()
+
+    def to_qir(circuit: Circuit) -> str:
+        # Modules that differ at every translation cannot be templated.
+        module = _pytket_to_qir(circuit, backend._qir_profile)  # noqa: SLF001
+        return f"; {next(count)}\n{module}"
+
+    template = QIRTemplate(c, to_qir)
+    assert not template.is_template
+    values = {a: 0.5, b: 0.25, beta: 1.0}
+    module = template.bind(values)
+    assert module.endswith(_translate(backend, c, values))
+
+
+@pytest.mark.parametrize("device", DEVICES)
+def test_process_sweep(
+    offline_backend: Callable[..., AzureBackend],
+    device: str,
+) -> None:
+    modules: list[str] = []
+    backend = offline_backend(_recording_target(device, modules))
+    c = backend.get_compiled_circuit(_ansatz())
+    points = [{a: x / 4, b: 1 - x / 4, beta: x / 8} for x in range(5)]
+    handles = backend.process_sweep(c, points, n_shots=[10, 20, 30, 40, 50])
+    for h, n_shots in zip(handles, [10, 20, 30, 40, 50], strict=True):
+        assert sum(backend.get_result(h).get_counts().values()) == n_shots
+    # Jobs are sampled as their results are fetched, in the order of the points.
+    for module, values in zip(modules, points, strict=True):
+        assert _matches(module, _translate(backend, c, values))
+    backend.process_sweep(c, points[:2], n_shots=10)
+    assert len(backend._qir_templates) == 1  # noqa: SLF001
+
+
+def test_process_sweep_checks_circuit(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    backend = offline_backend(DEVICES[0])
+    with pytest.raises(CircuitNotValidError):
+        backend.process_sweep(
+            Circuit(3, 3).CCX(0, 1, 2).Rz(a, 0).measure_all(), [{a: 0.5}], n_shots=10
+        )
+    c = backend.get_compiled_circuit(_ansatz())
+    with pytest.raises(ValueError, match="No values"):
+        backend.process_sweep(c, [{a: 0.5, b: 0.5}], n_shots=10)
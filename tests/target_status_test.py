@@ -0,0 +1,85 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pytket.extensions.azure import AzureBackend, LocalTarget, LocalWorkspace
+from pytket.extensions.azure.backends.azure import _target_statuses
+from pytket.extensions.azure.backends.target_status import TargetStatusCache
+
+
+class _Fetcher:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> dict[str, tuple[str, int]]:
+        self.calls += 1
+        return {"a": ("Available", self.calls), "b": ("Unavailable", 0)}
+
+
+def test_statuses_are_served_from_memory_until_stale() -> None:
+    fetch = _Fetcher()
+    cache = TargetStatusCache()
+    statuses = cache.get("ws", fetch, max_age=60)
+    assert statuses["a"].availability == "Available"
+    assert statuses["b"].availability == "Unavailable"
+    assert cache.get("ws", fetch, max_age=60)["a"].average_queue_time_s == 1
+    assert fetch.calls == 1
+    assert cache.get("ws", fetch, max_age=0)["a"].average_queue_time_s == 2
+
+
+def test_background_refresher() -> None:
+    fetch = _Fetcher()
+    cache = TargetStatusCache()
+    cache.start_refresher("ws", fetch, interval_s=0.01)
+    cache.start_refresher("ws", fetch, interval_s=0.01)
+    deadline = time.monotonic() + 5
+    while fetch.calls < 3:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    cache.stop_refresher("ws")
+    time.sleep(0.05)
+    calls = fetch.calls
+    time.sleep(0.05)
+    assert fetch.calls == calls
+    assert cache.get("ws", fetch, max_age=60)["a"].average_queue_time_s == calls
+
+
+def test_statuses_of_a_given_workspace(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    class CountingWorkspace(LocalWorkspace):
+        n_listings = 0
+
+        def get_targets(self, name: str | None = None) -> Any:
+            if name is None:
+                self.n_listings += 1
+            return super().get_targets(name)
+
+    target = LocalTarget("ionq.simulator")
+    workspace = CountingWorkspace([target])
+    first = offline_backend(target, workspace=workspace)
+    second = offline_backend(target, workspace=workspace)
+    assert first.is_available()
+    assert second.is_available()
+    assert workspace.n_listings == 1
+
+    # The statuses are dropped with the workspace.
+    n_snapshots = len(_target_statuses._snapshots)  # noqa: SLF001
+    del first, second, workspace
+    gc.collect()
+    assert len(_target_statuses._snapshots) == n_snapshots - 1  # noqa: SLF001
@@ -0,0 +1,91 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+
+import pytest
+from pytket.backends import ResultHandle
+from pytket.circuit import Circuit
+from pytket.extensions.azure import (
+    AzureBackend,
+    LocalTarget,
+    StageRecorder,
+)
+
+DEVICE = "quantinuum.sim.h1-1sc"
+
+ALL_STAGES = {"compile", "qir", "upload", "queue", "execution", "download", "decode"}
+
+
+def _target() -> LocalTarget:
+    return LocalTarget(DEVICE, queue_time_s=0.02, run_time_s=0.03)
+
+
+@pytest.mark.parametrize("qir_processes", [None, 2])
+def test_every_stage_is_recorded(
+    offline_backend: Callable[..., AzureBackend], qir_processes: int | None
+) -> None:
+    recorder = StageRecorder()
+    b = offline_backend(_target(), tracer=recorder)
+    circuits = b.get_compiled_circuits(
+        [Circuit(2, 2).H(0).CX(0, 1).measure_all(), Circuit(1, 1).X(0).measure_all()]
+    )
+    handles = b.process_circuits(circuits, n_shots=10, qir_processes=qir_processes)
+    for h in handles:
+        b.get_result(h)
+        durations = recorder.durations(h)
+        assert set(durations) == ALL_STAGES
+        assert all(d >= 0 for d in durations.values())
+        assert durations["queue"] == pytest.approx(0.02, abs=1e-3)
+        assert durations["execution"] == pytest.approx(0.03, abs=1e-3)
+    # Compile spans are attached once.
+    assert not b._compile_spans  # noqa: SLF001
+
+
+def test_split_and_packed_handles(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    recorder = StageRecorder()
+    b = offline_backend(_target(), tracer=recorder)
+    c = b.get_compiled_circuit(Circuit(1, 1).H(0).measure_all())
+    (split,) = b.process_circuits([c], n_shots=30, max_shots_per_job=10)
+    b.get_result(split)
+    stages = [span.stage for span in recorder.spans(split)]
+    assert stages.count("upload") == 3
+    assert stages.count("compile") == 1
+    # The compile span belongs to the split handle, not to its chunks.
+    assert all(
+        span.stage != "compile"
+        for chunk in str(split[0]).split("+")
+        for span in recorder.spans(ResultHandle(chunk))
+    )
+
+    handles = b.process_circuits([c, c], n_shots=10, pack_qubits=2)
+    for h in handles:
+        b.get_result(h)
+        assert {"upload", "decode"} <= set(recorder.durations(h))
+
+
+def test_failing_tracer_does_not_lose_handles(
+    offline_backend: Callable[..., AzureBackend],
+) -> None:
+    def tracer(handle: object, span: object) -> None:
+        raise ValueError("broken")
+
+    b = offline_backend(tracer=tracer)
+    c = b.get_compiled_circuit(Circuit(1, 1).measure_all())
+    with pytest.warns(UserWarning, match="broken"):
+        (h,) = b.process_circuits([c], n_shots=5)
+    with pytest.warns(UserWarning, match="broken"):
+        assert sum(b.get_result(h).get_counts().values()) == 5
@@ -0,0 +1,65 @@
+# Copyright Quantinuum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from pytket.extensions.azure import (
+    AzureBackend,
+    clear_workspace_pool,
+    set_workspace_pool_ttl,
+)
+from pytket.extensions.azure.backends import azure
+
+
+class _Workspace:
+    def __init__(self, calls: list[str]):
+        self.calls = calls
+
+    def get_targets(self, name: str) -> str:
+        self.calls.append(name)
+        return f"target {name}"
+
+
+@pytest.fixture(name="calls")
+def fixture_calls(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    calls: list[str] = []
+
+    def create_workspace(*args: Any) -> _Workspace:
+        calls.append("workspace")
+        return _Workspace(calls)
+
+    monkeypatch.setattr(azure, "_create_workspace", create_workspace)
+    clear_workspace_pool()
+    yield calls
+    clear_workspace_pool()
+    set_workspace_pool_ttl(3600.0)
+
+
+def test_workspace_and_target_are_pooled(calls: list[str]) -> None:
+    AzureBackend("ionq.simulator", resource_id="r", location="l")
+    AzureBackend("ionq.simulator", resource_id="r", location="l")
+    AzureBackend("quantinuum.sim.h1-1sc", resource_id="r", location="l")
+    assert calls == ["workspace", "ionq.simulator", "quantinuum.sim.h1-1sc"]
+    AzureBackend("ionq.simulator", resource_id="other", location="l")
+    assert calls[3:] == ["workspace", "ionq.simulator"]
+
+
+def test_pool_entries_expire(calls: list[str]) -> None:
+    set_workspace_pool_ttl(0.0)
+    AzureBackend("ionq.simulator", resource_id="r", location="l")
+    AzureBackend("ionq.simulator", resource_id="r", location="l")
+    assert calls == ["workspace", "ionq.simulator"] * 2